@@ -42,6 +42,9 @@ class RenderConfig:
         rst_writer_options: Additional options for RST writer
         copy_assets: Whether to copy assets to output directory
         standalone: Whether to produce standalone documents
+        use_pandoc_server: Convert text exports through a shared long-lived
+            ``pandoc server`` process (pandoc >= 3.0) instead of one
+            subprocess per document
     """
 
     output_dir: Path = field(default_factory=Path.cwd)
@@ -76,6 +79,7 @@ class RenderConfig:
     # General options
     copy_assets: bool = True
     standalone: bool = True
+    use_pandoc_server: bool = False
 
     def __post_init__(self):
         # Convert string paths to Path objects if needed
@@ -127,6 +131,7 @@ class RenderConfig:
             rst_writer_options=overrides.get("rst_writer_options", self.rst_writer_options),
             copy_assets=overrides.get("copy_assets", self.copy_assets),
             standalone=overrides.get("standalone", self.standalone),
+            use_pandoc_server=overrides.get("use_pandoc_server", self.use_pandoc_server),
         )
 
     def with_output_dir(self, output_dir: Path | str) -> RenderConfig:
@@ -183,7 +188,7 @@ class RenderConfig:
         """
         from .pdf_themes import resolve_pdf_theme
 
-        bundle = resolve_pdf_theme(theme_id, project_themes_dir)
+        bundle = resolve_pdf_theme(theme_id, project_themes_dir, compute_hashes=False)
 
         return self._copy_with(
             pdf_theme=theme_id,
@@ -275,7 +280,7 @@ def default_pdf_config(theme_id: str | None = None) -> RenderConfig:
     """
     if theme_id:
         from .pdf_themes import resolve_pdf_theme
-        bundle = resolve_pdf_theme(theme_id)
+        bundle = resolve_pdf_theme(theme_id, compute_hashes=False)
         return RenderConfig(
             pdf_theme=theme_id,
             pdf_theme_dir=bundle.theme_dir,
@@ -307,7 +312,7 @@ def themed_pdf_config(
     """
     from .pdf_themes import resolve_pdf_theme
 
-    bundle = resolve_pdf_theme(theme_id, project_themes_dir)
+    bundle = resolve_pdf_theme(theme_id, project_themes_dir, compute_hashes=False)
 
     return RenderConfig(
         pdf_theme=theme_id,
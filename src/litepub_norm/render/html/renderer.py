@@ -223,9 +223,9 @@ def _render_html_single(
     report.set_pandoc_version(config.pandoc_path)
 
     # Set template and assets info
-    report.set_template(config.html_template_path)
-    report.set_assets(config.html_assets_dir)
-    report.set_lua_filters(config.html_lua_filters)
+    report.set_template(config.html_template_path, defer=True)
+    report.set_assets(config.html_assets_dir, defer=True)
+    report.set_lua_filters(config.html_lua_filters, defer=True)
 
     # Prepare output paths
     output_dir = config.output_dir
@@ -295,7 +295,7 @@ def _render_html_single(
 
     # Save report
     report_path = output_dir / "render_report.json"
-    report.save(report_path)
+    report.save(report_path, result.report)
     result.add_output_file(report_path)
 
     return result
@@ -336,9 +336,9 @@ def _render_html_site(
     report.set_pandoc_version(config.pandoc_path)
 
     # Set template and assets info
-    report.set_template(config.html_template_path)
-    report.set_assets(config.html_assets_dir)
-    report.set_lua_filters(config.html_lua_filters)
+    report.set_template(config.html_template_path, defer=True)
+    report.set_assets(config.html_assets_dir, defer=True)
+    report.set_lua_filters(config.html_lua_filters, defer=True)
 
     # Prepare output paths
     # For chunkedhtml, output_name is the directory name (without extension)
@@ -441,7 +441,7 @@ def _render_html_site(
 
     # Save report in the site directory
     report_path = site_output_dir / "render_report.json" if site_output_dir.exists() else output_dir / "render_report.json"
-    report.save(report_path)
+    report.save(report_path, result.report)
     result.add_output_file(report_path)
 
     return result
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import functools
 import subprocess
-import shutil
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -159,6 +159,13 @@ def cleanup_aux_files(latex_path: Path, output_dir: Path | None = None) -> None:
             aux_file.unlink()
 
 
+@functools.lru_cache(maxsize=None)
 def is_engine_available(engine: str = "xelatex") -> bool:
-    """Check if a LaTeX engine is available."""
+    """
+    Check if a LaTeX engine is available.
+
+    The PATH lookup is cached per engine name for the lifetime of the process.
+    """
+    import shutil
+
     return shutil.which(engine) is not None
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
 import hashlib
 import json
 import subprocess
 import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
-from .report import get_pandoc_version
+from .latex_runner import is_engine_available
+from .report import get_pandoc_version, clear_version_caches
 
 
 class PandocError(Exception):
@@ -54,6 +58,9 @@ def check_pandoc_version(
     """
     Check pandoc version and return it.
 
+    The version probe is cached by ``get_pandoc_version`` (successful
+    results only), so batch renders spawn ``pandoc --version`` only once.
+
     Raises:
         PandocVersionError: If pandoc not found or version mismatch.
     """
@@ -69,6 +76,13 @@ def check_pandoc_version(
     return version
 
 
+def clear_tool_caches() -> None:
+    """Clear cached tool lookups (versions, LaTeX engine, command prefixes)."""
+    clear_version_caches()
+    is_engine_available.cache_clear()
+    _command_prefix.cache_clear()
+
+
 def _stable_temp_path(content: bytes, suffix: str) -> Path:
     """
     Create a stable temp file path based on content hash.
@@ -81,6 +95,48 @@ def _stable_temp_path(content: bytes, suffix: str) -> Path:
     return temp_dir / f"ast_{content_hash}{suffix}"
 
 
+@functools.lru_cache(maxsize=64)
+def _command_prefix(
+    pandoc_path: Path | str | None,
+    to_format: str,
+    standalone: bool,
+) -> tuple[str, ...]:
+    """Build the static start of a pandoc invocation (no filesystem checks)."""
+    cmd = [str(pandoc_path) if pandoc_path else "pandoc"]
+    cmd.extend(["--from=json", f"--to={to_format}"])
+    if standalone:
+        cmd.append("--standalone")
+    return tuple(cmd)
+
+
+def _base_command(
+    pandoc_path: Path | str | None,
+    to_format: str,
+    standalone: bool,
+    template: Path | None,
+    lua_filters: tuple[Path, ...],
+    extra_args: tuple[str, ...],
+) -> tuple[str, ...]:
+    """
+    Build the invocation prefix shared by every call with the same settings.
+
+    The static prefix is cached; template and Lua filter existence is
+    checked on every call, so files created later (or relative paths after
+    a working-directory change) are picked up.
+    """
+    cmd = list(_command_prefix(pandoc_path, to_format, standalone))
+
+    if template and template.exists():
+        cmd.extend([f"--template={template}"])
+
+    for lua_filter in lua_filters:
+        if lua_filter.exists():
+            cmd.extend([f"--lua-filter={lua_filter}"])
+
+    cmd.extend(extra_args)
+    return tuple(cmd)
+
+
 def run(
     input_ast: dict[str, Any],
     to_format: Literal["html5", "chunkedhtml", "latex", "gfm", "rst", "markdown"],
@@ -124,20 +180,9 @@ def run(
     input_path.write_bytes(ast_bytes)
 
     # Build command
-    cmd = [str(pandoc_path) if pandoc_path else "pandoc"]
-    cmd.extend(["--from=json", f"--to={to_format}"])
-
-    if standalone:
-        cmd.append("--standalone")
-
-    if template and template.exists():
-        cmd.extend([f"--template={template}"])
-
-    for lua_filter in lua_filters:
-        if lua_filter.exists():
-            cmd.extend([f"--lua-filter={lua_filter}"])
-
-    cmd.extend(extra_args)
+    cmd = list(_base_command(
+        pandoc_path, to_format, standalone, template, tuple(lua_filters), tuple(extra_args)
+    ))
     cmd.extend(["-o", str(output_path)])
     cmd.append(str(input_path))
 
@@ -231,20 +276,9 @@ def run_to_string(
     input_path.write_bytes(ast_bytes)
 
     # Build command
-    cmd = [str(pandoc_path) if pandoc_path else "pandoc"]
-    cmd.extend(["--from=json", f"--to={to_format}"])
-
-    if standalone:
-        cmd.append("--standalone")
-
-    if template and template.exists():
-        cmd.extend([f"--template={template}"])
-
-    for lua_filter in lua_filters:
-        if lua_filter.exists():
-            cmd.extend([f"--lua-filter={lua_filter}"])
-
-    cmd.extend(extra_args)
+    cmd = list(_base_command(
+        pandoc_path, to_format, standalone, template, tuple(lua_filters), tuple(extra_args)
+    ))
     cmd.append(str(input_path))
 
     # Run pandoc
@@ -273,3 +307,229 @@ def run_to_string(
         )
 
     return result.stdout
+
+
+class PandocServer:
+    """
+    Long-lived ``pandoc server`` process that converts documents over HTTP.
+
+    Avoids pandoc's process start-up cost on every conversion, which
+    dominates when many small documents are rendered (e.g. in watch mode).
+    Requires pandoc >= 3.0 built with server support.
+
+    Usage::
+
+        with PandocServer() as server:
+            rst = server.convert(ast, "rst")
+    """
+
+    def __init__(
+        self,
+        pandoc_path: Path | str | None = None,
+        startup_timeout: float = 10.0,
+        conversion_timeout: int = 300,
+    ):
+        self.pandoc_path = pandoc_path
+        self.startup_timeout = startup_timeout
+        # pandoc server aborts conversions after 2 seconds unless told
+        # otherwise; match the 5 minute limit of the CLI path
+        self.conversion_timeout = conversion_timeout
+        self._process: subprocess.Popen | None = None
+        self._stderr = None
+        self._connection = None
+        self._port: int | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> PandocServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        """Whether the server process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """
+        Launch the server and wait until it accepts connections.
+
+        Raises:
+            PandocError: If pandoc is missing or the server fails to start.
+        """
+        if self.running:
+            return
+
+        import socket
+        import time
+
+        # Reserve a free loopback port for the server to bind
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        cmd = [
+            str(self.pandoc_path) if self.pandoc_path else "pandoc",
+            "server",
+            "--port", str(port),
+            "--timeout", str(self.conversion_timeout),
+        ]
+        # stderr goes to a temp file rather than a pipe nobody drains while
+        # the server runs; it is only read if start-up fails
+        stderr = tempfile.TemporaryFile()
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr)
+        except FileNotFoundError:
+            stderr.close()
+            raise PandocError("Pandoc executable not found")
+
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            if process.poll() is not None:
+                stderr.seek(0)
+                message = stderr.read().decode("utf-8", errors="replace")
+                stderr.close()
+                raise PandocError(
+                    "Pandoc server exited during start-up",
+                    returncode=process.returncode,
+                    stderr=message,
+                )
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    process.kill()
+                    process.wait()
+                    stderr.close()
+                    raise PandocError("Pandoc server did not start in time")
+                time.sleep(0.05)
+
+        self._process = process
+        self._stderr = stderr
+        self._port = port
+
+    def convert(
+        self,
+        input_ast: dict[str, Any],
+        to_format: str,
+        standalone: bool = False,
+    ) -> str:
+        """
+        Convert a Pandoc AST with the running server.
+
+        Args:
+            input_ast: Pandoc AST as dictionary
+            to_format: Output format
+            standalone: Whether to produce standalone document
+
+        Returns:
+            Converted document text
+
+        Raises:
+            PandocError: If the server is not running or conversion fails.
+        """
+        import base64
+        import http.client
+
+        if not self.running:
+            raise PandocError("Pandoc server is not running")
+
+        body = json.dumps({
+            "text": json.dumps(input_ast, ensure_ascii=False),
+            "from": "json",
+            "to": to_format,
+            "standalone": standalone,
+        }, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+
+        with self._lock:
+            try:
+                if self._connection is None:
+                    self._connection = http.client.HTTPConnection("127.0.0.1", self._port, timeout=300)
+                self._connection.request("POST", "/", body=body, headers=headers)
+                response = self._connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                self._close_connection()
+                raise PandocError(f"Pandoc server request failed: {e}")
+
+        text = data.decode("utf-8", errors="replace")
+        if response.status != 200:
+            raise PandocError(
+                f"Pandoc server returned HTTP {response.status}",
+                returncode=response.status,
+                stderr=text,
+            )
+        try:
+            result = json.loads(text)
+        except json.JSONDecodeError:
+            # Conversion errors are reported as plain text
+            raise PandocError("Pandoc server conversion failed", stderr=text)
+        if not isinstance(result, dict) or "output" not in result:
+            raise PandocError("Pandoc server conversion failed", stderr=text)
+
+        output = result["output"]
+        if result.get("base64"):
+            output = base64.b64decode(output).decode("utf-8")
+        return output
+
+    def close(self) -> None:
+        """Close the connection and stop the server process."""
+        self._close_connection()
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        stderr, self._stderr = self._stderr, None
+        if stderr is not None:
+            stderr.close()
+
+    def _close_connection(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+# Shared servers keyed by pandoc executable; stopped at interpreter exit
+_SERVERS: dict[str, PandocServer] = {}
+_SERVERS_LOCK = threading.Lock()
+_SHUTDOWN_REGISTERED = False
+
+
+def get_pandoc_server(pandoc_path: Path | str | None = None) -> PandocServer:
+    """
+    Return a running shared PandocServer for the given executable.
+
+    The server is started on first use and reused by later calls.
+
+    Raises:
+        PandocError: If the server cannot be started.
+    """
+    global _SHUTDOWN_REGISTERED
+
+    key = str(pandoc_path) if pandoc_path else "pandoc"
+    with _SERVERS_LOCK:
+        if not _SHUTDOWN_REGISTERED:
+            atexit.register(shutdown_pandoc_servers)
+            _SHUTDOWN_REGISTERED = True
+        server = _SERVERS.get(key)
+        if server is None or not server.running:
+            server = PandocServer(pandoc_path)
+            server.start()
+            _SERVERS[key] = server
+        return server
+
+
+def shutdown_pandoc_servers() -> None:
+    """Stop all shared pandoc servers."""
+    with _SERVERS_LOCK:
+        for server in _SERVERS.values():
+            server.close()
+        _SERVERS.clear()
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import shutil
+import mmap
 from pathlib import Path
 from typing import Any
 
 from ..config import RenderConfig, default_pdf_config
 from ..result import RenderResult
 from ..report import RenderReport
-from ..pandoc_runner import run_to_string, PandocError
+from ..pandoc_runner import run as pandoc_run, PandocError
 from ..latex_runner import build as latex_build, LatexError, is_engine_available
 from ...filters.context import BuildContext
 
@@ -61,9 +61,8 @@ def render_pdf(
             report.extra_info["pdf_theme_dir"] = str(config.pdf_theme_dir)
 
     # Check pandoc and latex versions
-    report.set_pandoc_version(config.pandoc_path)
-    report.set_latex_version(config.latex_engine, config.latex_engine_path)
-    report.set_template(config.latex_template_path)
+    report.set_versions(config.pandoc_path, config.latex_engine, config.latex_engine_path)
+    report.set_template(config.latex_template_path, defer=True)
 
     # Prepare output paths
     output_dir = config.output_dir
@@ -118,9 +117,13 @@ def render_pdf(
 
     try:
         # Step 1: Generate LaTeX from AST
-        latex_content = run_to_string(
+        # Pandoc writes the .tex straight to the output directory, so the
+        # LaTeX source never round-trips through a Python string.
+        tex_path = output_dir / f"{output_path.stem}.tex"
+        pandoc_run(
             input_ast=ast,
             to_format="latex",
+            output_path=tex_path,
             pandoc_path=config.pandoc_path,
             template=config.latex_template_path,
             lua_filters=lua_filters,
@@ -128,9 +131,7 @@ def render_pdf(
             standalone=config.standalone,
         )
 
-        # Step 2: Write LaTeX to output directory
-        tex_path = output_dir / f"{output_path.stem}.tex"
-        tex_path.write_text(latex_content, encoding="utf-8")
+        # Step 2: Record the LaTeX intermediate
         result.add_output_file(tex_path)
         report.add_output(tex_path)
 
@@ -185,12 +186,7 @@ def render_pdf(
         # Try to include log content in error
         if e.log_file and e.log_file.exists():
             try:
-                log_content = e.log_file.read_text(encoding="utf-8", errors="replace")
-                # Find error lines
-                error_lines = [
-                    line for line in log_content.split("\n")
-                    if "!" in line or "Error" in line
-                ][:10]
+                error_lines = _extract_log_error_lines(e.log_file)
                 if error_lines:
                     result.errors[-1].details = result.errors[-1].details or {}
                     result.errors[-1].details["error_lines"] = error_lines
@@ -214,12 +210,56 @@ def render_pdf(
 
     # Save report
     report_path = output_dir / "render_report.json"
-    report.save(report_path)
+    report.save(report_path, result.report)
     result.add_output_file(report_path)
 
     return result
 
 
+def _extract_log_error_lines(log_file: Path, limit: int = 10) -> list[str]:
+    """
+    Extract the first ``limit`` lines of a LaTeX log that look like errors.
+
+    A line matches if it contains ``!`` or ``Error``. The log is memory-mapped
+    and scanned with ``bytes.find`` so large logs are never split into
+    per-line Python strings.
+
+    Args:
+        log_file: Path to the LaTeX .log file
+        limit: Maximum number of lines to return
+
+    Returns:
+        Matching lines in file order
+    """
+    with open(log_file, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file cannot be mapped
+            return []
+
+    with buf:
+        lines: list[str] = []
+        needles = (b"!", b"Error")
+        # Next known hit per needle; recomputed only once the scan passes it
+        hits = [buf.find(needle) for needle in needles]
+        while len(lines) < limit:
+            found = [h for h in hits if h >= 0]
+            if not found:
+                break
+            i = min(found)
+            line_start = buf.rfind(b"\n", 0, i) + 1
+            line_end = buf.find(b"\n", i)
+            if line_end < 0:
+                line_end = len(buf)
+            lines.append(buf[line_start:line_end].decode("utf-8", errors="replace"))
+            pos = line_end + 1
+            for k, needle in enumerate(needles):
+                if 0 <= hits[k] < pos:
+                    hits[k] = buf.find(needle, pos)
+        return lines
+
+
 def _stage_assets(assets_dir: Path, output_dir: Path) -> Path | None:
     """
     Stage theme assets to output directory for LaTeX compilation.
@@ -227,6 +267,10 @@ def _stage_assets(assets_dir: Path, output_dir: Path) -> Path | None:
     Copies theme.sty and fonts/ to output directory so LaTeX can find them.
     This ensures deterministic builds with bundled fonts.
 
+    Only file contents are copied (``shutil.copyfile``), which uses the
+    kernel's zero-copy path on Linux; permission bits and timestamps are
+    irrelevant to LaTeX.
+
     Args:
         assets_dir: Source assets directory from theme pack
         output_dir: Build output directory
@@ -234,13 +278,15 @@ def _stage_assets(assets_dir: Path, output_dir: Path) -> Path | None:
     Returns:
         Path to staged assets directory, or None if nothing staged
     """
+    import shutil
+
     staged_dir = output_dir / "assets"
 
     # Copy theme.sty if present
     style_src = assets_dir / "theme.sty"
     if style_src.exists():
         staged_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(style_src, staged_dir / "theme.sty")
+        shutil.copyfile(style_src, staged_dir / "theme.sty")
 
     # Copy fonts directory if present
     fonts_src = assets_dir / "fonts"
@@ -248,7 +294,7 @@ def _stage_assets(assets_dir: Path, output_dir: Path) -> Path | None:
         fonts_dst = staged_dir / "fonts"
         if fonts_dst.exists():
             shutil.rmtree(fonts_dst)
-        shutil.copytree(fonts_src, fonts_dst)
+        shutil.copytree(fonts_src, fonts_dst, copy_function=shutil.copyfile)
 
     # Copy images directory if present (for logos, watermarks)
     images_src = assets_dir / "images"
@@ -256,6 +302,6 @@ def _stage_assets(assets_dir: Path, output_dir: Path) -> Path | None:
         images_dst = staged_dir / "images"
         if images_dst.exists():
             shutil.rmtree(images_dst)
-        shutil.copytree(images_src, images_dst)
+        shutil.copytree(images_src, images_dst, copy_function=shutil.copyfile)
 
     return staged_dir if staged_dir.exists() else None
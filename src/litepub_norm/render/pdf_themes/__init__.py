@@ -5,11 +5,12 @@ Provides theme packs for PDF rendering via XeLaTeX.
 Each theme pack contains: template.tex, theme.yaml, and assets/ (theme.sty, fonts).
 """
 
-from .manifest import PdfThemeManifest, load_pdf_manifest
+from .manifest import PdfThemeManifest, load_pdf_manifest, clear_manifest_cache
 from .resolver import (
     PdfThemeBundle,
     resolve_pdf_theme,
     list_pdf_themes,
+    clear_bundle_cache,
     PdfThemeNotFoundError,
     PdfThemeValidationError,
 )
@@ -17,9 +18,11 @@ from .resolver import (
 __all__ = [
     "PdfThemeManifest",
     "load_pdf_manifest",
+    "clear_manifest_cache",
     "PdfThemeBundle",
     "resolve_pdf_theme",
     "list_pdf_themes",
+    "clear_bundle_cache",
     "PdfThemeNotFoundError",
     "PdfThemeValidationError",
 ]
@@ -11,7 +11,22 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import functools
 import json
+import os
+import re
+import sys
+
+
+def _interned(data: dict[str, Any], key: str, default: Any) -> Any:
+    """
+    Look up a manifest value, interning strings.
+
+    Font names, paper sizes and margins repeat across theme manifests;
+    interning lets every manifest share one copy of each value.
+    """
+    value = data.get(key, default)
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 @dataclass(frozen=True)
@@ -43,6 +58,25 @@ class PdfGeometryConfig:
     bottom: str = "3cm"
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_config(config_cls: type, items: tuple[tuple[str, Any], ...]) -> Any:
+    """Construct a frozen config once per distinct field values."""
+    return config_cls(**dict(items))
+
+
+def _shared_config(config_cls: type, **fields: Any) -> Any:
+    """
+    Return a shared (flyweight) frozen config instance for the given fields.
+
+    Themes mostly use default fonts/geometry, so identical configs resolve
+    to one instance. Unhashable values (e.g. lists from JSON) bypass the cache.
+    """
+    try:
+        return _cached_config(config_cls, tuple(fields.items()))
+    except TypeError:
+        return config_cls(**fields)
+
+
 @dataclass(frozen=True)
 class PdfThemeManifest:
     """
@@ -75,31 +109,33 @@ class PdfThemeManifest:
     def from_dict(cls, data: dict[str, Any], theme_id: str | None = None) -> "PdfThemeManifest":
         """Create manifest from dictionary."""
         font_data = data.get("fonts", {})
-        fonts = PdfFontConfig(
-            mainfont=font_data.get("mainfont", "DejaVu Serif"),
-            mainfont_options=font_data.get("mainfont_options", ""),
-            sansfont=font_data.get("sansfont", "DejaVu Sans"),
-            sansfont_options=font_data.get("sansfont_options", ""),
-            monofont=font_data.get("monofont", "DejaVu Sans Mono"),
-            monofont_options=font_data.get("monofont_options", "Scale=0.9"),
-            cjkmainfont=font_data.get("cjkmainfont", "Noto Sans CJK KR"),
-            cjkmainfont_options=font_data.get("cjkmainfont_options", ""),
+        fonts = _shared_config(
+            PdfFontConfig,
+            mainfont=_interned(font_data, "mainfont", "DejaVu Serif"),
+            mainfont_options=_interned(font_data, "mainfont_options", ""),
+            sansfont=_interned(font_data, "sansfont", "DejaVu Sans"),
+            sansfont_options=_interned(font_data, "sansfont_options", ""),
+            monofont=_interned(font_data, "monofont", "DejaVu Sans Mono"),
+            monofont_options=_interned(font_data, "monofont_options", "Scale=0.9"),
+            cjkmainfont=_interned(font_data, "cjkmainfont", "Noto Sans CJK KR"),
+            cjkmainfont_options=_interned(font_data, "cjkmainfont_options", ""),
         )
 
         geo_data = data.get("geometry", {})
-        geometry = PdfGeometryConfig(
-            paper=geo_data.get("paper", "a4paper"),
-            margin=geo_data.get("margin", "2.5cm"),
-            top=geo_data.get("top", "3cm"),
-            bottom=geo_data.get("bottom", "3cm"),
+        geometry = _shared_config(
+            PdfGeometryConfig,
+            paper=_interned(geo_data, "paper", "a4paper"),
+            margin=_interned(geo_data, "margin", "2.5cm"),
+            top=_interned(geo_data, "top", "3cm"),
+            bottom=_interned(geo_data, "bottom", "3cm"),
         )
 
         return cls(
             id=data.get("id", theme_id or "unknown"),
             name=data.get("name", data.get("id", theme_id or "Unknown Theme")),
-            version=data.get("version", "1.0.0"),
+            version=_interned(data, "version", "1.0.0"),
             description=data.get("description", ""),
-            archetype=data.get("archetype", "std-report"),
+            archetype=_interned(data, "archetype", "std-report"),
             fonts=fonts,
             geometry=geometry,
             secnumdepth=data.get("secnumdepth", 3),
@@ -140,8 +176,15 @@ class PdfThemeManifest:
         """
         Convert to Pandoc metadata format.
 
-        This can be passed to Pandoc via --metadata-file.
+        This can be passed to Pandoc via --metadata-file. The mapping is built
+        once per manifest; each call returns a copy safe to modify.
         """
+        metadata = self._pandoc_metadata
+        return {**metadata, "geometry": list(metadata["geometry"])}
+
+    @functools.cached_property
+    def _pandoc_metadata(self) -> dict[str, Any]:
+        """Pandoc metadata built from the (immutable) manifest fields."""
         metadata = {
             "documentclass": "article",
             "papersize": self.geometry.paper.replace("paper", ""),
@@ -168,11 +211,23 @@ class PdfThemeManifest:
         return metadata
 
 
+# Parsed manifests keyed by path -> ((mtime_ns, size), manifest); a changed
+# file replaces its entry
+_MANIFEST_CACHE: dict[str, tuple[tuple[int, int], PdfThemeManifest]] = {}
+
+
+def clear_manifest_cache() -> None:
+    """Clear the parsed PDF manifest cache."""
+    _MANIFEST_CACHE.clear()
+
+
 def load_pdf_manifest(theme_dir: Path) -> PdfThemeManifest | None:
     """
     Load PDF theme manifest from directory.
 
-    Looks for theme.yaml first, then theme.json.
+    Looks for theme.yaml first, then theme.json. A theme.yaml written in
+    JSON (flow) syntax is parsed with ``json``. Parsed manifests are cached
+    by path, modification time and size, so unchanged files are not re-parsed.
 
     Args:
         theme_dir: Theme directory path
@@ -180,28 +235,50 @@ def load_pdf_manifest(theme_dir: Path) -> PdfThemeManifest | None:
     Returns:
         PdfThemeManifest if manifest exists, None otherwise
     """
-    # Try YAML first (preferred for PDF themes per spec)
-    yaml_path = theme_dir / "theme.yaml"
-    if yaml_path.exists():
+    # Try YAML first (preferred for PDF themes per spec), then fall back to JSON
+    for name in ("theme.yaml", "theme.json"):
+        manifest_path = theme_dir / name
         try:
-            # Use simple YAML parsing (avoid dependency)
-            data = _parse_simple_yaml(yaml_path.read_text(encoding="utf-8"))
-            return PdfThemeManifest.from_dict(data, theme_id=theme_dir.name)
-        except Exception as e:
-            raise ValueError(f"Invalid theme.yaml in {theme_dir}: {e}") from e
+            st = os.stat(manifest_path)
+        except OSError:
+            continue
+
+        key = str(manifest_path)
+        token = (st.st_mtime_ns, st.st_size)
+        cached = _MANIFEST_CACHE.get(key)
+        if cached is not None and cached[0] == token:
+            return cached[1]
 
-    # Fall back to JSON
-    json_path = theme_dir / "theme.json"
-    if json_path.exists():
         try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
-            return PdfThemeManifest.from_dict(data, theme_id=theme_dir.name)
+            content = manifest_path.read_text(encoding="utf-8")
+            if name == "theme.json" or content.lstrip().startswith("{"):
+                # JSON is valid YAML; flow-style manifests use the C parser
+                data = json.loads(content)
+            else:
+                # Use simple YAML parsing (avoid dependency)
+                data = _parse_simple_yaml(content)
+            manifest = PdfThemeManifest.from_dict(data, theme_id=theme_dir.name)
         except Exception as e:
-            raise ValueError(f"Invalid theme.json in {theme_dir}: {e}") from e
+            raise ValueError(f"Invalid {name} in {theme_dir}: {e}") from e
+
+        _MANIFEST_CACHE[key] = (token, manifest)
+        return manifest
 
     return None
 
 
+# One match per "key: value" line: (indent, key, value). Lines without a
+# colon never match; the newline is excluded from the indent class.
+_YAML_LINE_RE = re.compile(r"^(?P<indent>[^\S\n]*)(?P<key>[^:\n]*):(?P<value>.*)$", re.MULTILINE)
+
+# Literal YAML scalars, keyed by lowercased text
+_YAML_LITERALS: dict[str, Any] = {"true": True, "false": False}
+
+# int()/float() can only succeed on text whose first non-space character is
+# one of these (or a Unicode digit)
+_NUMERIC_START = frozenset("0123456789+-.nNiI")
+
+
 def _parse_simple_yaml(content: str) -> dict[str, Any]:
     """
     Parse simple YAML without external dependencies.
@@ -213,20 +290,13 @@ def _parse_simple_yaml(content: str) -> dict[str, Any]:
     current_section: str | None = None
     current_dict: dict[str, Any] = result
 
-    for line in content.split("\n"):
-        # Skip comments and empty lines
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Check indentation
-        indent = len(line) - len(line.lstrip())
-
-        if ":" not in stripped:
-            continue
+    for match in _YAML_LINE_RE.finditer(content):
+        indent, key, value = match.group("indent", "key", "value")
 
-        key, _, value = stripped.partition(":")
+        # Skip comments
         key = key.strip()
+        if key.startswith("#"):
+            continue
         value = value.strip()
 
         # Remove quotes from value
@@ -235,7 +305,7 @@ def _parse_simple_yaml(content: str) -> dict[str, Any]:
         elif value.startswith("'") and value.endswith("'"):
             value = value[1:-1]
 
-        if indent == 0:
+        if not indent:
             # Top-level key
             if not value:
                 # This is a section header
@@ -259,10 +329,12 @@ def _parse_yaml_value(value: str) -> Any:
     """Parse a simple YAML value."""
     if not value:
         return ""
-    if value.lower() == "true":
-        return True
-    if value.lower() == "false":
-        return False
+    literal = _YAML_LITERALS.get(value.lower())
+    if literal is not None:
+        return literal
+    head = value.lstrip()[:1]
+    if not head or (head not in _NUMERIC_START and not head.isdigit()):
+        return value
     try:
         return int(value)
     except ValueError:
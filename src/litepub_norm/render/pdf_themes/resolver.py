@@ -8,9 +8,11 @@ Returns PdfThemeBundle objects with resolved paths and hashes.
 from __future__ import annotations
 
 import hashlib
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..report import file_digests, list_files_sorted
 from .manifest import PdfThemeManifest, load_pdf_manifest, create_default_pdf_manifest
 
 
@@ -47,30 +49,78 @@ class PdfThemeBundle:
     assets_hash: str
 
 
+# Resolved bundles keyed by (theme_id, theme_dir, validate, compute_hashes)
+# -> (token, bundle)
+_BUNDLE_CACHE: dict[tuple[str, Path, bool, bool], tuple[tuple, PdfThemeBundle]] = {}
+
+
+def clear_bundle_cache() -> None:
+    """Clear the resolved PDF theme bundle and built-in listing caches."""
+    global _BUILTIN_LIST_CACHE
+    _BUNDLE_CACHE.clear()
+    _BUILTIN_LIST_CACHE = None
+
+
+def _theme_dir_token(theme_dir: Path) -> tuple:
+    """
+    Compute a cheap change token for a theme directory.
+
+    Stats every regular file (no file reads), so any added, removed or
+    modified file yields a different token. Like ``_compute_dir_hash``,
+    only files are considered: dangling symlinks and entries that vanish
+    mid-walk are skipped.
+    """
+    token = []
+    pending = [os.fspath(theme_dir)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        token.append((entry.path, st.st_mtime_ns, st.st_size))
+                except OSError:
+                    continue
+    token.sort()
+    return tuple(token)
+
+
 def _compute_file_hash(path: Path) -> str:
     """Compute SHA256 hash of a file."""
-    if not path.exists():
+    try:
+        with open(path, "rb") as f:
+            h = hashlib.file_digest(f, "sha256")
+    except FileNotFoundError:
         return ""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
     return f"sha256:{h.hexdigest()[:16]}"
 
 
-def _compute_dir_hash(directory: Path) -> str:
-    """Compute hash of all files in a directory (sorted, deterministic)."""
+def _compute_dir_hash(directory: Path) -> tuple[str, dict[str, bytes]]:
+    """
+    Compute hash of all files in a directory (sorted, deterministic).
+
+    Returns:
+        Tuple of (combined hash, raw per-file digests keyed by relative path),
+        so callers can reuse digests of files inside the directory.
+    """
     if not directory.exists():
-        return ""
+        return "", {}
 
     h = hashlib.sha256()
-    files = sorted(directory.rglob("*"))
-    for f in files:
-        if f.is_file():
-            rel_path = f.relative_to(directory)
-            h.update(str(rel_path).encode())
-            h.update(_compute_file_hash(f).encode())
-    return f"sha256:{h.hexdigest()[:16]}"
+    digests: dict[str, bytes] = {}
+    files = list_files_sorted(directory)
+    # Digests are computed in parallel but chained in sorted order
+    for (_full, rel_path), digest in zip(files, file_digests([full for full, _rel in files])):
+        h.update(rel_path.encode())
+        h.update(digest)
+        digests[rel_path] = digest
+    return f"sha256:{h.hexdigest()[:16]}", digests
 
 
 def _find_pdf_theme_dir(
@@ -97,12 +147,12 @@ def _find_pdf_theme_dir(
     # Check project-local themes first
     if project_themes_dir:
         local_path = project_themes_dir / theme_id
-        if local_path.is_dir():
+        if os.path.isdir(local_path):
             return local_path
 
     # Check built-in themes
     builtin_path = BUILTIN_PDF_THEMES_DIR / theme_id
-    if builtin_path.is_dir():
+    if os.path.isdir(builtin_path):
         return builtin_path
 
     # Theme not found
@@ -150,14 +200,20 @@ def resolve_pdf_theme(
     theme_id: str,
     project_themes_dir: Path | None = None,
     validate: bool = True,
+    compute_hashes: bool = True,
 ) -> PdfThemeBundle:
     """
     Resolve a PDF theme by ID and return a PdfThemeBundle.
 
+    Bundles are cached per theme directory and reused until any file in the
+    theme pack changes (detected via stat, without re-hashing).
+
     Args:
         theme_id: Theme identifier (e.g., "std-report", "corp-report")
         project_themes_dir: Optional project-local PDF themes directory
         validate: Whether to validate the theme pack
+        compute_hashes: Whether to hash template/style/assets; when False the
+            hash fields are empty (for callers that only need paths)
 
     Returns:
         PdfThemeBundle with resolved paths and hashes
@@ -169,6 +225,13 @@ def resolve_pdf_theme(
     # Find theme directory
     theme_dir = _find_pdf_theme_dir(theme_id, project_themes_dir)
 
+    # Reuse the previous bundle if nothing in the theme pack changed
+    cache_key = (theme_id, theme_dir, validate, compute_hashes)
+    token = _theme_dir_token(theme_dir)
+    cached = _BUNDLE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
     # Load or create manifest
     manifest = load_pdf_manifest(theme_dir)
     if manifest is None:
@@ -185,11 +248,15 @@ def resolve_pdf_theme(
     fonts_dir = assets_dir / "fonts" if (assets_dir / "fonts").is_dir() else None
 
     # Compute hashes for reproducibility
-    template_hash = _compute_file_hash(template_path)
-    style_hash = _compute_file_hash(style_path) if style_path else ""
-    assets_hash = _compute_dir_hash(assets_dir)
-
-    return PdfThemeBundle(
+    # theme.sty lives under assets/, so reuse its digest from the directory walk
+    template_hash = style_hash = assets_hash = ""
+    if compute_hashes:
+        template_hash = _compute_file_hash(template_path)
+        assets_hash, asset_digests = _compute_dir_hash(assets_dir)
+        style_digest = asset_digests.get("theme.sty") if style_path else None
+        style_hash = f"sha256:{style_digest.hex()[:16]}" if style_digest else ""
+
+    bundle = PdfThemeBundle(
         theme_id=theme_id,
         theme_dir=theme_dir,
         template_path=template_path,
@@ -201,6 +268,8 @@ def resolve_pdf_theme(
         style_hash=style_hash,
         assets_hash=assets_hash,
     )
+    _BUNDLE_CACHE[cache_key] = (token, bundle)
+    return bundle
 
 
 def list_pdf_themes(
@@ -215,18 +284,51 @@ def list_pdf_themes(
     Returns:
         List of theme IDs (directory names)
     """
-    themes = set()
-
     # Built-in themes
-    if BUILTIN_PDF_THEMES_DIR.is_dir():
-        for d in BUILTIN_PDF_THEMES_DIR.iterdir():
-            if d.is_dir() and (d / "template.tex").exists():
-                themes.add(d.name)
+    themes = set(_builtin_theme_ids())
 
     # Project-local themes
-    if project_themes_dir and project_themes_dir.is_dir():
-        for d in project_themes_dir.iterdir():
-            if d.is_dir() and (d / "template.tex").exists():
-                themes.add(d.name)
+    if project_themes_dir:
+        themes |= _scan_theme_ids(project_themes_dir)
 
     return sorted(themes)
+
+
+# Built-in theme IDs as (directory mtime_ns, ids); package data rarely changes
+_BUILTIN_LIST_CACHE: tuple[int, frozenset[str]] | None = None
+
+
+def _builtin_theme_ids() -> frozenset[str]:
+    """
+    Return built-in theme IDs, rescanning only when the directory mtime changes.
+    """
+    global _BUILTIN_LIST_CACHE
+    try:
+        mtime_ns = os.stat(BUILTIN_PDF_THEMES_DIR).st_mtime_ns
+    except OSError:
+        return frozenset()
+
+    if _BUILTIN_LIST_CACHE is not None and _BUILTIN_LIST_CACHE[0] == mtime_ns:
+        return _BUILTIN_LIST_CACHE[1]
+
+    ids = frozenset(_scan_theme_ids(BUILTIN_PDF_THEMES_DIR))
+    _BUILTIN_LIST_CACHE = (mtime_ns, ids)
+    return ids
+
+
+def _scan_theme_ids(themes_dir: Path) -> set[str]:
+    """
+    Return names of subdirectories of themes_dir that contain template.tex.
+
+    Uses os.scandir so the directory check comes from the directory read
+    rather than a separate stat per entry.
+    """
+    themes = set()
+    try:
+        with os.scandir(themes_dir) as it:
+            for entry in it:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "template.tex")):
+                    themes.add(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return themes
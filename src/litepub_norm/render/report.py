@@ -4,43 +4,184 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, ClassVar
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _dumps(data: dict[str, Any], indent: int) -> str:
+    """Serialize report data, using orjson when available for indent=2."""
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # Non-string keys or types orjson rejects: use stdlib behaviour
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
+def _encode(data: dict[str, Any]) -> bytes | None:
+    """Encode report data as indented JSON bytes with orjson, if possible."""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    except TypeError:
+        # Non-string keys or types orjson rejects: use stdlib behaviour
+        return None
+
+
+def _dump_to_file(data: dict[str, Any], path: Path) -> None:
+    """
+    Atomically write report data as indented JSON plus a trailing newline.
+
+    The report is written to a temporary file in the same directory and
+    moved into place with ``os.replace``, so concurrent readers never see a
+    partially written report. Encoded bytes (orjson) are written directly;
+    otherwise ``json.dump`` streams into the file handle.
+    """
+    payload = _encode(data)
+    # Unique per process and thread; created with the default file mode
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if payload is not None:
+            with open(tmp_path, "wb") as fp:
+                fp.write(payload)
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump(data, fp, indent=2, ensure_ascii=False)
+                fp.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def file_hash(path: Path) -> str:
     """Compute SHA256 hash of a file."""
-    if not path.exists():
+    try:
+        with open(path, "rb") as f:
+            h = hashlib.file_digest(f, "sha256")
+    except FileNotFoundError:
         return ""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
     return f"sha256:{h.hexdigest()}"
 
 
+# Below this many files, thread pool startup costs more than it saves
+_PARALLEL_HASH_MIN_FILES = 8
+_PARALLEL_HASH_MAX_WORKERS = 8
+
+
+def _file_digest(path: Path | str) -> bytes:
+    """Compute the raw SHA256 digest of a file."""
+    with open(path, "rb") as fp:
+        return hashlib.file_digest(fp, "sha256").digest()
+
+
+def file_digests(paths: list[Path] | list[str]) -> list[bytes]:
+    """
+    Compute raw SHA256 digests for several files, preserving input order.
+
+    hashlib releases the GIL while hashing, so larger file sets are hashed
+    on a small thread pool to overlap I/O and use multiple cores.
+    """
+    if len(paths) < _PARALLEL_HASH_MIN_FILES:
+        return [_file_digest(p) for p in paths]
+    workers = min(_PARALLEL_HASH_MAX_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_file_digest, paths))
+
+
+def list_files_sorted(directory: Path | str) -> list[tuple[str, str]]:
+    """
+    List all files under a directory as (full_path, relative_path) strings.
+
+    Walks with os.walk and plain strings rather than pathlib objects. Entries
+    are ordered by path components, matching ``sorted(directory.rglob("*"))``.
+    """
+    root = os.fspath(directory)
+    files: list[tuple[str, str]] = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            if os.path.isfile(full):
+                files.append((full, os.path.relpath(full, root)))
+    files.sort(key=lambda f: f[1].split(os.sep))
+    return files
+
+
 def directory_manifest_hash(directory: Path) -> str:
     """Compute a hash of all files in a directory (sorted, deterministic)."""
     if not directory.exists():
         return ""
 
     h = hashlib.sha256()
-    files = sorted(directory.rglob("*"))
-    for f in files:
-        if f.is_file():
-            # Include relative path and file hash
-            rel_path = f.relative_to(directory)
-            h.update(str(rel_path).encode())
-            h.update(file_hash(f).encode())
+    files = list_files_sorted(directory)
+    digests = file_digests([full for full, _rel in files])
+    for (_full, rel_path), digest in zip(files, digests):
+        # Include relative path and raw file digest
+        h.update(rel_path.encode())
+        h.update(digest)
     return f"sha256:{h.hexdigest()}"
 
 
+def _lua_filter_hashes(filters: tuple[Path, ...]) -> dict[str, str]:
+    """Hash each existing Lua filter, keyed by its path string."""
+    return {str(f): file_hash(f) for f in filters if f.exists()}
+
+
+# Shared pool for RenderReport hashes deferred off the render critical path
+_HASH_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _hash_executor() -> ThreadPoolExecutor:
+    """Return the shared background hashing executor, creating it on first use."""
+    global _HASH_EXECUTOR
+    if _HASH_EXECUTOR is None:
+        _HASH_EXECUTOR = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="render-report-hash"
+        )
+    return _HASH_EXECUTOR
+
+
+# Successful version probes keyed by executable; failed probes are not
+# cached, so a tool installed (or a probe that timed out) is retried
+_PANDOC_VERSION_CACHE: dict[str, str] = {}
+_LATEX_VERSION_CACHE: dict[str, str] = {}
+
+
 def get_pandoc_version(pandoc_path: Path | str | None = None) -> str | None:
-    """Get pandoc version string."""
-    cmd = [str(pandoc_path) if pandoc_path else "pandoc", "--version"]
+    """
+    Get pandoc version string.
+
+    Successful results are cached per executable for the lifetime of the
+    process; a failed probe returns None and is retried on the next call.
+    """
+    executable = str(pandoc_path) if pandoc_path else "pandoc"
+    version = _PANDOC_VERSION_CACHE.get(executable)
+    if version is None:
+        version = _probe_pandoc_version(executable)
+        if version is not None:
+            _PANDOC_VERSION_CACHE[executable] = version
+    return version
+
+
+def _probe_pandoc_version(executable: str) -> str | None:
+    """Run ``<executable> --version`` and parse the pandoc version."""
+    cmd = [executable, "--version"]
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
@@ -53,8 +194,24 @@ def get_pandoc_version(pandoc_path: Path | str | None = None) -> str | None:
 
 
 def get_latex_version(engine: str, engine_path: Path | str | None = None) -> str | None:
-    """Get LaTeX engine version string."""
-    cmd = [str(engine_path) if engine_path else engine, "--version"]
+    """
+    Get LaTeX engine version string.
+
+    Successful results are cached per executable for the lifetime of the
+    process; a failed probe returns None and is retried on the next call.
+    """
+    executable = str(engine_path) if engine_path else engine
+    version = _LATEX_VERSION_CACHE.get(executable)
+    if version is None:
+        version = _probe_latex_version(executable)
+        if version is not None:
+            _LATEX_VERSION_CACHE[executable] = version
+    return version
+
+
+def _probe_latex_version(executable: str) -> str | None:
+    """Run ``<executable> --version`` and return its first line."""
+    cmd = [executable, "--version"]
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
@@ -66,6 +223,39 @@ def get_latex_version(engine: str, engine_path: Path | str | None = None) -> str
     return None
 
 
+def get_tool_versions(
+    pandoc_path: Path | str | None,
+    engine: str,
+    engine_path: Path | str | None = None,
+) -> tuple[str | None, str | None]:
+    """
+    Get pandoc and LaTeX engine versions.
+
+    Cached results are returned directly. When neither version is cached
+    yet, the two independent ``--version`` subprocesses are probed
+    concurrently so their startup overlaps instead of running back to back.
+
+    Returns:
+        Tuple of (pandoc_version, latex_engine_version)
+    """
+    pandoc_cached = (str(pandoc_path) if pandoc_path else "pandoc") in _PANDOC_VERSION_CACHE
+    latex_cached = (str(engine_path) if engine_path else engine) in _LATEX_VERSION_CACHE
+    if pandoc_cached or latex_cached:
+        # At most one probe left to run; a pool would only add overhead
+        return get_pandoc_version(pandoc_path), get_latex_version(engine, engine_path)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pandoc_future = pool.submit(get_pandoc_version, pandoc_path)
+        latex_future = pool.submit(get_latex_version, engine, engine_path)
+        return pandoc_future.result(), latex_future.result()
+
+
+def clear_version_caches() -> None:
+    """Clear cached pandoc/LaTeX version probes."""
+    _PANDOC_VERSION_CACHE.clear()
+    _LATEX_VERSION_CACHE.clear()
+
+
 @dataclass
 class RenderReport:
     """
@@ -106,6 +296,44 @@ class RenderReport:
     # Extra info (mode-specific details)
     extra_info: dict[str, Any] = field(default_factory=dict)
 
+    # Deferred hash computations: (attribute, future)
+    _pending: list[tuple[str, Future]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Serialized layout: (section, ((key, attribute), ...)) in output order
+    _LAYOUT: ClassVar[tuple[tuple[str, tuple[tuple[str, str], ...]], ...]] = (
+        ("timestamps", (
+            ("started_at", "started_at"),
+            ("completed_at", "completed_at"),
+        )),
+        ("tools", (
+            ("pandoc_version", "pandoc_version"),
+            ("latex_engine", "latex_engine"),
+            ("latex_engine_version", "latex_engine_version"),
+        )),
+        ("context", (
+            ("build_target", "build_target"),
+            ("render_target", "render_target"),
+            ("strict_mode", "strict_mode"),
+        )),
+        ("templates", (
+            ("template_path", "template_path"),
+            ("template_hash", "template_hash"),
+            ("assets_dir", "assets_dir"),
+            ("assets_hash", "assets_hash"),
+            ("lua_filters", "lua_filters"),
+            ("lua_filter_hashes", "lua_filter_hashes"),
+        )),
+        ("output", (
+            ("files", "output_files"),
+        )),
+        ("diagnostics", (
+            ("warnings", "warnings"),
+            ("errors", "errors"),
+        )),
+    )
+
     def start(self) -> None:
         """Mark the start of rendering."""
         self.started_at = datetime.now(timezone.utc).isoformat()
@@ -125,22 +353,58 @@ class RenderReport:
         self.latex_engine = engine
         self.latex_engine_version = get_latex_version(engine, engine_path)
 
-    def set_template(self, template_path: Path | None) -> None:
-        """Set template info with hash."""
+    def set_versions(
+        self,
+        pandoc_path: Path | None,
+        engine: str,
+        engine_path: Path | None = None,
+    ) -> None:
+        """Detect and set pandoc and LaTeX engine versions concurrently."""
+        self.latex_engine = engine
+        self.pandoc_version, self.latex_engine_version = get_tool_versions(
+            pandoc_path, engine, engine_path
+        )
+
+    def set_template(self, template_path: Path | None, defer: bool = False) -> None:
+        """
+        Set template info with hash.
+
+        Args:
+            template_path: Template file path
+            defer: Hash in the background; the value is filled in by
+                ``wait_pending()`` (called from ``to_dict()``)
+        """
         if template_path and template_path.exists():
             self.template_path = str(template_path)
-            self.template_hash = file_hash(template_path)
+            self._set_hash("template_hash", defer, file_hash, template_path)
 
-    def set_assets(self, assets_dir: Path | None) -> None:
-        """Set assets info with manifest hash."""
+    def set_assets(self, assets_dir: Path | None, defer: bool = False) -> None:
+        """Set assets info with manifest hash (optionally hashed in the background)."""
         if assets_dir and assets_dir.exists():
             self.assets_dir = str(assets_dir)
-            self.assets_hash = directory_manifest_hash(assets_dir)
+            self._set_hash("assets_hash", defer, directory_manifest_hash, assets_dir)
 
-    def set_lua_filters(self, filters: tuple[Path, ...] | list[Path]) -> None:
-        """Set Lua filter info with hashes."""
+    def set_lua_filters(
+        self, filters: tuple[Path, ...] | list[Path], defer: bool = False
+    ) -> None:
+        """Set Lua filter info with hashes (optionally hashed in the background)."""
         self.lua_filters = [str(f) for f in filters]
-        self.lua_filter_hashes = {str(f): file_hash(f) for f in filters if f.exists()}
+        self._set_hash("lua_filter_hashes", defer, _lua_filter_hashes, tuple(filters))
+
+    def _set_hash(
+        self, attr: str, defer: bool, func: Callable[[Any], Any], arg: Any
+    ) -> None:
+        """Compute ``func(arg)`` into ``attr`` now, or schedule it if deferred."""
+        if defer:
+            self._pending.append((attr, _hash_executor().submit(func, arg)))
+        else:
+            setattr(self, attr, func(arg))
+
+    def wait_pending(self) -> None:
+        """Wait for deferred hashes and store their results."""
+        pending, self._pending = self._pending, []
+        for attr, future in pending:
+            setattr(self, attr, future.result())
 
     def add_output(self, path: Path) -> None:
         """Add an output file."""
@@ -156,43 +420,50 @@ class RenderReport:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "timestamps": {
-                "started_at": self.started_at,
-                "completed_at": self.completed_at,
-            },
-            "tools": {
-                "pandoc_version": self.pandoc_version,
-                "latex_engine": self.latex_engine,
-                "latex_engine_version": self.latex_engine_version,
-            },
-            "context": {
-                "build_target": self.build_target,
-                "render_target": self.render_target,
-                "strict_mode": self.strict_mode,
-            },
-            "templates": {
-                "template_path": self.template_path,
-                "template_hash": self.template_hash,
-                "assets_dir": self.assets_dir,
-                "assets_hash": self.assets_hash,
-                "lua_filters": self.lua_filters,
-                "lua_filter_hashes": self.lua_filter_hashes,
-            },
-            "output": {
-                "files": self.output_files,
-            },
-            "diagnostics": {
-                "warnings": self.warnings,
-                "errors": self.errors,
-            },
-            "extra": self.extra_info if self.extra_info else None,
+        self.wait_pending()
+        data: dict[str, Any] = {
+            section: {key: getattr(self, attr) for key, attr in fields}
+            for section, fields in self._LAYOUT
         }
-
-    def to_json(self, indent: int = 2) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
-
-    def save(self, path: Path) -> None:
-        """Save report to a JSON file."""
-        path.write_text(self.to_json() + "\n", encoding="utf-8")
+        data["extra"] = self.extra_info if self.extra_info else None
+        return data
+
+    def to_json(self, indent: int = 2, data: dict[str, Any] | None = None) -> str:
+        """
+        Convert to JSON string.
+
+        Args:
+            indent: JSON indentation
+            data: Pre-built ``to_dict()`` result to serialize (built if None)
+        """
+        if data is None:
+            data = self.to_dict()
+        return _dumps(data, indent)
+
+    def to_bytes(self, data: dict[str, Any] | None = None) -> bytes:
+        """
+        Convert to UTF-8 JSON bytes, exactly as :meth:`save` writes them.
+
+        Lets batch drivers collect several reports and write them together.
+
+        Args:
+            data: Pre-built ``to_dict()`` result to serialize (built if None)
+        """
+        if data is None:
+            data = self.to_dict()
+        payload = _encode(data)
+        if payload is None:
+            payload = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+        return payload
+
+    def save(self, path: Path, data: dict[str, Any] | None = None) -> None:
+        """
+        Save report to a JSON file (atomically replaced).
+
+        Args:
+            path: Output file path
+            data: Pre-built ``to_dict()`` result to write (built if None)
+        """
+        if data is None:
+            data = self.to_dict()
+        _dump_to_file(data, path)
@@ -1,6 +1,6 @@
 """Text export renderers package."""
 
 from .md_renderer import render_md
-from .rst_renderer import render_rst
+from .rst_renderer import render_rst, render_rst_batch
 
-__all__ = ["render_md", "render_rst"]
+__all__ = ["render_md", "render_rst", "render_rst_batch"]
@@ -103,7 +103,7 @@ def render_md(
 
     # Save report
     report_path = output_dir / "render_report.json"
-    report.save(report_path)
+    report.save(report_path, result.report)
     result.add_output_file(report_path)
 
     return result
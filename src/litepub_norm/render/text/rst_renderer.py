@@ -2,21 +2,67 @@
 
 from __future__ import annotations
 
+import uuid
 from pathlib import Path
 from typing import Any
 
 from ..config import RenderConfig
 from ..result import RenderResult
 from ..report import RenderReport
-from ..pandoc_runner import run as pandoc_run, PandocError
+from ..pandoc_runner import (
+    run as pandoc_run,
+    run_to_string,
+    get_pandoc_server,
+    PandocError,
+)
 from ...filters.context import BuildContext
 
 
+def _convert_with_server(
+    ast: dict[str, Any],
+    config: RenderConfig,
+    report: RenderReport,
+) -> str | None:
+    """
+    Convert via the shared pandoc server, or return None to use a subprocess.
+
+    Falls back when pandoc is older than 3.0, the server cannot start, or
+    the server fails the conversion (the CLI then reports its own error).
+    Writer options are not mapped onto the server API, so callers only use
+    this path when there are none.
+    """
+    version = report.pandoc_version or ""
+    major = version.split(".", 1)[0]
+    if not major.isdigit() or int(major) < 3:
+        return None
+
+    try:
+        server = get_pandoc_server(config.pandoc_path)
+    except PandocError as e:
+        report.add_warning({
+            "code": "PANDOC_SERVER_UNAVAILABLE",
+            "message": str(e),
+        })
+        return None
+
+    try:
+        text = server.convert(ast, "rst", standalone=False)
+    except PandocError as e:
+        report.add_warning({
+            "code": "PANDOC_SERVER_FAILED",
+            "message": str(e),
+        })
+        return None
+    # Match the trailing newline pandoc writes to output files
+    return text if text.endswith("\n") else text + "\n"
+
+
 def render_rst(
     ast: dict[str, Any],
     context: BuildContext,
     config: RenderConfig | None = None,
     output_name: str = "document.rst",
+    write_report: bool = True,
 ) -> RenderResult:
     """
     Render a filtered AST to reStructuredText.
@@ -29,6 +75,9 @@ def render_rst(
         context: Build context
         config: Render configuration
         output_name: Name of output RST file
+        write_report: Whether to write render_report.json. Batch drivers
+            that aggregate ``result.report`` themselves can pass False to
+            avoid rewriting the report once per document.
 
     Returns:
         RenderResult with success status and output paths
@@ -67,15 +116,22 @@ def render_rst(
     })
 
     try:
-        # Run pandoc
-        pandoc_run(
-            input_ast=ast,
-            to_format="rst",
-            output_path=output_path,
-            pandoc_path=config.pandoc_path,
-            extra_args=tuple(extra_args),
-            standalone=False,
-        )
+        text = None
+        if config.use_pandoc_server and not extra_args:
+            text = _convert_with_server(ast, config, report)
+
+        if text is not None:
+            output_path.write_text(text, encoding="utf-8")
+        else:
+            # Run pandoc
+            pandoc_run(
+                input_ast=ast,
+                to_format="rst",
+                output_path=output_path,
+                pandoc_path=config.pandoc_path,
+                extra_args=tuple(extra_args),
+                standalone=False,
+            )
 
         result.add_output_file(output_path)
         report.add_output(output_path)
@@ -108,8 +164,201 @@ def render_rst(
     result.report = report.to_dict()
 
     # Save report
+    if write_report:
+        report_path = output_dir / "render_report.json"
+        report.save(report_path, result.report)
+        result.add_output_file(report_path)
+
+    return result
+
+
+_BATCH_SEP_PREFIX = "__LP_BATCH_SEP__"
+
+
+def _batch_document(asts: list[dict[str, Any]], token: str) -> dict[str, Any]:
+    """
+    Concatenate ASTs into one document separated by raw RST sentinel blocks.
+
+    The sentinel is a ``RawBlock`` so pandoc copies it verbatim into the
+    output, where it can be split on exactly.
+    """
+    sentinel = {"t": "RawBlock", "c": ["rst", token]}
+    blocks: list[Any] = []
+    for i, ast in enumerate(asts):
+        if i:
+            blocks.append(sentinel)
+        blocks.extend(ast.get("blocks", []))
+
+    first = asts[0] if asts else {}
+    return {
+        "pandoc-api-version": first.get("pandoc-api-version", [1, 23]),
+        "meta": first.get("meta", {}),
+        "blocks": blocks,
+    }
+
+
+def _split_batch_output(text: str, token: str, count: int) -> list[str]:
+    """
+    Split batched pandoc output back into per-document RST.
+
+    Raises:
+        ValueError: If the number of chunks does not match ``count``.
+    """
+    chunks = text.split(f"\n{token}\n")
+    if len(chunks) != count:
+        raise ValueError(
+            f"Batch output split into {len(chunks)} documents, expected {count}"
+        )
+    return [chunk.strip("\n") + "\n" if chunk.strip() else "" for chunk in chunks]
+
+
+def _end_collected_types(extra_args: tuple[str, ...]) -> frozenset[str]:
+    """
+    Node types whose RST is written once, at the end of the document.
+
+    The RST writer collects footnotes and ``|imageN|`` substitution
+    definitions (numbered per document) after the last block, and link
+    targets too when reference links are enabled.
+    """
+    types = {"Note", "Image"}
+    if any(arg.startswith("--reference-links") for arg in extra_args):
+        types.add("Link")
+    return frozenset(types)
+
+
+def _contains_types(ast: dict[str, Any], types: frozenset[str]) -> bool:
+    """Check whether any node in an AST's blocks has a type in ``types``."""
+    stack: list[Any] = [ast.get("blocks", [])]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if node.get("t") in types:
+                return True
+            content = node.get("c")
+            if isinstance(content, (list, dict)):
+                stack.append(content)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (list, dict)))
+    return False
+
+
+def render_rst_batch(
+    asts: list[dict[str, Any]],
+    context: BuildContext,
+    config: RenderConfig | None = None,
+    output_names: list[str] | None = None,
+) -> RenderResult:
+    """
+    Render several filtered ASTs to reStructuredText with one pandoc call.
+
+    The documents are joined with a unique sentinel block, converted in a
+    single pandoc invocation, and split back into one file per input. This
+    avoids paying pandoc's startup cost once per document.
+
+    Documents containing footnotes, images or (with ``--reference-links``)
+    links are rendered individually, since the RST writer collects their
+    definitions at the end of the (combined) document.
+
+    Args:
+        asts: Filtered Pandoc ASTs
+        context: Build context shared by all documents
+        config: Render configuration
+        output_names: Output file names, one per AST
+            (defaults to ``document_<n>.rst``)
+
+    Returns:
+        RenderResult with one output file per AST plus the render report
+    """
+    if config is None:
+        config = RenderConfig()
+    if output_names is None:
+        output_names = [f"document_{i}.rst" for i in range(len(asts))]
+    if len(output_names) != len(asts):
+        raise ValueError("output_names must have one entry per AST")
+
+    result = RenderResult(success=True)
+    report = RenderReport()
+
+    report.start()
+    report.build_target = context.build_target
+    report.render_target = "rst"
+    report.strict_mode = context.strict
+    report.set_pandoc_version(config.pandoc_path)
+
+    output_dir = config.output_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_paths = [output_dir / name for name in output_names]
+    extra_args = tuple(config.rst_writer_options)
+
+    result.add_warning(
+        code="RST_BEST_EFFORT",
+        message="RST export is best-effort; some formatting may be lost",
+    )
+    report.add_warning({
+        "code": "RST_BEST_EFFORT",
+        "message": "RST export is best-effort",
+    })
+
+    try:
+        end_collected = _end_collected_types(extra_args)
+        run_alone = [_contains_types(ast, end_collected) for ast in asts]
+        batched = [i for i, alone in enumerate(run_alone) if not alone]
+        single = [i for i, alone in enumerate(run_alone) if alone]
+
+        if batched:
+            token = f"{_BATCH_SEP_PREFIX}{uuid.uuid4().hex}"
+            text = run_to_string(
+                input_ast=_batch_document([asts[i] for i in batched], token),
+                to_format="rst",
+                pandoc_path=config.pandoc_path,
+                extra_args=extra_args,
+                standalone=False,
+            )
+            for i, chunk in zip(batched, _split_batch_output(text, token, len(batched))):
+                output_paths[i].write_text(chunk, encoding="utf-8")
+
+        for i in single:
+            pandoc_run(
+                input_ast=asts[i],
+                to_format="rst",
+                output_path=output_paths[i],
+                pandoc_path=config.pandoc_path,
+                extra_args=extra_args,
+                standalone=False,
+            )
+
+        for output_path in output_paths:
+            result.add_output_file(output_path)
+            report.add_output(output_path)
+
+    except PandocError as e:
+        result.add_error(
+            code="PANDOC_FAILED",
+            message=str(e),
+            stage="pandoc",
+            details={"stderr": e.stderr, "returncode": e.returncode},
+        )
+        report.add_error({
+            "code": "PANDOC_FAILED",
+            "message": str(e),
+        })
+
+    except Exception as e:
+        result.add_error(
+            code="RENDER_ERROR",
+            message=str(e),
+            stage="rst_render",
+        )
+        report.add_error({
+            "code": "RENDER_ERROR",
+            "message": str(e),
+        })
+
+    report.complete()
+    result.report = report.to_dict()
+
     report_path = output_dir / "render_report.json"
-    report.save(report_path)
+    report.save(report_path, result.report)
     result.add_output_file(report_path)
 
     return result
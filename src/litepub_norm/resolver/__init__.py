@@ -1,8 +1,15 @@
 """Resolution module - replaces placeholders with computed content."""
 
-from .api import resolve, build_resolution_plan
+from .api import resolve, resolve_bytes, build_resolution_plan
 from .config import ResolutionConfig, ResolutionLimits, BuildTarget
-from .registry import RegistrySnapshot, RegistryEntry, RegistryRun, load_registry
+from .registry import (
+    RegistrySnapshot,
+    RegistryEntry,
+    RegistryRun,
+    load_registry,
+    load_registry_cached,
+    clear_registry_cache,
+)
 from .plan import ResolutionPlan, ResolutionItem, build_plan
 from .apply import apply_plan
 from .errors import (
@@ -18,6 +25,7 @@ from .errors import (
 __all__ = [
     # API
     "resolve",
+    "resolve_bytes",
     "build_resolution_plan",
     # Config
     "ResolutionConfig",
@@ -28,6 +36,8 @@ __all__ = [
     "RegistryEntry",
     "RegistryRun",
     "load_registry",
+    "load_registry_cached",
+    "clear_registry_cache",
     # Plan
     "ResolutionPlan",
     "ResolutionItem",
@@ -0,0 +1,29 @@
+"""JSON parsing shared by the registry, payload loaders and resolution API."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available.
+
+    orjson rejects a few inputs the stdlib accepts (NaN/Infinity literals,
+    integers beyond 64 bits, a UTF-8 BOM); those are re-parsed with
+    ``json`` so results and error messages match the stdlib path.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
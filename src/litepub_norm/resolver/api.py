@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any
 
-from .config import ResolutionConfig
-from .registry import RegistrySnapshot, load_registry
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+from ._json import loads
+from .config import ResolutionConfig, _DEFAULT_CONFIG
+from .registry import RegistrySnapshot, load_registry_cached
 from .plan import ResolutionPlan, build_plan
 from .apply import apply_plan
 
@@ -23,7 +30,8 @@ def resolve(
 
     Args:
         ast: Normalized Pandoc AST with placeholder tokens.
-        registry: AARC registry (snapshot or path to JSON file).
+        registry: AARC registry (snapshot or path to JSON file). Paths are
+            loaded through the registry cache and parsed once while unchanged.
         config: Resolution configuration (defaults to strict mode).
 
     Returns:
@@ -38,11 +46,11 @@ def resolve(
     """
     # Default config
     if config is None:
-        config = ResolutionConfig()
+        config = _DEFAULT_CONFIG
 
     # Load registry if path provided
     if isinstance(registry, (str, Path)):
-        registry = load_registry(registry)
+        registry = load_registry_cached(registry)
 
     # Build resolution plan
     plan = build_plan(ast, registry, config)
@@ -70,9 +78,47 @@ def build_resolution_plan(
         ResolutionPlan with items to resolve.
     """
     if config is None:
-        config = ResolutionConfig()
+        config = _DEFAULT_CONFIG
 
     if isinstance(registry, (str, Path)):
-        registry = load_registry(registry)
+        registry = load_registry_cached(registry)
 
     return build_plan(ast, registry, config)
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize Pandoc JSON compactly, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # Integers beyond 64 bits or other types orjson rejects
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def resolve_bytes(
+    ast_bytes: bytes,
+    registry: RegistrySnapshot | str | Path,
+    config: ResolutionConfig | None = None,
+) -> bytes:
+    """
+    Resolve a Pandoc JSON document given and returned as bytes.
+
+    Intended for pipelines that pass ASTs between processes (e.g. from and
+    to pandoc). Parsing and serialization use orjson when it is installed.
+    The parsed tree is private to this call, so it is never copied.
+
+    Args:
+        ast_bytes: Normalized Pandoc AST as UTF-8 JSON.
+        registry: AARC registry (snapshot or path to JSON file).
+        config: Resolution configuration (defaults to strict mode).
+
+    Returns:
+        Resolved AST as compact UTF-8 JSON.
+
+    Raises:
+        ValueError: If ``ast_bytes`` is not valid JSON.
+        ResolutionError: As for :func:`resolve`.
+    """
+    return _dumps(resolve(loads(ast_bytes), registry, config))
@@ -3,32 +3,150 @@
 from __future__ import annotations
 
 import copy
-from typing import Any
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator
 
 from .config import ResolutionConfig
-from .registry import RegistrySnapshot
+from .registry import RegistrySnapshot, RegistryEntry
 from .plan import ResolutionPlan, ResolutionItem
 from .errors import PayloadError, ValidationError
 
-# Loaders
-from .loaders.metric_v1 import load_metric_v1
-from .loaders.table_simple_v1 import load_table_simple_v1
-from .loaders.table_pandoc_v1 import load_table_pandoc_v1
-from .loaders.figure_v1 import load_figure_v1, load_figure_meta_v1
 
-# Validators
-from ..validator import (
-    validate_metric_v1,
-    validate_table_simple_v1,
-    validate_table_pandoc_v1,
-    validate_figure_meta_v1,
-)
+# Plans smaller than this are loaded inline; thread start-up would dominate
+_PARALLEL_LOAD_MIN_ITEMS = 4
+_PARALLEL_LOAD_MAX_WORKERS = 16
 
-# Emitters
-from .emitters.metric_v1 import emit_metric_as_table
-from .emitters.table_simple_v1 import emit_simple_table
-from .emitters.table_pandoc_v1 import emit_pandoc_table
-from .emitters.figure_v1 import emit_figure
+
+# Handler factories import their loader/validator/emitter on first use, so
+# a run only pays for the specs it actually resolves. Each returns
+# (loader, validator, emitter):
+#   loader(registry, entry, verify) -> payload
+#   validator(payload, entry, config) -> None
+#   emitter(payload, entry) -> Pandoc block
+
+
+def _metric_handlers() -> tuple[Callable, Callable, Callable]:
+    from .loaders.metric_v1 import load_metric_v1
+    from ..validator.metric_v1 import validate_metric_v1
+    from .emitters.metric_v1 import emit_metric_as_table
+
+    return (
+        lambda registry, entry, verify: load_metric_v1(registry, entry, verify=verify),
+        lambda payload, entry, config: validate_metric_v1(payload, entry.id),
+        lambda payload, entry: emit_metric_as_table(payload),
+    )
+
+
+def _table_simple_handlers() -> tuple[Callable, Callable, Callable]:
+    from .loaders.table_simple_v1 import load_table_simple_v1
+    from ..validator.table_simple_v1 import validate_table_simple_v1
+    from .emitters.table_simple_v1 import emit_simple_table
+
+    return (
+        lambda registry, entry, verify: load_table_simple_v1(registry, entry, verify=verify),
+        lambda payload, entry, config: validate_table_simple_v1(payload, entry.id, config.limits),
+        lambda payload, entry: emit_simple_table(payload),
+    )
+
+
+def _table_pandoc_handlers() -> tuple[Callable, Callable, Callable]:
+    from .loaders.table_pandoc_v1 import load_table_pandoc_v1
+    from ..validator.table_pandoc_v1 import validate_table_pandoc_v1
+    from .emitters.table_pandoc_v1 import emit_pandoc_table
+
+    return (
+        lambda registry, entry, verify: load_table_pandoc_v1(registry, entry, verify=verify),
+        lambda payload, entry, config: validate_table_pandoc_v1(payload, entry.id, config),
+        lambda payload, entry: emit_pandoc_table(payload),
+    )
+
+
+def _figure_handlers() -> tuple[Callable, Callable, Callable]:
+    from .loaders.figure_v1 import load_figure_v1, load_figure_meta_v1
+    from ..validator.figure_v1 import validate_figure_meta_v1
+    from .emitters.figure_v1 import emit_figure
+
+    def load_figure(
+        registry: RegistrySnapshot,
+        entry: RegistryEntry,
+        verify: bool,
+    ) -> tuple[Path, dict[str, Any]]:
+        """Load a figure image path together with its metadata sidecar."""
+        image_path = load_figure_v1(registry, entry, verify=verify)
+        meta = load_figure_meta_v1(registry, entry, verify=verify)
+        return image_path, meta
+
+    return (
+        load_figure,
+        lambda payload, entry, config: validate_figure_meta_v1(payload[1], entry.id),
+        lambda payload, entry: emit_figure(payload[0], payload[1], entry.id),
+    )
+
+
+_SPEC_FACTORIES: dict[str, Callable[[], tuple[Callable, Callable, Callable]]] = {
+    "metric.json@v1": _metric_handlers,
+    "table.simple.json@v1": _table_simple_handlers,
+    "table.pandoc.json@v1": _table_pandoc_handlers,
+    "figure.binary@v1": _figure_handlers,
+}
+
+
+@functools.cache
+def _spec_handlers(spec: str) -> tuple[Callable, Callable, Callable]:
+    """Build (and cache) the handler triple for a spec; KeyError if unknown."""
+    return _SPEC_FACTORIES[spec]()
+
+
+def _handlers(entry: RegistryEntry) -> tuple[Callable, Callable, Callable]:
+    """
+    Look up the (loader, validator, emitter) triple for an entry's spec.
+
+    Raises:
+        PayloadError: If the spec is unknown.
+    """
+    try:
+        return _spec_handlers(entry.spec)
+    except KeyError:
+        raise PayloadError(
+            f"Unknown payload spec: {entry.spec}",
+            semantic_id=entry.id,
+        )
+
+
+def _load_item(
+    item: ResolutionItem,
+    registry: RegistrySnapshot,
+    config: ResolutionConfig,
+) -> Any:
+    """
+    Load (and hash-verify) the payload for a single item.
+
+    This is the I/O-bound half of resolution and is safe to run on a
+    worker thread.
+
+    Raises:
+        PayloadError: If payload cannot be loaded.
+    """
+    loader, _, _ = _handlers(item.entry)
+    return loader(registry, item.entry, config.strict)
+
+
+def _emit_item(
+    item: ResolutionItem,
+    payload: Any,
+    config: ResolutionConfig,
+) -> dict:
+    """
+    Validate a loaded payload and emit its Pandoc block.
+
+    Raises:
+        ValidationError: If payload is invalid.
+    """
+    _, validator, emitter = _handlers(item.entry)
+    validator(payload, item.entry, config)
+    return emitter(payload, item.entry)
 
 
 def _resolve_item(
@@ -51,35 +169,8 @@ def _resolve_item(
         PayloadError: If payload cannot be loaded.
         ValidationError: If payload is invalid.
     """
-    entry = item.entry
-    spec = entry.spec
-
-    if spec == "metric.json@v1":
-        payload = load_metric_v1(registry, entry, verify=config.strict)
-        validate_metric_v1(payload, entry.id)
-        return emit_metric_as_table(payload)
-
-    elif spec == "table.simple.json@v1":
-        payload = load_table_simple_v1(registry, entry, verify=config.strict)
-        validate_table_simple_v1(payload, entry.id, config.limits)
-        return emit_simple_table(payload)
-
-    elif spec == "table.pandoc.json@v1":
-        payload = load_table_pandoc_v1(registry, entry, verify=config.strict)
-        validate_table_pandoc_v1(payload, entry.id, config)
-        return emit_pandoc_table(payload)
-
-    elif spec == "figure.binary@v1":
-        image_path = load_figure_v1(registry, entry, verify=config.strict)
-        meta = load_figure_meta_v1(registry, entry, verify=config.strict)
-        validate_figure_meta_v1(meta, entry.id)
-        return emit_figure(image_path, meta, entry.id)
-
-    else:
-        raise PayloadError(
-            f"Unknown payload spec: {spec}",
-            semantic_id=entry.id,
-        )
+    payload = _load_item(item, registry, config)
+    return _emit_item(item, payload, config)
 
 
 def _replace_placeholder_in_wrapper(
@@ -88,22 +179,72 @@ def _replace_placeholder_in_wrapper(
     replacement: dict,
 ) -> dict:
     """
-    Replace the placeholder block in a wrapper Div with the resolved content.
+    Return a copy of a wrapper Div with the placeholder block replaced.
+
+    Only the wrapper dict, its content pair and its block list are copied;
+    all other blocks are shared with the input wrapper.
 
     Args:
-        wrapper: The wrapper Div block (will be modified in place).
+        wrapper: The wrapper Div block (not modified).
         placeholder_idx: Index of the placeholder block in wrapper content.
         replacement: The Pandoc block to insert.
 
     Returns:
-        The modified wrapper.
+        The updated wrapper copy.
     """
     content = wrapper.get("c", [])
-    if len(content) >= 2:
-        blocks = content[1]
-        if 0 <= placeholder_idx < len(blocks):
-            blocks[placeholder_idx] = replacement
-    return wrapper
+    if len(content) < 2:
+        return wrapper
+    blocks = content[1]
+    if not 0 <= placeholder_idx < len(blocks):
+        return wrapper
+
+    new_blocks = list(blocks)
+    new_blocks[placeholder_idx] = replacement
+    new_wrapper = dict(wrapper)
+    new_wrapper["c"] = [content[0], new_blocks, *content[2:]]
+    return new_wrapper
+
+
+def _apply_item(blocks: list, item: ResolutionItem, replacement: dict) -> None:
+    """Swap a resolved block into its (copied) wrapper in the top-level list."""
+    wrapper_idx = item.wrapper_index
+    if 0 <= wrapper_idx < len(blocks):
+        blocks[wrapper_idx] = _replace_placeholder_in_wrapper(
+            blocks[wrapper_idx],
+            item.placeholder_index,
+            replacement,
+        )
+
+
+def _item_key(item: ResolutionItem) -> tuple[str, str, str]:
+    """Identify the artifact an item resolves to."""
+    entry = item.entry
+    return (entry.id, entry.spec, entry.sha256)
+
+
+def _emit_all(
+    blocks: list,
+    items: list[ResolutionItem],
+    payloads: Iterator[Any],
+    config: ResolutionConfig,
+) -> None:
+    """
+    Validate, emit and place every item, in plan order.
+
+    ``payloads`` yields one payload per distinct artifact, in order of first
+    occurrence; repeated artifacts reuse the first emitted block.
+    """
+    emitted: dict[tuple[str, str, str], dict] = {}
+    for item in items:
+        key = _item_key(item)
+        cached = emitted.get(key)
+        if cached is None:
+            replacement = _emit_item(item, next(payloads), config)
+            emitted[key] = replacement
+        else:
+            replacement = copy.deepcopy(cached)
+        _apply_item(blocks, item, replacement)
 
 
 def apply_plan(
@@ -118,8 +259,11 @@ def apply_plan(
     Resolves all items in the plan, replacing placeholders with
     computed content.
 
+    The result shares every untouched block with the input AST; only the
+    top-level block list and the wrappers being resolved are copied.
+
     Args:
-        ast: Normalized Pandoc AST (will be copied, not modified).
+        ast: Normalized Pandoc AST (not modified).
         plan: Resolution plan with items to resolve.
         registry: Registry for path resolution.
         config: Resolution configuration.
@@ -131,22 +275,30 @@ def apply_plan(
         PayloadError: If any payload cannot be loaded.
         ValidationError: If any payload is invalid.
     """
-    # Deep copy to avoid modifying original
-    result = copy.deepcopy(ast)
-    blocks = result.get("blocks", [])
-
-    for item in plan:
-        # Resolve the item
-        replacement = _resolve_item(item, registry, config)
-
-        # Get the wrapper Div
-        wrapper_idx = item.wrapper_index
-        if 0 <= wrapper_idx < len(blocks):
-            wrapper = blocks[wrapper_idx]
-            _replace_placeholder_in_wrapper(
-                wrapper,
-                item.placeholder_index,
-                replacement,
-            )
+    # Copy only the spine; wrappers are copied on write below
+    result = dict(ast)
+    blocks = list(ast.get("blocks", []))
+    result["blocks"] = blocks
+
+    items = list(plan)
+
+    # Placeholders that reference the same artifact are loaded and validated
+    # once; later occurrences get a deep copy of the first emitted block.
+    unique: dict[tuple[str, str, str], ResolutionItem] = {}
+    for item in items:
+        unique.setdefault(_item_key(item), item)
+    unique_items = list(unique.values())
+
+    if len(unique_items) < _PARALLEL_LOAD_MIN_ITEMS:
+        payloads = (_load_item(item, registry, config) for item in unique_items)
+        _emit_all(blocks, items, payloads, config)
+        return result
+
+    # Payload loads are independent file I/O; run them on a thread pool and
+    # validate/emit in plan order so output and error order stay deterministic.
+    workers = min(_PARALLEL_LOAD_MAX_WORKERS, len(unique_items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        payloads = executor.map(lambda item: _load_item(item, registry, config), unique_items)
+        _emit_all(blocks, items, payloads, config)
 
     return result
@@ -1,12 +1,12 @@
 """Resolution configuration."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Literal
 
 BuildTarget = Literal["internal", "external", "dossier"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolutionLimits:
     """Size limits for resolved content."""
 
@@ -17,15 +17,23 @@ class ResolutionLimits:
     max_image_bytes: int = 50_000_000
 
 
-@dataclass(frozen=True)
+# Shared default limits; safe to reuse because the dataclass is frozen
+_DEFAULT_LIMITS = ResolutionLimits()
+
+
+@dataclass(frozen=True, slots=True)
 class ResolutionConfig:
     """Configuration for the resolution stage."""
 
     target: BuildTarget = "internal"
     strict: bool = True
     allow_raw_pandoc: bool = False
-    limits: ResolutionLimits = field(default_factory=ResolutionLimits)
+    limits: ResolutionLimits = _DEFAULT_LIMITS
 
     def is_strict_target(self) -> bool:
         """Check if target requires strict validation."""
         return self.target in ("external", "dossier")
+
+
+# Config used when callers pass none (strict, internal target)
+_DEFAULT_CONFIG = ResolutionConfig()
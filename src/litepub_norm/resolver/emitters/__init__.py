@@ -1,4 +1,10 @@
-"""Emitters that convert payloads to Pandoc AST blocks."""
+"""
+Emitters that convert payloads to Pandoc AST blocks.
+
+Every emitter returns a newly created block dict owned by the caller, never
+the payload object itself, so resolved ASTs can be built by structural
+sharing without defensive deep copies.
+"""
 
 from .pandoc_builders import make_str, make_para, make_plain, make_table_cell
 from .metric_v1 import emit_metric_as_table
@@ -24,47 +24,39 @@ def emit_figure(
     Returns:
         Pandoc Figure block dict.
     """
-    # Extract metadata
-    caption_text = ""
-    alt_text = ""
-
     if meta:
         caption_text = meta.get("caption", "")
         alt_text = meta.get("alt", "")
+    else:
+        caption_text = alt_text = ""
 
-    # Build image inline
     # Image structure: [Attr, [Inline] (alt text), Target]
     # Target is [url, title]
     image_inline = {
         "t": "Image",
         "c": [
-            make_attr(),
+            ["", [], []],
             make_inlines_from_text(alt_text) if alt_text else [],
             [str(image_path), ""],  # [url, title]
         ],
     }
 
-    # Build caption
     # Caption is: [ShortCaption, [Block]]
-    if caption_text:
-        caption_blocks = [make_para(make_inlines_from_text(caption_text))]
-        caption = [None, caption_blocks]
-    else:
-        caption = [None, []]
+    caption_blocks = (
+        [{"t": "Para", "c": make_inlines_from_text(caption_text)}] if caption_text else []
+    )
 
     # Figure structure: [Attr, Caption, [Block]]
-    # The content block is typically a Para containing the Image
-    figure = {
+    # The content block is a Para containing the Image
+    return {
         "t": "Figure",
         "c": [
-            make_attr(identifier=semantic_id, classes=["figure"]),
-            caption,
-            [make_para([image_inline])],
+            [semantic_id, ["figure"], []],
+            [None, caption_blocks],
+            [{"t": "Para", "c": [image_inline]}],
         ],
     }
 
-    return figure
-
 
 def emit_figure_as_para(
     image_path: Path,
@@ -5,11 +5,11 @@ from __future__ import annotations
 from typing import Any
 
 from .pandoc_builders import (
+    format_float,
     make_plain,
     make_inlines_from_text,
     make_table_cell,
     make_row,
-    make_col_spec,
     make_table,
 )
 
@@ -29,8 +29,7 @@ def _format_metric_value(payload: dict[str, Any]) -> str:
     if isinstance(value, int):
         value_str = str(value)
     else:
-        # Use .15g for stable float formatting
-        value_str = format(value, ".15g")
+        value_str = format_float(float(value))
 
     if fmt:
         # Only substitute {value} and {unit}
@@ -43,6 +42,25 @@ def _format_metric_value(payload: dict[str, Any]) -> str:
     return value_str
 
 
+def _metric_table_head() -> tuple[list, list]:
+    """
+    Return the fixed column specs and "Metric | Value" header row.
+
+    Written out as Pandoc JSON literals (the builders' output for this
+    fixed schema) so each metric only pays for its two data cells. A new
+    structure is returned per call since emitted blocks are caller-owned.
+    """
+    col_specs = [
+        [{"t": "AlignLeft"}, {"t": "ColWidthDefault"}],
+        [{"t": "AlignRight"}, {"t": "ColWidthDefault"}],
+    ]
+    header_row = [["", [], []], [
+        [["", [], []], {"t": "AlignDefault"}, 1, 1, [{"t": "Plain", "c": [{"t": "Str", "c": "Metric"}]}]],
+        [["", [], []], {"t": "AlignDefault"}, 1, 1, [{"t": "Plain", "c": [{"t": "Str", "c": "Value"}]}]],
+    ]]
+    return col_specs, header_row
+
+
 def emit_metric_as_table(payload: dict[str, Any]) -> dict:
     """
     Emit a metric payload as a 2-column, 1-row Pandoc Table.
@@ -61,16 +79,7 @@ def emit_metric_as_table(payload: dict[str, Any]) -> dict:
     # |-------|-------|
     # | <label> | <value_str> |
 
-    col_specs = [
-        make_col_spec("AlignLeft"),
-        make_col_spec("AlignRight"),
-    ]
-
-    # Header row
-    header_row = make_row([
-        make_table_cell([make_plain(make_inlines_from_text("Metric"))]),
-        make_table_cell([make_plain(make_inlines_from_text("Value"))]),
-    ])
+    col_specs, header_row = _metric_table_head()
 
     # Data row
     data_row = make_row([
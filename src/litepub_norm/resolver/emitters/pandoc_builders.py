@@ -5,6 +5,21 @@ from __future__ import annotations
 from typing import Any
 
 
+_float_format = float.__format__
+
+
+def format_float(value: float) -> str:
+    """
+    Format a float for display using the emitters' deterministic policy.
+
+    Uses 15 significant digits (``.15g``), which hides binary representation
+    noise such as ``0.1 + 0.2`` while staying stable across platforms.
+    ``float.__format__`` is called directly to skip the ``format()`` builtin
+    dispatch on the per-cell path.
+    """
+    return _float_format(value, ".15g")
+
+
 def make_str(text: str) -> dict:
     """Create a Str inline node."""
     return {"t": "Str", "c": text}
@@ -19,17 +34,17 @@ def make_inlines_from_text(text: str) -> list[dict]:
     """
     Convert text string to a list of inline nodes.
 
-    Words are separated by Space nodes.
+    Words are separated by Space nodes. Single-word text (the common case
+    for labels and cell values) returns one Str without looping.
     """
     words = text.split()
-    if not words:
-        return []
-
-    inlines = []
-    for i, word in enumerate(words):
-        if i > 0:
-            inlines.append(make_space())
-        inlines.append(make_str(word))
+    if len(words) <= 1:
+        return [{"t": "Str", "c": words[0]}] if words else []
+
+    inlines = [{"t": "Str", "c": words[0]}]
+    for word in words[1:]:
+        inlines.append({"t": "Space"})
+        inlines.append({"t": "Str", "c": word})
     return inlines
 
 
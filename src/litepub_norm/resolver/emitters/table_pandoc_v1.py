@@ -17,7 +17,8 @@ def emit_pandoc_table(payload: dict[str, Any]) -> dict:
         payload: Validated Pandoc Table block.
 
     Returns:
-        The same Pandoc Table block dict.
+        A new Table block dict holding the payload's content.
     """
-    # The payload is already a valid Pandoc Table block
-    return payload
+    # The payload is already a valid Pandoc Table block; return an owned
+    # top-level node so the resolved AST never aliases the payload dict
+    return {"t": payload["t"], "c": payload["c"]}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from .pandoc_builders import (
+    format_float,
     make_plain,
     make_inlines_from_text,
     make_table_cell,
@@ -14,6 +15,10 @@ from .pandoc_builders import (
 )
 
 
+# Value types whose formatted text is always a single non-empty word
+_SINGLE_TOKEN_TYPES = (bool, int, float)
+
+
 def _format_cell_value(value: Any) -> str:
     """Format a cell value as a string."""
     if value is None:
@@ -23,7 +28,7 @@ def _format_cell_value(value: Any) -> str:
     if isinstance(value, int):
         return str(value)
     if isinstance(value, float):
-        return format(value, ".15g")
+        return format_float(value)
     return str(value)
 
 
@@ -31,6 +36,11 @@ def emit_simple_table(payload: dict[str, Any]) -> dict:
     """
     Emit a table.simple.json@v1 payload as a Pandoc Table.
 
+    Body cells are built as raw Pandoc JSON literals rather than through
+    the builder chain, since large tables produce one cell per value.
+    Numeric and boolean values never contain whitespace, so they become a
+    single Str without going through word splitting.
+
     Args:
         payload: Validated table payload.
 
@@ -56,18 +66,23 @@ def emit_simple_table(payload: dict[str, Any]) -> dict:
         )
     header_row = make_row(header_cells)
 
-    # Build body rows
+    # Build body rows; the alignment node is shared within this table
+    keys = [col["key"] for col in columns]
+    align = {"t": "AlignDefault"}
     body_rows = []
     for row_data in rows:
         cells = []
-        for col in columns:
-            key = col["key"]
+        for key in keys:
             value = row_data.get(key)
-            value_str = _format_cell_value(value)
-            cells.append(
-                make_table_cell([make_plain(make_inlines_from_text(value_str))])
-            )
-        body_rows.append(make_row(cells))
+            if value is None:
+                inlines = []
+            elif type(value) in _SINGLE_TOKEN_TYPES:
+                inlines = [{"t": "Str", "c": _format_cell_value(value)}]
+            else:
+                inlines = make_inlines_from_text(_format_cell_value(value))
+            # Cell: [Attr, Alignment, RowSpan, ColSpan, [Block]]
+            cells.append([["", [], []], align, 1, 1, [{"t": "Plain", "c": inlines}]])
+        body_rows.append([["", [], []], cells])
 
     return make_table(
         col_specs=col_specs,
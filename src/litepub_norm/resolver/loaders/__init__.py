@@ -1,6 +1,6 @@
 """Payload loaders for different artifact types."""
 
-from .base import compute_sha256, verify_hash
+from .base import compute_sha256, clear_hash_cache, verify_hash
 from .metric_v1 import load_metric_v1
 from .table_simple_v1 import load_table_simple_v1
 from .table_pandoc_v1 import load_table_pandoc_v1
@@ -8,6 +8,7 @@ from .figure_v1 import load_figure_v1, load_figure_meta_v1
 
 __all__ = [
     "compute_sha256",
+    "clear_hash_cache",
     "verify_hash",
     "load_metric_v1",
     "load_table_simple_v1",
@@ -2,28 +2,65 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import json
+import mmap
+import os
 from pathlib import Path
 
+from .._json import loads
 from ..errors import HashMismatchError, PayloadError
 
+# compute_sha256 strategy thresholds
+_READ_ONCE_MAX_BYTES = 1 << 20
+_MMAP_MAX_BYTES = 128 << 20
 
-def compute_sha256(path: Path) -> str:
+
+def compute_sha256(path: str | Path) -> str:
     """
     Compute SHA256 hash of a file.
 
+    Digests are cached by (path, mtime, size), so re-resolving unchanged
+    artifacts in the same process (re-renders, watch mode) hashes each
+    file only once.
+
     Returns:
         Hash string in format "sha256:<hex>".
     """
-    h = hashlib.sha256()
+    st = os.stat(path)
+    return _sha256_file(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _sha256_file(path: str, mtime_ns: int, size: int) -> str:
+    """Hash a file; mtime_ns and size only key the cache."""
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+        return _sha256_open_file(f, size)
+
+
+def _sha256_open_file(f, size: int) -> str:
+    """Hash an open binary file of known size, picking a strategy by size."""
+    if size <= _READ_ONCE_MAX_BYTES:
+        # Metric/table JSON: one read beats allocating a digest buffer
+        h = hashlib.sha256(f.read())
+    elif size <= _MMAP_MAX_BYTES:
+        # Hash the page cache directly, without a user-space copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h = hashlib.sha256(mm)
+    else:
+        # Bound memory for very large binaries
+        h = hashlib.file_digest(f, "sha256")
     return "sha256:" + h.hexdigest()
 
 
+def clear_hash_cache() -> None:
+    """Clear cached payload digests."""
+    _sha256_file.cache_clear()
+
+
 def verify_hash(
-    path: Path,
+    path: str | Path,
     expected: str,
     semantic_id: str,
 ) -> None:
@@ -48,7 +85,7 @@ def verify_hash(
         )
 
 
-def load_json_file(path: Path, semantic_id: str) -> dict:
+def load_json_file(path: str | Path, semantic_id: str) -> dict:
     """
     Load and parse a JSON file.
 
@@ -62,18 +99,85 @@ def load_json_file(path: Path, semantic_id: str) -> dict:
     Raises:
         PayloadError: If file cannot be read or parsed.
     """
-    import json
+    try:
+        with open(path, "rb") as f:
+            return loads(f.read())
+    except FileNotFoundError:
+        raise PayloadError(
+            f"Payload file not found: {path}",
+            semantic_id=semantic_id,
+            path=str(path),
+        )
+    except json.JSONDecodeError as e:
+        raise PayloadError(
+            f"Invalid JSON in payload: {e}",
+            semantic_id=semantic_id,
+            path=str(path),
+        )
+    except Exception as e:
+        raise PayloadError(
+            f"Failed to read payload: {e}",
+            semantic_id=semantic_id,
+            path=str(path),
+        )
 
-    if not path.exists():
+
+def load_and_verify_json(
+    path: str | Path, expected: str, semantic_id: str
+) -> dict:
+    """
+    Verify a JSON payload's hash and parse it from a single read.
+
+    The file is read once into memory, hashed, and parsed from the same
+    buffer instead of being opened separately for hashing and parsing.
+    Payloads too large to buffer fall back to the streaming path.
+
+    Args:
+        path: Path to JSON file.
+        expected: Expected hash (format: "sha256:<hex>").
+        semantic_id: For error messages.
+
+    Returns:
+        Parsed JSON as dict.
+
+    Raises:
+        PayloadError: If file cannot be read or parsed.
+        HashMismatchError: If hash doesn't match.
+    """
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
         raise PayloadError(
             f"Payload file not found: {path}",
             semantic_id=semantic_id,
             path=str(path),
         )
 
+    if size > _MMAP_MAX_BYTES:
+        verify_hash(path, expected, semantic_id)
+        return load_json_file(path, semantic_id)
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise PayloadError(
+            f"Failed to read payload: {e}",
+            semantic_id=semantic_id,
+            path=str(path),
+        )
+
+    actual = "sha256:" + hashlib.sha256(data).hexdigest()
+    if actual != expected:
+        raise HashMismatchError(
+            semantic_id=semantic_id,
+            expected=expected,
+            actual=actual,
+            path=str(path),
+        )
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return loads(data)
     except json.JSONDecodeError as e:
         raise PayloadError(
             f"Invalid JSON in payload: {e}",
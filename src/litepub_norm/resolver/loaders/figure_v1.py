@@ -2,23 +2,24 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any
 
 from ..registry import RegistrySnapshot, RegistryEntry
 from ..errors import PayloadError
-from .base import verify_hash, load_json_file
+from .base import verify_hash, load_and_verify_json, load_json_file
 
 
 # Allowed figure formats
-ALLOWED_FORMATS = {
+ALLOWED_FORMATS = frozenset(map(sys.intern, (
     "image.png",
     "image.jpg",
     "image.jpeg",
     "image.webp",
     "image.svg",
     "image.pdf",
-}
+)))
 
 
 def load_figure_v1(
@@ -56,16 +57,20 @@ def load_figure_v1(
 
     path = registry.resolve_entry_path(entry)
 
-    if not path.exists():
+    # Hashing stats and opens the file anyway, so only the unverified
+    # path needs a separate existence check.
+    try:
+        if verify:
+            verify_hash(path, entry.sha256, entry.id)
+        elif not path.exists():
+            raise FileNotFoundError(path)
+    except FileNotFoundError:
         raise PayloadError(
             f"Figure file not found: {path}",
             semantic_id=entry.id,
             path=str(path),
         )
 
-    if verify:
-        verify_hash(path, entry.sha256, entry.id)
-
     return path
 
 
@@ -99,14 +104,13 @@ def load_figure_meta_v1(
         )
 
     path = registry.resolve_meta_path(entry)
-    if path is None or not path.exists():
+    if path is None:
         raise PayloadError(
             f"Figure metadata file not found: {path}",
             semantic_id=entry.id,
-            path=str(path) if path else None,
         )
 
+    # The loaders raise PayloadError for a missing file.
     if verify and entry.meta_sha256:
-        verify_hash(path, entry.meta_sha256, entry.id)
-
+        return load_and_verify_json(path, entry.meta_sha256, entry.id)
     return load_json_file(path, entry.id)
@@ -7,7 +7,7 @@ from typing import Any
 
 from ..registry import RegistrySnapshot, RegistryEntry
 from ..errors import PayloadError
-from .base import verify_hash, load_json_file
+from .base import load_and_verify_json, load_json_file
 
 
 def load_metric_v1(
@@ -39,6 +39,5 @@ def load_metric_v1(
     path = registry.resolve_entry_path(entry)
 
     if verify:
-        verify_hash(path, entry.sha256, entry.id)
-
+        return load_and_verify_json(path, entry.sha256, entry.id)
     return load_json_file(path, entry.id)
@@ -6,7 +6,7 @@ from typing import Any
 
 from ..registry import RegistrySnapshot, RegistryEntry
 from ..errors import PayloadError
-from .base import verify_hash, load_json_file
+from .base import load_and_verify_json, load_json_file
 
 
 def load_table_pandoc_v1(
@@ -40,14 +40,15 @@ def load_table_pandoc_v1(
     path = registry.resolve_entry_path(entry)
 
     if verify:
-        verify_hash(path, entry.sha256, entry.id)
-
-    data = load_json_file(path, entry.id)
+        data = load_and_verify_json(path, entry.sha256, entry.id)
+    else:
+        data = load_json_file(path, entry.id)
 
     # Validate it's a Table block
-    if data.get("t") != "Table":
+    block_type = data.get("t") if isinstance(data, dict) else type(data).__name__
+    if block_type != "Table":
         raise PayloadError(
-            f"Expected Pandoc Table block, got type '{data.get('t')}'",
+            f"Expected Pandoc Table block, got type '{block_type}'",
             semantic_id=entry.id,
             path=str(path),
         )
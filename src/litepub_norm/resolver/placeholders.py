@@ -8,7 +8,7 @@ from typing import Literal
 PlaceholderKind = Literal["METRIC", "TABLE", "FIGURE"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Placeholder:
     """Placeholder token information."""
 
@@ -23,6 +23,9 @@ PLACEHOLDERS = {
     "[[COMPUTED:FIGURE]]": Placeholder(kind="FIGURE", token="[[COMPUTED:FIGURE]]"),
 }
 
+# Common prefix of every placeholder token
+_TOKEN_PREFIX = "[[COMPUTED:"
+
 # Map from placeholder kind to artifact_type
 KIND_TO_ARTIFACT_TYPE = {
     "METRIC": "metric",
@@ -77,6 +80,17 @@ def is_placeholder_block(block: dict) -> Placeholder | None:
     Returns:
         The Placeholder if found, None otherwise.
     """
+    if block.get("t") != "Para":
+        return None
+
+    # Reject prose paragraphs from their first word instead of joining
+    # every inline: the text must start with (a piece of) _TOKEN_PREFIX.
+    contents = block.get("c")
+    if contents and contents[0].get("t") == "Str":
+        head = contents[0].get("c", "").lstrip()
+        if head and head[: len(_TOKEN_PREFIX)] != _TOKEN_PREFIX[: len(head)]:
+            return None
+
     text = extract_placeholder_text(block)
     if text and text in PLACEHOLDERS:
         return PLACEHOLDERS[text]
@@ -15,7 +15,7 @@ from .placeholders import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolutionItem:
     """A single item to resolve."""
 
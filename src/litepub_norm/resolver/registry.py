@@ -4,16 +4,18 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
+from ._json import loads
 from .errors import RegistryError
 
 ArtifactType = Literal["table", "metric", "figure"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegistryRun:
     """Run-level provenance information."""
 
@@ -27,7 +29,7 @@ class RegistryRun:
     config_fingerprint: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegistryEntry:
     """Single artifact entry in the registry."""
 
@@ -46,7 +48,7 @@ class RegistryEntry:
     meta: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistrySnapshot:
     """Complete registry snapshot (aarc-1.1)."""
 
@@ -57,6 +59,10 @@ class RegistrySnapshot:
     entries: dict[str, RegistryEntry] = field(default_factory=dict)
     # Base path for resolving relative artifact_root
     _base_path: Path = field(default_factory=Path.cwd, repr=False)
+    # Resolved paths by URI; loaders resolve the same URIs on every run
+    _path_cache: dict[str, Path] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def get(self, semantic_id: str) -> RegistryEntry:
         """
@@ -86,17 +92,23 @@ class RegistrySnapshot:
         Returns:
             Absolute path to the artifact.
         """
+        path = self._path_cache.get(uri)
+        if path is not None:
+            return path
+
         # Check if absolute
         if uri.startswith("/") or "://" in uri:
-            return Path(uri)
-
-        # Resolve relative to artifact_root
-        if self.artifact_root.startswith("/"):
-            root = Path(self.artifact_root)
+            path = Path(uri)
         else:
-            root = self._base_path / self.artifact_root
+            # Resolve relative to artifact_root
+            if self.artifact_root.startswith("/"):
+                root = Path(self.artifact_root)
+            else:
+                root = self._base_path / self.artifact_root
+            path = root / uri
 
-        return root / uri
+        self._path_cache[uri] = path
+        return path
 
     def resolve_entry_path(self, entry: RegistryEntry) -> Path:
         """Resolve the main payload path for an entry."""
@@ -109,6 +121,16 @@ class RegistrySnapshot:
         return None
 
 
+def _intern(value: Any) -> Any:
+    """Intern registry vocabulary strings (formats, specs, artifact types).
+
+    These come from a small fixed set but are parsed fresh for every entry;
+    interning shares one object per value and lets the loaders' equality
+    and membership checks succeed on identity.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 def load_registry(path: str | Path) -> RegistrySnapshot:
     """
     Load an AARC v1.1 registry from JSON file.
@@ -125,8 +147,8 @@ def load_registry(path: str | Path) -> RegistrySnapshot:
     path = Path(path)
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = loads(f.read())
     except FileNotFoundError:
         raise RegistryError(f"Registry file not found: {path}")
     except json.JSONDecodeError as e:
@@ -174,15 +196,15 @@ def load_registry(path: str | Path) -> RegistrySnapshot:
 
             entry = RegistryEntry(
                 id=e["id"],
-                artifact_type=e["artifact_type"],
-                format=e["format"],
-                spec=e["spec"],
+                artifact_type=_intern(e["artifact_type"]),
+                format=_intern(e["format"]),
+                spec=_intern(e["spec"]),
                 uri=e["uri"],
                 sha256=e["sha256"],
                 origin_producer=producer,
                 meta_uri=e.get("meta_uri"),
                 meta_sha256=e.get("meta_sha256"),
-                meta_spec=e.get("meta_spec"),
+                meta_spec=_intern(e.get("meta_spec")),
                 related=e.get("related"),
                 meta=e.get("meta"),
             )
@@ -208,3 +230,52 @@ def load_registry(path: str | Path) -> RegistrySnapshot:
         entries=entries_map,
         _base_path=path.parent,
     )
+
+
+# Parsed registries keyed by (resolved path, path as given)
+# -> ((mtime_ns, size), snapshot)
+_REGISTRY_CACHE: dict[tuple[str, str], tuple[tuple[int, int], RegistrySnapshot]] = {}
+
+
+def clear_registry_cache() -> None:
+    """Clear the parsed registry cache."""
+    _REGISTRY_CACHE.clear()
+
+
+def load_registry_cached(path: str | Path) -> RegistrySnapshot:
+    """
+    Load an AARC v1.1 registry, reusing the parsed snapshot when unchanged.
+
+    Snapshots are cached per registry file and reused while its
+    modification time and size are unchanged, so resolving many documents
+    against one registry parses it only once. An edited file replaces its
+    cache entry. The path as given is part of the key because artifact
+    URIs resolve relative to it (a symlinked registry resolves against the
+    symlink's directory, exactly as with ``load_registry``).
+    Callers must treat the returned snapshot as read-only.
+
+    Args:
+        path: Path to registry JSON file.
+
+    Returns:
+        RegistrySnapshot instance.
+
+    Raises:
+        RegistryError: If file cannot be loaded or is invalid.
+    """
+    path = Path(path)
+    resolved = path.resolve()
+    try:
+        st = os.stat(resolved)
+    except FileNotFoundError:
+        raise RegistryError(f"Registry file not found: {path}")
+
+    key = (str(resolved), str(path))
+    token = (st.st_mtime_ns, st.st_size)
+    cached = _REGISTRY_CACHE.get(key)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    snapshot = load_registry(path)
+    _REGISTRY_CACHE[key] = (token, snapshot)
+    return snapshot
@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+from ._json import loads
 from .config import ResolutionConfig
 from .registry import RegistrySnapshot, RegistryEntry
 from .plan import ResolutionPlan, ResolutionItem
+from .apply import _item_key
+from .loaders.base import _sha256_open_file
+
+
+# Plans at least this large build item reports on a thread pool
+_PARALLEL_REPORT_MIN_ITEMS = 4
+_PARALLEL_REPORT_MAX_WORKERS = 16
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemReport:
     """Report for a single resolution item."""
 
@@ -46,8 +63,39 @@ class ItemReport:
     status: str = "pending"  # "pending", "success", "failed", "skipped"
     error_message: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "semantic_id": self.semantic_id,
+            "artifact_type": self.artifact_type,
+            "spec": self.spec,
+            "uri": self.uri,
+            "resolved_path": self.resolved_path,
+            "hash": {
+                "expected": self.expected_hash,
+                "actual": self.actual_hash,
+                "verified": self.hash_verified,
+                "match": self.hash_match,
+            },
+            "validation": {
+                "passed": self.validation_passed,
+                "errors": self.validation_errors,
+            },
+            "payload": {
+                "size_bytes": self.payload_size_bytes,
+                "summary": self.payload_summary,
+            },
+            "timing_ms": {
+                "load": self.load_time_ms,
+                "validate": self.validate_time_ms,
+                "emit": self.emit_time_ms,
+            },
+            "status": self.status,
+            "error": self.error_message,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class ResolutionReport:
     """Complete resolution report."""
 
@@ -95,49 +143,24 @@ class ResolutionReport:
                 "all_hashes_verified": self.all_hashes_verified,
                 "all_validations_passed": self.all_validations_passed,
             },
-            "items": [
-                {
-                    "semantic_id": item.semantic_id,
-                    "artifact_type": item.artifact_type,
-                    "spec": item.spec,
-                    "uri": item.uri,
-                    "resolved_path": item.resolved_path,
-                    "hash": {
-                        "expected": item.expected_hash,
-                        "actual": item.actual_hash,
-                        "verified": item.hash_verified,
-                        "match": item.hash_match,
-                    },
-                    "validation": {
-                        "passed": item.validation_passed,
-                        "errors": item.validation_errors,
-                    },
-                    "payload": {
-                        "size_bytes": item.payload_size_bytes,
-                        "summary": item.payload_summary,
-                    },
-                    "timing_ms": {
-                        "load": item.load_time_ms,
-                        "validate": item.validate_time_ms,
-                        "emit": item.emit_time_ms,
-                    },
-                    "status": item.status,
-                    "error": item.error_message,
-                }
-                for item in self.items
-            ],
+            "items": [item.to_dict() for item in self.items],
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to indented UTF-8 JSON bytes with a trailing newline.
 
-def _compute_file_hash(path: Path) -> str | None:
-    """Compute SHA256 hash of a file."""
-    if not path.exists():
-        return None
-    sha = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha.update(chunk)
-    return f"sha256:{sha.hexdigest()}"
+        Uses orjson when available, which encodes the ``to_dict()`` tree in
+        one C pass instead of building an intermediate string.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            except TypeError:
+                # Types orjson rejects (e.g. >64-bit ints): use stdlib behaviour
+                pass
+        return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def _summarize_metric_payload(payload: dict) -> dict:
@@ -162,44 +185,53 @@ def _summarize_simple_table_payload(payload: dict) -> dict:
     }
 
 
+def _count_rows(section: Any, rows_index: int) -> int:
+    """Count rows in a Pandoc TableHead/TableBody whose rows are at c[rows_index]."""
+    if isinstance(section, dict):
+        c = section.get("c", ())
+        if len(c) > rows_index:
+            return len(c[rows_index])
+    return 0
+
+
 def _summarize_pandoc_table_payload(payload: dict) -> dict:
     """Extract summary info from Pandoc table payload."""
     c = payload.get("c", [])
     if len(c) >= 6:
-        col_specs = c[2] if len(c) > 2 else []
-        table_head = c[3] if len(c) > 3 else {}
-        table_bodies = c[4] if len(c) > 4 else []
-
-        # Count rows
-        head_rows = 0
-        if isinstance(table_head, dict):
-            head_c = table_head.get("c", [])
-            if len(head_c) >= 2:
-                head_rows = len(head_c[1])
-
-        body_rows = 0
-        for body in table_bodies:
-            if isinstance(body, dict):
-                body_c = body.get("c", [])
-                if len(body_c) >= 4:
-                    body_rows += len(body_c[3])
-
+        col_specs, table_head, table_bodies = c[2], c[3], c[4]
         return {
             "num_columns": len(col_specs),
-            "num_head_rows": head_rows,
-            "num_body_rows": body_rows,
+            "num_head_rows": _count_rows(table_head, 1),
+            "num_body_rows": sum(_count_rows(body, 3) for body in table_bodies),
         }
     return {"type": payload.get("t")}
 
 
-def _summarize_figure_meta(meta: dict | None, image_path: Path) -> dict:
-    """Extract summary info from figure metadata."""
+def _summarize_figure_meta(
+    meta: dict | None,
+    image_path: Path,
+    image_size: int | None = None,
+) -> dict:
+    """
+    Extract summary info from figure metadata.
+
+    Args:
+        meta: Parsed sidecar metadata, if any.
+        image_path: Path to the figure image.
+        image_size: Image size when the caller already has it; avoids
+            stat'ing the image again.
+    """
+    if image_size is None and image_path:
+        try:
+            image_size = image_path.stat().st_size
+        except FileNotFoundError:
+            pass
     summary = {
-        "image_exists": image_path.exists() if image_path else False,
+        "image_exists": image_size is not None,
         "image_format": image_path.suffix if image_path else None,
     }
-    if image_path and image_path.exists():
-        summary["image_size_bytes"] = image_path.stat().st_size
+    if image_size is not None:
+        summary["image_size_bytes"] = image_size
 
     if meta:
         summary["has_caption"] = "caption" in meta
@@ -209,15 +241,32 @@ def _summarize_figure_meta(meta: dict | None, image_path: Path) -> dict:
     return summary
 
 
+# Summarizers for specs whose payload is JSON, keyed by spec
+_JSON_SUMMARIZERS = {
+    "metric.json@v1": _summarize_metric_payload,
+    "table.simple.json@v1": _summarize_simple_table_payload,
+    "table.pandoc.json@v1": _summarize_pandoc_table_payload,
+}
+
+
 def build_item_report(
     item: ResolutionItem,
     registry: RegistrySnapshot,
     config: ResolutionConfig,
     load_payloads: bool = True,
+    verify_hashes: bool = True,
 ) -> ItemReport:
-    """Build a report for a single resolution item."""
-    import json
-
+    """
+    Build a report for a single resolution item.
+
+    Args:
+        item: Plan item to report on.
+        registry: Registry for path resolution.
+        config: Resolution configuration.
+        load_payloads: Parse payloads to fill ``payload_summary``.
+        verify_hashes: Hash payloads against the registry. When False only
+            existence and size are checked and ``hash_verified`` is False.
+    """
     entry = item.entry
     path = registry.resolve_entry_path(entry)
 
@@ -230,41 +279,54 @@ def build_item_report(
         expected_hash=entry.sha256,
     )
 
-    # Compute actual hash
-    if path.exists():
-        report.actual_hash = _compute_file_hash(path)
+    # Open the payload once: existence, size, hash and parsing share it
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        report.hash_verified = False
+        report.hash_match = False
+        return report
+
+    with f:
+        if entry.spec in _JSON_SUMMARIZERS and (verify_hashes or load_payloads):
+            data = f.read()
+            report.payload_size_bytes = len(data)
+            if verify_hashes:
+                report.actual_hash = "sha256:" + hashlib.sha256(data).hexdigest()
+        else:
+            # Binary payloads are only hashed: mmap or stream them by size
+            # instead of holding them in memory
+            report.payload_size_bytes = os.fstat(f.fileno()).st_size
+            if verify_hashes:
+                report.actual_hash = _sha256_open_file(f, report.payload_size_bytes)
+
+    if verify_hashes:
         report.hash_verified = True
         report.hash_match = report.actual_hash == report.expected_hash
-        report.payload_size_bytes = path.stat().st_size
-
-        # Load and summarize payload
-        if load_payloads:
-            try:
-                if entry.spec == "metric.json@v1":
-                    with open(path, "r", encoding="utf-8") as f:
-                        payload = json.load(f)
-                    report.payload_summary = _summarize_metric_payload(payload)
-                elif entry.spec == "table.simple.json@v1":
-                    with open(path, "r", encoding="utf-8") as f:
-                        payload = json.load(f)
-                    report.payload_summary = _summarize_simple_table_payload(payload)
-                elif entry.spec == "table.pandoc.json@v1":
-                    with open(path, "r", encoding="utf-8") as f:
-                        payload = json.load(f)
-                    report.payload_summary = _summarize_pandoc_table_payload(payload)
-                elif entry.spec == "figure.binary@v1":
-                    # Load sidecar meta if exists
-                    meta = None
-                    meta_path = registry.resolve_meta_path(entry)
-                    if meta_path and meta_path.exists():
-                        with open(meta_path, "r", encoding="utf-8") as f:
-                            meta = json.load(f)
-                    report.payload_summary = _summarize_figure_meta(meta, path)
-            except Exception as e:
-                report.payload_summary = {"error": str(e)}
     else:
         report.hash_verified = False
-        report.hash_match = False
+
+    # Load and summarize payload
+    if load_payloads:
+        try:
+            summarizer = _JSON_SUMMARIZERS.get(entry.spec)
+            if summarizer is not None:
+                report.payload_summary = summarizer(loads(data))
+            elif entry.spec == "figure.binary@v1":
+                # Load sidecar meta if exists
+                meta = None
+                meta_path = registry.resolve_meta_path(entry)
+                if meta_path:
+                    try:
+                        with open(meta_path, "rb") as f:
+                            meta = loads(f.read())
+                    except FileNotFoundError:
+                        pass
+                report.payload_summary = _summarize_figure_meta(
+                    meta, path, report.payload_size_bytes
+                )
+        except Exception as e:
+            report.payload_summary = {"error": str(e)}
 
     return report
 
@@ -273,12 +335,21 @@ def build_resolution_report(
     plan: ResolutionPlan,
     registry: RegistrySnapshot,
     config: ResolutionConfig,
+    verify_hashes: bool = True,
 ) -> ResolutionReport:
     """
     Build a resolution report from a plan.
 
     This creates a report without actually applying resolution,
     useful for pre-flight checks.
+
+    Args:
+        plan: Resolution plan to report on.
+        registry: Registry for path resolution.
+        config: Resolution configuration.
+        verify_hashes: Hash every payload. Pass False for a fast pre-flight
+            that only checks existence and size; ``all_hashes_verified``
+            is then False.
     """
     report = ResolutionReport(
         config_target=config.target,
@@ -292,10 +363,43 @@ def build_resolution_report(
     all_hashes_match = True
     all_valid = True
 
+    # An artifact referenced several times is read and hashed once; later
+    # occurrences get a copy of the first item report.
+    unique: dict[tuple[str, str, str], ResolutionItem] = {}
+    for item in plan:
+        unique.setdefault(_item_key(item), item)
+    items = list(unique.values())
+
+    # Item reports are I/O bound (open, read, hash) and independent, so
+    # larger plans overlap them on threads; map() keeps plan order.
+    if len(items) < _PARALLEL_REPORT_MIN_ITEMS:
+        item_reports = [
+            build_item_report(item, registry, config, verify_hashes=verify_hashes)
+            for item in items
+        ]
+    else:
+        workers = min(_PARALLEL_REPORT_MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            item_reports = list(
+                executor.map(
+                    lambda item: build_item_report(
+                        item, registry, config, verify_hashes=verify_hashes
+                    ),
+                    items,
+                )
+            )
+
+    reports_by_key = dict(zip(unique, item_reports))
+    seen: set[tuple[str, str, str]] = set()
     for item in plan:
-        item_report = build_item_report(item, registry, config)
+        key = _item_key(item)
+        item_report = reports_by_key[key]
+        if key in seen:
+            item_report = copy.deepcopy(item_report)
+        seen.add(key)
         report.items.append(item_report)
 
+    for item_report in report.items:
         if not item_report.hash_match:
             all_hashes_match = False
 
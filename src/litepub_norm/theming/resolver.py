@@ -60,10 +60,8 @@ def _compute_file_hash(path: Path) -> str:
     """Compute SHA256 hash of a file."""
     if not path.exists():
         return ""
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+        h = hashlib.file_digest(f, "sha256")
     return f"sha256:{h.hexdigest()[:16]}"
 
 
@@ -14,14 +14,14 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from .errors import ValidationError
-from ..resolver.config import ResolutionConfig, BuildTarget
+from ..resolver.config import ResolutionConfig, BuildTarget, _DEFAULT_CONFIG
 from .pandoc_walk import walk_pandoc, WalkContext, NodeContext
 
 # Placeholder pattern
 PLACEHOLDER_PATTERN = re.compile(r"\[\[COMPUTED:(METRIC|TABLE|FIGURE)\]\]")
 
 # Types that indicate raw content
-RAW_TYPES = {"RawInline", "RawBlock"}
+RAW_TYPES = frozenset({"RawInline", "RawBlock"})
 
 
 @dataclass
@@ -67,7 +67,7 @@ def validate_resolved_document(
         ValidationError: If fail_fast=True and validation fails.
     """
     result = DocumentValidationResult()
-    config = config or ResolutionConfig()
+    config = config or _DEFAULT_CONFIG
 
     blocks = ast.get("blocks", [])
     if not isinstance(blocks, list):
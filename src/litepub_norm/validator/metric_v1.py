@@ -13,6 +13,9 @@ _FORMAT_TOKENS = frozenset(["value", "unit"])
 _FORMAT_PATTERN = re.compile(r"\{(\w+)\}")
 _MAX_FORMAT_LEN = 200
 
+# Hoisted so the hot path doesn't build the tuple on every call
+_NUMERIC_TYPES = (int, float)
+
 
 def validate_metric_v1(
     payload: dict[str, Any],
@@ -74,7 +77,7 @@ def validate_metric_v1(
             hint="Use a numeric value (int or float), not True/False",
         )
 
-    if not isinstance(value, (int, float)):
+    if not isinstance(value, _NUMERIC_TYPES):
         raise ValidationError(
             "Metric.value must be a number",
             code="VAL_METRIC_VALUE_TYPE",
@@ -123,10 +126,11 @@ def validate_metric_v1(
             )
 
         if strict_format:
-            # Check for allowed tokens only
-            tokens = _FORMAT_PATTERN.findall(fmt)
-            invalid_tokens = set(tokens) - _FORMAT_TOKENS
-            if invalid_tokens:
+            # Check for allowed tokens only; the common valid case needs
+            # no set, which is built only to report the offending tokens
+            tokens = _FORMAT_PATTERN.findall(fmt) if "{" in fmt else ()
+            if not _FORMAT_TOKENS.issuperset(tokens):
+                invalid_tokens = set(tokens) - _FORMAT_TOKENS
                 raise ValidationError(
                     f"Metric.format contains disallowed tokens: {invalid_tokens}",
                     code="VAL_METRIC_FORMAT_INVALID_TOKEN",
@@ -6,9 +6,8 @@ ensuring no content can bypass validation by being nested in untraversed nodes.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Callable, Iterator
+from typing import Any, Callable, Iterator, NamedTuple
 
 from .errors import ValidationError
 
@@ -21,16 +20,33 @@ class NodeContext(Enum):
     META = auto()
 
 
-@dataclass(frozen=True)
-class WalkContext:
-    """Context passed to walker callbacks."""
+# Unformatted AST path: the root path string, or a (parent, segment) link
+# where segment is "c" (node content) or an int (list index). Extending a
+# path is O(1) and shares the ancestor prefix; see _format_path.
+AstPath = Any
+
+# (child, context, path) triples produced by a child extractor
+ChildList = list[tuple[Any, NodeContext, AstPath]]
+
+
+class WalkContext(NamedTuple):
+    """Context passed to walker callbacks.
+
+    A NamedTuple rather than a dataclass: one is built for every visited
+    node, and tuple allocation is much cheaper than a frozen dataclass init.
+    """
 
     semantic_id: str
     node_type: str
     context: NodeContext
-    path: str  # e.g., "Table.c[4][0].c[3][0].c[1][0]"
+    location: AstPath
     depth: int
 
+    @property
+    def path(self) -> str:
+        """Formatted path, e.g. "Table.c[4][0].c[3][0].c[1][0]"."""
+        return _format_path(self.location)
+
 
 # Node type classification for traversal
 # Based on pandoc-types: https://hackage.haskell.org/package/pandoc-types
@@ -90,9 +106,31 @@ TABLE_TYPES = {
 CAPTION_STRUCTURE = ["ShortCaption", "[Block]"]
 
 # All node types
-ALL_BLOCK_TYPES = set(BLOCK_TYPES.keys())
-ALL_INLINE_TYPES = set(INLINE_TYPES.keys())
-ALL_TABLE_TYPES = set(TABLE_TYPES.keys())
+ALL_BLOCK_TYPES = frozenset(BLOCK_TYPES)
+ALL_INLINE_TYPES = frozenset(INLINE_TYPES)
+ALL_TABLE_TYPES = frozenset(TABLE_TYPES)
+
+
+# Deepest nesting accepted before the walk is aborted
+_MAX_DEPTH = 100
+
+
+def _format_path(path: AstPath) -> str:
+    """Join an unformatted AST path into its display form."""
+    segments = []
+    while isinstance(path, tuple):
+        path, segment = path
+        segments.append(segment)
+
+    parts = [path] if path else []
+    for segment in reversed(segments):
+        if isinstance(segment, int):
+            parts.append(f"[{segment}]")
+        elif parts:
+            parts.append(f".{segment}")
+        else:
+            parts.append(segment)
+    return "".join(parts)
 
 
 def walk_pandoc(
@@ -105,9 +143,13 @@ def walk_pandoc(
     depth: int = 0,
 ) -> None:
     """
-    Walk a Pandoc AST node recursively, calling callback on every node.
+    Walk a Pandoc AST node, calling callback on every node.
 
     This ensures complete traversal - no content can be hidden in unvisited nodes.
+    Nodes are visited depth-first in document order. The walk uses an
+    explicit stack rather than recursion, so it costs no Python frame per
+    node and is independent of the interpreter's recursion limit. Paths are
+    only formatted when a callback reads ``ctx.path`` or an error is raised.
 
     Args:
         node: The AST node to walk.
@@ -115,264 +157,256 @@ def walk_pandoc(
         semantic_id: Semantic ID for error messages.
         context: Whether we're in block or inline context.
         path: Path to this node for error messages.
-        depth: Current recursion depth.
+        depth: Starting nesting depth.
     """
-    if depth > 100:
-        raise ValidationError(
-            "AST nesting too deep (>100 levels)",
-            code="VAL_PANDOC_TOO_DEEP",
-            semantic_id=semantic_id,
-            ast_path=path,
-        )
-
-    if node is None:
-        return
-
-    # Handle lists
-    if isinstance(node, list):
-        for i, item in enumerate(node):
-            item_path = f"{path}[{i}]"
-            walk_pandoc(item, callback, semantic_id, context=context, path=item_path, depth=depth + 1)
-        return
-
-    # Handle primitives
-    if isinstance(node, (str, int, float, bool)):
-        return
-
-    # Handle dict nodes (the main Pandoc AST structure)
-    if isinstance(node, dict):
-        node_type = node.get("t", "")
+    stack: list[tuple[Any, NodeContext, AstPath, int]] = [(node, context, path, depth)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        node, context, path, depth = pop()
+
+        if depth > _MAX_DEPTH:
+            raise ValidationError(
+                "AST nesting too deep (>100 levels)",
+                code="VAL_PANDOC_TOO_DEEP",
+                semantic_id=semantic_id,
+                ast_path=_format_path(path),
+            )
+
+        # Handle lists: push items in reverse so they pop in order
+        if isinstance(node, list):
+            for i in range(len(node) - 1, -1, -1):
+                push((node[i], context, (path, i), depth + 1))
+            continue
+
+        # Only dicts are AST nodes; None and primitives have nothing to visit
+        if not isinstance(node, dict):
+            continue
 
-        # Build context for callback
-        walk_ctx = WalkContext(
-            semantic_id=semantic_id,
-            node_type=node_type,
-            context=context,
-            path=path,
-            depth=depth,
-        )
+        node_type = node.get("t", "")
 
-        # Call the callback
-        callback(node, walk_ctx)
+        # Call the callback (positional args: cheapest NamedTuple construction)
+        callback(node, WalkContext(semantic_id, node_type, context, path, depth))
 
         # Get content to traverse
         content = node.get("c")
         if content is None:
-            return
-
-        # Determine context for children
-        child_context = context
-        if node_type in ALL_BLOCK_TYPES:
-            child_context = NodeContext.BLOCK
-        elif node_type in ALL_INLINE_TYPES:
-            child_context = NodeContext.INLINE
-
-        # Traverse based on node type
-        content_path = f"{path}.c" if path else "c"
-
-        if node_type in ("Plain", "Para"):
-            # [Inline]
-            walk_pandoc(content, callback, semantic_id, context=NodeContext.INLINE, path=content_path, depth=depth + 1)
-
-        elif node_type == "LineBlock":
-            # [[Inline]]
-            for i, line in enumerate(content):
-                walk_pandoc(line, callback, semantic_id, context=NodeContext.INLINE, path=f"{content_path}[{i}]", depth=depth + 1)
-
-        elif node_type == "BlockQuote":
-            # [Block]
-            walk_pandoc(content, callback, semantic_id, context=NodeContext.BLOCK, path=content_path, depth=depth + 1)
-
-        elif node_type in ("BulletList",):
-            # [[Block]]
-            for i, item in enumerate(content):
-                walk_pandoc(item, callback, semantic_id, context=NodeContext.BLOCK, path=f"{content_path}[{i}]", depth=depth + 1)
-
-        elif node_type == "OrderedList":
-            # [ListAttributes, [[Block]]]
-            if len(content) >= 2:
-                items = content[1]
-                for i, item in enumerate(items):
-                    walk_pandoc(item, callback, semantic_id, context=NodeContext.BLOCK, path=f"{content_path}[1][{i}]", depth=depth + 1)
-
-        elif node_type == "DefinitionList":
-            # [([Inline], [[Block]])]
-            for i, (term, defs) in enumerate(content):
-                walk_pandoc(term, callback, semantic_id, context=NodeContext.INLINE, path=f"{content_path}[{i}][0]", depth=depth + 1)
-                for j, def_blocks in enumerate(defs):
-                    walk_pandoc(def_blocks, callback, semantic_id, context=NodeContext.BLOCK, path=f"{content_path}[{i}][1][{j}]", depth=depth + 1)
-
-        elif node_type == "Header":
-            # [Int, Attr, [Inline]]
-            if len(content) >= 3:
-                walk_pandoc(content[2], callback, semantic_id, context=NodeContext.INLINE, path=f"{content_path}[2]", depth=depth + 1)
-
-        elif node_type == "Table":
-            # [Attr, Caption, [ColSpec], TableHead, [TableBody], TableFoot]
-            _walk_table(content, callback, semantic_id, content_path, depth)
-
-        elif node_type == "Figure":
-            # [Attr, Caption, [Block]]
-            if len(content) >= 3:
-                # Caption: [ShortCaption, [Block]]
-                if len(content[1]) >= 2:
-                    walk_pandoc(content[1][1], callback, semantic_id, context=NodeContext.BLOCK, path=f"{content_path}[1][1]", depth=depth + 1)
-                # Figure content
-                walk_pandoc(content[2], callback, semantic_id, context=NodeContext.BLOCK, path=f"{content_path}[2]", depth=depth + 1)
-
-        elif node_type == "Div":
-            # [Attr, [Block]]
-            if len(content) >= 2:
-                walk_pandoc(content[1], callback, semantic_id, context=NodeContext.BLOCK, path=f"{content_path}[1]", depth=depth + 1)
-
-        # Inline types with nested content
-        elif node_type in ("Emph", "Underline", "Strong", "Strikeout", "Superscript", "Subscript", "SmallCaps"):
-            # [Inline]
-            walk_pandoc(content, callback, semantic_id, context=NodeContext.INLINE, path=content_path, depth=depth + 1)
-
-        elif node_type == "Quoted":
-            # [QuoteType, [Inline]]
-            if len(content) >= 2:
-                walk_pandoc(content[1], callback, semantic_id, context=NodeContext.INLINE, path=f"{content_path}[1]", depth=depth + 1)
-
-        elif node_type == "Cite":
-            # [[Citation], [Inline]]
-            if len(content) >= 2:
-                walk_pandoc(content[1], callback, semantic_id, context=NodeContext.INLINE, path=f"{content_path}[1]", depth=depth + 1)
-
-        elif node_type in ("Link", "Image"):
-            # [Attr, [Inline], Target]
-            if len(content) >= 2:
-                walk_pandoc(content[1], callback, semantic_id, context=NodeContext.INLINE, path=f"{content_path}[1]", depth=depth + 1)
-
-        elif node_type == "Note":
-            # [Block]
-            walk_pandoc(content, callback, semantic_id, context=NodeContext.BLOCK, path=content_path, depth=depth + 1)
-
-        elif node_type == "Span":
-            # [Attr, [Inline]]
-            if len(content) >= 2:
-                walk_pandoc(content[1], callback, semantic_id, context=NodeContext.INLINE, path=f"{content_path}[1]", depth=depth + 1)
-
-        # Table structure types
-        elif node_type in ("TableHead", "TableFoot"):
-            _walk_table_head_foot(content, callback, semantic_id, content_path, depth)
-
-        elif node_type == "TableBody":
-            _walk_table_body(content, callback, semantic_id, content_path, depth)
-
-        elif node_type == "Row":
-            _walk_row(content, callback, semantic_id, content_path, depth)
-
-        elif node_type == "Cell":
-            _walk_cell(content, callback, semantic_id, content_path, depth)
-
-
-def _walk_table(
-    content: list,
-    callback: Callable[[Any, WalkContext], None],
-    semantic_id: str,
-    path: str,
-    depth: int,
-) -> None:
-    """Walk a Table's content array."""
+            continue
+
+        extractor = _CHILD_EXTRACTORS.get(node_type)
+        if extractor is None:
+            continue
+
+        for child, child_context, child_path in reversed(extractor(content, (path, "c"))):
+            push((child, child_context, child_path, depth + 1))
+
+
+def _inline_content(content: Any, path: AstPath) -> ChildList:
+    """Content is [Inline] (Plain, Para, Emph, Strong, ...)."""
+    return [(content, NodeContext.INLINE, path)]
+
+
+def _block_content(content: Any, path: AstPath) -> ChildList:
+    """Content is [Block] (BlockQuote, Note)."""
+    return [(content, NodeContext.BLOCK, path)]
+
+
+def _line_block_children(content: list, path: AstPath) -> ChildList:
+    """LineBlock content: [[Inline]]."""
+    return [(line, NodeContext.INLINE, (path, i)) for i, line in enumerate(content)]
+
+
+def _bullet_list_children(content: list, path: AstPath) -> ChildList:
+    """BulletList content: [[Block]]."""
+    return [(item, NodeContext.BLOCK, (path, i)) for i, item in enumerate(content)]
+
+
+def _ordered_list_children(content: list, path: AstPath) -> ChildList:
+    """OrderedList content: [ListAttributes, [[Block]]]."""
+    if len(content) < 2:
+        return []
+    items_path = (path, 1)
+    return [(item, NodeContext.BLOCK, (items_path, i)) for i, item in enumerate(content[1])]
+
+
+def _definition_list_children(content: list, path: AstPath) -> ChildList:
+    """DefinitionList content: [([Inline], [[Block]])]."""
+    children = []
+    for i, (term, defs) in enumerate(content):
+        item_path = (path, i)
+        children.append((term, NodeContext.INLINE, (item_path, 0)))
+        defs_path = (item_path, 1)
+        for j, def_blocks in enumerate(defs):
+            children.append((def_blocks, NodeContext.BLOCK, (defs_path, j)))
+    return children
+
+
+def _header_children(content: list, path: AstPath) -> ChildList:
+    """Header content: [Int, Attr, [Inline]]."""
+    if len(content) < 3:
+        return []
+    return [(content[2], NodeContext.INLINE, (path, 2))]
+
+
+def _figure_children(content: list, path: AstPath) -> ChildList:
+    """Figure content: [Attr, Caption, [Block]]."""
+    if len(content) < 3:
+        return []
+
+    children = []
+    # Caption: [ShortCaption, [Block]]
+    if len(content[1]) >= 2:
+        children.append((content[1][1], NodeContext.BLOCK, ((path, 1), 1)))
+    # Figure content
+    children.append((content[2], NodeContext.BLOCK, (path, 2)))
+    return children
+
+
+def _div_children(content: list, path: AstPath) -> ChildList:
+    """Div content: [Attr, [Block]]."""
+    if len(content) < 2:
+        return []
+    return [(content[1], NodeContext.BLOCK, (path, 1))]
+
+
+def _second_inline_children(content: list, path: AstPath) -> ChildList:
+    """Content whose [Inline] is the second element.
+
+    Quoted: [QuoteType, [Inline]]; Cite: [[Citation], [Inline]];
+    Link/Image: [Attr, [Inline], Target]; Span: [Attr, [Inline]].
+    """
+    if len(content) < 2:
+        return []
+    return [(content[1], NodeContext.INLINE, (path, 1))]
+
+
+def _table_children(content: list, path: AstPath) -> ChildList:
+    """Children of a Table's content array."""
     if len(content) < 6:
-        return
+        return []
+
+    children = []
 
     # c[1]: Caption [ShortCaption, [Block]]
     caption = content[1]
     if isinstance(caption, list) and len(caption) >= 2:
-        walk_pandoc(caption[1], callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[1][1]", depth=depth + 1)
+        children.append((caption[1], NodeContext.BLOCK, ((path, 1), 1)))
 
     # c[3]: TableHead
     table_head = content[3]
     if isinstance(table_head, dict):
-        walk_pandoc(table_head, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[3]", depth=depth + 1)
+        children.append((table_head, NodeContext.BLOCK, (path, 3)))
 
     # c[4]: [TableBody]
     table_bodies = content[4]
     if isinstance(table_bodies, list):
+        bodies_path = (path, 4)
         for i, body in enumerate(table_bodies):
-            walk_pandoc(body, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[4][{i}]", depth=depth + 1)
+            children.append((body, NodeContext.BLOCK, (bodies_path, i)))
 
     # c[5]: TableFoot
     table_foot = content[5]
     if isinstance(table_foot, dict):
-        walk_pandoc(table_foot, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[5]", depth=depth + 1)
+        children.append((table_foot, NodeContext.BLOCK, (path, 5)))
 
+    return children
 
-def _walk_table_head_foot(
-    content: list,
-    callback: Callable[[Any, WalkContext], None],
-    semantic_id: str,
-    path: str,
-    depth: int,
-) -> None:
-    """Walk TableHead or TableFoot content: [Attr, [Row]]."""
+
+def _table_head_foot_children(content: list, path: AstPath) -> ChildList:
+    """Children of TableHead or TableFoot content: [Attr, [Row]]."""
     if len(content) < 2:
-        return
+        return []
 
     rows = content[1]
-    if isinstance(rows, list):
-        for i, row in enumerate(rows):
-            walk_pandoc(row, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[1][{i}]", depth=depth + 1)
+    if not isinstance(rows, list):
+        return []
+    rows_path = (path, 1)
+    return [(row, NodeContext.BLOCK, (rows_path, i)) for i, row in enumerate(rows)]
 
 
-def _walk_table_body(
-    content: list,
-    callback: Callable[[Any, WalkContext], None],
-    semantic_id: str,
-    path: str,
-    depth: int,
-) -> None:
-    """Walk TableBody content: [Attr, RowHeadColumns, [Row], [Row]]."""
+def _table_body_children(content: list, path: AstPath) -> ChildList:
+    """Children of TableBody content: [Attr, RowHeadColumns, [Row], [Row]]."""
     if len(content) < 4:
-        return
+        return []
+
+    children = []
 
     # Intermediate head rows
     intermediate_rows = content[2]
     if isinstance(intermediate_rows, list):
+        rows_path = (path, 2)
         for i, row in enumerate(intermediate_rows):
-            walk_pandoc(row, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[2][{i}]", depth=depth + 1)
+            children.append((row, NodeContext.BLOCK, (rows_path, i)))
 
     # Body rows
     body_rows = content[3]
     if isinstance(body_rows, list):
+        rows_path = (path, 3)
         for i, row in enumerate(body_rows):
-            walk_pandoc(row, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[3][{i}]", depth=depth + 1)
+            children.append((row, NodeContext.BLOCK, (rows_path, i)))
 
+    return children
 
-def _walk_row(
-    content: list,
-    callback: Callable[[Any, WalkContext], None],
-    semantic_id: str,
-    path: str,
-    depth: int,
-) -> None:
-    """Walk Row content: [Attr, [Cell]]."""
+
+def _row_children(content: list, path: AstPath) -> ChildList:
+    """Children of Row content: [Attr, [Cell]]."""
     if len(content) < 2:
-        return
+        return []
 
     cells = content[1]
-    if isinstance(cells, list):
-        for i, cell in enumerate(cells):
-            walk_pandoc(cell, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[1][{i}]", depth=depth + 1)
+    if not isinstance(cells, list):
+        return []
+    cells_path = (path, 1)
+    return [(cell, NodeContext.BLOCK, (cells_path, i)) for i, cell in enumerate(cells)]
 
 
-def _walk_cell(
-    content: list,
-    callback: Callable[[Any, WalkContext], None],
-    semantic_id: str,
-    path: str,
-    depth: int,
-) -> None:
-    """Walk Cell content: [Attr, Alignment, RowSpan, ColSpan, [Block]]."""
+def _cell_children(content: list, path: AstPath) -> ChildList:
+    """Children of Cell content: [Attr, Alignment, RowSpan, ColSpan, [Block]]."""
     if len(content) < 5:
-        return
+        return []
 
     blocks = content[4]
-    if isinstance(blocks, list):
-        walk_pandoc(blocks, callback, semantic_id, context=NodeContext.BLOCK, path=f"{path}[4]", depth=depth + 1)
+    if not isinstance(blocks, list):
+        return []
+    return [(blocks, NodeContext.BLOCK, (path, 4))]
+
+
+# Child extractor per node type; types without nested content are absent
+_CHILD_EXTRACTORS: dict[str, Callable[[Any, AstPath], ChildList]] = {
+    # Blocks
+    "Plain": _inline_content,
+    "Para": _inline_content,
+    "LineBlock": _line_block_children,
+    "BlockQuote": _block_content,
+    "OrderedList": _ordered_list_children,
+    "BulletList": _bullet_list_children,
+    "DefinitionList": _definition_list_children,
+    "Header": _header_children,
+    "Table": _table_children,
+    "Figure": _figure_children,
+    "Div": _div_children,
+    # Inlines
+    "Emph": _inline_content,
+    "Underline": _inline_content,
+    "Strong": _inline_content,
+    "Strikeout": _inline_content,
+    "Superscript": _inline_content,
+    "Subscript": _inline_content,
+    "SmallCaps": _inline_content,
+    "Quoted": _second_inline_children,
+    "Cite": _second_inline_children,
+    "Link": _second_inline_children,
+    "Image": _second_inline_children,
+    "Span": _second_inline_children,
+    "Note": _block_content,
+    # Table structure
+    "TableHead": _table_head_foot_children,
+    "TableFoot": _table_head_foot_children,
+    "TableBody": _table_body_children,
+    "Row": _row_children,
+    "Cell": _cell_children,
+}
 
 
 def collect_all_types(node: Any, semantic_id: str) -> set[str]:
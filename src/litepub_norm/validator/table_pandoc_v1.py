@@ -16,13 +16,13 @@ from .pandoc_walk import (
 
 
 # Types that are never allowed in table payloads (safety policy)
-NEVER_ALLOWED_TYPES = {"Div"}
+NEVER_ALLOWED_TYPES = frozenset({"Div"})
 
 # Types that require explicit permission
-RAW_TYPES = {"RawInline", "RawBlock"}
+RAW_TYPES = frozenset({"RawInline", "RawBlock"})
 
 # Safe inline types for tables
-SAFE_INLINE_TYPES = {
+SAFE_INLINE_TYPES = frozenset({
     "Str",
     "Space",
     "SoftBreak",
@@ -42,10 +42,10 @@ SAFE_INLINE_TYPES = {
     "Quoted",
     "Cite",
     "Note",
-}
+})
 
 # Safe block types for table cells
-SAFE_BLOCK_TYPES = {
+SAFE_BLOCK_TYPES = frozenset({
     "Plain",
     "Para",
     "CodeBlock",
@@ -58,7 +58,10 @@ SAFE_BLOCK_TYPES = {
     "LineBlock",
     # Note: Table is excluded (no nested tables in cells)
     # Note: Figure is excluded (no figures in cells by default)
-}
+})
+
+# Table structure types that are part of the table itself, not content
+_TABLE_STRUCTURE_TYPES = frozenset({"Table", "TableHead", "TableBody", "TableFoot", "Row", "Cell"})
 
 
 def validate_table_pandoc_v1(
@@ -131,9 +134,6 @@ def validate_table_pandoc_v1(
     if allow_raw:
         allowed_inline_types.add("RawInline")
 
-    # Table structure types that are part of the table itself, not content
-    table_structure_types = {"Table", "TableHead", "TableBody", "TableFoot", "Row", "Cell"}
-
     # Define the safety check callback
     def safety_check(node: Any, ctx: WalkContext) -> None:
         node_type = ctx.node_type
@@ -141,7 +141,7 @@ def validate_table_pandoc_v1(
             return
 
         # Skip table structure types - they are validated separately
-        if node_type in table_structure_types:
+        if node_type in _TABLE_STRUCTURE_TYPES:
             return
 
         # Never allow Div in payloads (prevents wrapper smuggling)
@@ -234,7 +234,9 @@ def _validate_table_structure(
         )
 
     # Validate TableHead
-    _validate_table_section(table_head, "TableHead", num_cols, semantic_id, spec, check_geometry)
+    total_rows, total_cells = _validate_table_section(
+        table_head, "TableHead", num_cols, semantic_id, spec, check_geometry
+    )
 
     # Validate TableBody sections
     if not isinstance(table_bodies, list):
@@ -245,37 +247,17 @@ def _validate_table_structure(
             spec=spec,
         )
 
-    total_rows = 0
-    total_cells = 0
-
     for i, body in enumerate(table_bodies):
         rows, cells = _validate_table_body(body, i, num_cols, semantic_id, spec, check_geometry)
         total_rows += rows
         total_cells += cells
 
     # Validate TableFoot
-    _validate_table_section(table_foot, "TableFoot", num_cols, semantic_id, spec, check_geometry)
-
-    # Count rows from head/foot
-    if isinstance(table_head, dict):
-        head_rows = table_head.get("c", [None, []])[1]
-        if isinstance(head_rows, list):
-            total_rows += len(head_rows)
-            for row in head_rows:
-                if isinstance(row, dict):
-                    cells = row.get("c", [None, []])[1]
-                    if isinstance(cells, list):
-                        total_cells += len(cells)
-
-    if isinstance(table_foot, dict):
-        foot_rows = table_foot.get("c", [None, []])[1]
-        if isinstance(foot_rows, list):
-            total_rows += len(foot_rows)
-            for row in foot_rows:
-                if isinstance(row, dict):
-                    cells = row.get("c", [None, []])[1]
-                    if isinstance(cells, list):
-                        total_cells += len(cells)
+    rows, cells = _validate_table_section(
+        table_foot, "TableFoot", num_cols, semantic_id, spec, check_geometry
+    )
+    total_rows += rows
+    total_cells += cells
 
     # Apply size limits
     if limits:
@@ -309,8 +291,8 @@ def _validate_table_section(
     semantic_id: str,
     spec: str,
     check_geometry: bool,
-) -> None:
-    """Validate TableHead or TableFoot."""
+) -> tuple[int, int]:
+    """Validate TableHead or TableFoot. Returns (row_count, cell_count)."""
     if not isinstance(section, dict):
         raise ValidationError(
             f"{section_name} must be an object",
@@ -345,8 +327,11 @@ def _validate_table_section(
             spec=spec,
         )
 
+    cell_count = 0
     for i, row in enumerate(rows):
-        _validate_row(row, i, section_name, num_cols, semantic_id, spec, check_geometry)
+        cell_count += _validate_row(row, i, section_name, num_cols, semantic_id, spec, check_geometry)
+
+    return len(rows), cell_count
 
 
 def _validate_table_body(
@@ -12,6 +12,10 @@ from ..resolver.config import ResolutionLimits
 # Column key identifier pattern: alphanumeric + underscore, not starting with digit
 _KEY_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# Hoisted so per-cell checks don't build the tuples on every call
+_CELL_TYPES = (str, int, float, bool)
+_NUMERIC_TYPES = (int, float)
+
 
 def validate_table_simple_v1(
     payload: dict[str, Any],
@@ -182,6 +186,7 @@ def validate_table_simple_v1(
 
     # Validate rows
     column_key_set = set(column_keys)
+    num_columns = len(column_key_set)
 
     for i, row in enumerate(rows):
         if not isinstance(row, dict):
@@ -192,11 +197,13 @@ def validate_table_simple_v1(
                 spec=spec,
             )
 
-        row_keys = set(row.keys())
+        # Compare the keys view directly; no per-row set is built unless
+        # the row is actually invalid
+        row_keys = row.keys()
 
         # Check for extra keys (not in columns) - always forbidden
-        extra_keys = row_keys - column_key_set
-        if extra_keys:
+        if not row_keys <= column_key_set:
+            extra_keys = row_keys - column_key_set
             raise ValidationError(
                 f"Table.rows[{i}] has unknown keys: {extra_keys}",
                 code="VAL_TABLE_ROW_EXTRA_KEYS",
@@ -205,17 +212,17 @@ def validate_table_simple_v1(
                 hint="Row keys must match column definitions",
             )
 
-        # Check for missing keys based on policy
-        if strict_keys:
+        # Check for missing keys based on policy (no extras, so a short row
+        # is exactly a row with missing keys)
+        if strict_keys and len(row) != num_columns:
             missing_keys = column_key_set - row_keys
-            if missing_keys:
-                raise ValidationError(
-                    f"Table.rows[{i}] is missing keys: {missing_keys}",
-                    code="VAL_TABLE_ROW_MISSING_KEYS",
-                    semantic_id=semantic_id,
-                    spec=spec,
-                    hint="All rows must have all column keys (strict rectangular policy)",
-                )
+            raise ValidationError(
+                f"Table.rows[{i}] is missing keys: {missing_keys}",
+                code="VAL_TABLE_ROW_MISSING_KEYS",
+                semantic_id=semantic_id,
+                spec=spec,
+                hint="All rows must have all column keys (strict rectangular policy)",
+            )
 
         # Validate cell values and dtype enforcement
         for key, value in row.items():
@@ -226,7 +233,7 @@ def validate_table_simple_v1(
                 continue
 
             # Check base type is valid
-            if not isinstance(value, (str, int, float, bool)):
+            if not isinstance(value, _CELL_TYPES):
                 raise ValidationError(
                     f"Table.rows[{i}].{key} must be string|number|boolean|null",
                     code="VAL_TABLE_CELL_TYPE",
@@ -286,7 +293,7 @@ def _validate_cell_dtype(
                 spec=spec,
                 hint="Use numeric value, not True/False",
             )
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, _NUMERIC_TYPES):
             raise ValidationError(
                 f"Table.rows[{row_idx}].{key}: expected float, got {type(value).__name__}",
                 code="VAL_TABLE_DTYPE_MISMATCH",
@@ -0,0 +1,202 @@
+"""Tests for PDF theming system."""
+
+import os
+
+import pytest
+from pathlib import Path
+
+from litepub_norm.render.pdf_themes import (
+    load_pdf_manifest,
+    clear_manifest_cache,
+    resolve_pdf_theme,
+    list_pdf_themes,
+    clear_bundle_cache,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(autouse=True)
+def _clear_pdf_theme_caches():
+    """Isolate tests from module-level theme caches."""
+    clear_manifest_cache()
+    clear_bundle_cache()
+    yield
+    clear_manifest_cache()
+    clear_bundle_cache()
+
+
+@pytest.fixture
+def theme_dir(tmp_path):
+    """Minimal PDF theme pack on disk."""
+    d = tmp_path / "my-theme"
+    (d / "assets").mkdir(parents=True)
+    (d / "template.tex").write_text("$body$\n")
+    (d / "assets" / "theme.sty").write_text("% style\n")
+    (d / "theme.yaml").write_text(
+        'id: my-theme\n'
+        'name: "My Theme"\n'
+        'secnumdepth: 2\n'
+        'fonts:\n'
+        '  mainfont: "Noto Serif"\n'
+    )
+    return d
+
+
+# =============================================================================
+# Manifest Tests
+# =============================================================================
+
+class TestPdfManifest:
+    """Tests for PDF manifest loading."""
+
+    def test_load_yaml(self, theme_dir):
+        """theme.yaml is parsed into a manifest."""
+        manifest = load_pdf_manifest(theme_dir)
+        assert manifest.id == "my-theme"
+        assert manifest.name == "My Theme"
+        assert manifest.secnumdepth == 2
+        assert manifest.fonts.mainfont == "Noto Serif"
+
+    def test_simple_yaml_parsing(self):
+        """Simple YAML parser handles comments, sections and scalar types."""
+        from litepub_norm.render.pdf_themes.manifest import _parse_simple_yaml
+
+        data = _parse_simple_yaml(
+            "# comment\n"
+            "id: demo\n"
+            "toc: false\n"
+            "secnumdepth: 2\n"
+            "scale: 0.9\n"
+            "geometry:\n"
+            "  # nested comment\n"
+            "  margin: '2cm'\n"
+            "  paper: a4paper\n"
+            "note: \"http://example.com\"\n"
+        )
+        assert data == {
+            "id": "demo",
+            "toc": False,
+            "secnumdepth": 2,
+            "scale": 0.9,
+            "geometry": {"margin": "2cm", "paper": "a4paper"},
+            "note": "http://example.com",
+        }
+
+    def test_load_json_flow_yaml(self, theme_dir):
+        """theme.yaml written as JSON is parsed with the JSON fast path."""
+        (theme_dir / "theme.yaml").write_text(
+            '{"id": "my-theme", "name": "Flow", "fonts": {"monofont": "Fira Mono"}}\n'
+        )
+        manifest = load_pdf_manifest(theme_dir)
+        assert manifest.name == "Flow"
+        assert manifest.fonts.monofont == "Fira Mono"
+
+    def test_pandoc_metadata(self, theme_dir):
+        """Pandoc metadata reflects the manifest and is safe to mutate."""
+        manifest = load_pdf_manifest(theme_dir)
+        metadata = manifest.to_pandoc_metadata()
+        assert metadata["mainfont"] == "Noto Serif"
+        assert metadata["papersize"] == "a4"
+        assert metadata["secnumdepth"] == 2
+
+        metadata["geometry"].append("left=1cm")
+        metadata["mainfont"] = "Other"
+        again = manifest.to_pandoc_metadata()
+        assert "left=1cm" not in again["geometry"]
+        assert again["mainfont"] == "Noto Serif"
+
+    def test_missing_manifest(self, tmp_path):
+        """Directory without manifest returns None."""
+        assert load_pdf_manifest(tmp_path) is None
+
+    def test_cached_instance_reused(self, theme_dir):
+        """Unchanged manifest returns the cached instance."""
+        first = load_pdf_manifest(theme_dir)
+        second = load_pdf_manifest(theme_dir)
+        assert first is second
+
+    def test_cache_invalidated_on_change(self, theme_dir):
+        """Editing the manifest is picked up on the next load."""
+        first = load_pdf_manifest(theme_dir)
+
+        manifest_path = theme_dir / "theme.yaml"
+        manifest_path.write_text('id: my-theme\nname: "Renamed Theme"\n')
+        st = os.stat(manifest_path)
+        os.utime(manifest_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = load_pdf_manifest(theme_dir)
+        assert second is not first
+        assert second.name == "Renamed Theme"
+
+        from litepub_norm.render.pdf_themes.manifest import _MANIFEST_CACHE
+        assert len(_MANIFEST_CACHE) == 1
+
+
+# =============================================================================
+# Resolver Tests
+# =============================================================================
+
+class TestPdfResolver:
+    """Tests for PDF theme resolution."""
+
+    def test_resolve_project_theme(self, theme_dir):
+        """Project-local theme resolves with paths and hashes."""
+        bundle = resolve_pdf_theme("my-theme", theme_dir.parent)
+        assert bundle.theme_dir == theme_dir
+        assert bundle.style_path == theme_dir / "assets" / "theme.sty"
+        assert bundle.template_hash.startswith("sha256:")
+        assert bundle.assets_hash.startswith("sha256:")
+
+    def test_style_hash_matches_file_hash(self, theme_dir):
+        """style_hash reused from the assets walk equals a direct file hash."""
+        from litepub_norm.render.pdf_themes.resolver import _compute_file_hash
+
+        bundle = resolve_pdf_theme("my-theme", theme_dir.parent)
+        assert bundle.style_hash == _compute_file_hash(bundle.style_path)
+
+    def test_skip_hashes(self, theme_dir):
+        """compute_hashes=False resolves paths without hashing."""
+        bundle = resolve_pdf_theme("my-theme", theme_dir.parent, compute_hashes=False)
+        assert bundle.template_path == theme_dir / "template.tex"
+        assert bundle.template_hash == ""
+        assert bundle.style_hash == ""
+        assert bundle.assets_hash == ""
+
+        hashed = resolve_pdf_theme("my-theme", theme_dir.parent)
+        assert hashed.assets_hash.startswith("sha256:")
+
+    def test_list_includes_builtin_and_project(self, theme_dir):
+        """Listing merges built-in and project-local themes."""
+        (theme_dir.parent / "not-a-theme").mkdir()
+        themes = list_pdf_themes(theme_dir.parent)
+        assert "std-report" in themes
+        assert "my-theme" in themes
+        assert "not-a-theme" not in themes
+
+    def test_list_missing_project_dir(self, tmp_path):
+        """A missing project themes directory is ignored."""
+        assert list_pdf_themes(tmp_path / "missing") == list_pdf_themes()
+
+    def test_bundle_cached(self, theme_dir):
+        """Unchanged theme pack returns the cached bundle."""
+        first = resolve_pdf_theme("my-theme", theme_dir.parent)
+        second = resolve_pdf_theme("my-theme", theme_dir.parent)
+        assert first is second
+
+    def test_dangling_symlink_ignored(self, theme_dir):
+        """A dangling symlink in the theme pack is skipped, not an error."""
+        (theme_dir / "assets" / "dangling.sty").symlink_to(theme_dir / "nonexistent")
+        bundle = resolve_pdf_theme("my-theme", theme_dir.parent)
+        assert bundle.assets_hash.startswith("sha256:")
+        assert resolve_pdf_theme("my-theme", theme_dir.parent) is bundle
+
+    def test_bundle_invalidated_on_asset_change(self, theme_dir):
+        """Adding an asset produces a fresh bundle with a new assets hash."""
+        first = resolve_pdf_theme("my-theme", theme_dir.parent)
+        (theme_dir / "assets" / "logo.txt").write_text("logo")
+        second = resolve_pdf_theme("my-theme", theme_dir.parent)
+        assert second is not first
+        assert second.assets_hash != first.assets_hash
@@ -8,8 +8,19 @@ from unittest.mock import patch, MagicMock
 
 from litepub_norm.render.config import RenderConfig, default_html_config, default_pdf_config
 from litepub_norm.render.result import RenderResult, RenderWarning, RenderError
-from litepub_norm.render.report import RenderReport, file_hash, get_pandoc_version
-from litepub_norm.render.pandoc_runner import run as pandoc_run, PandocError, check_pandoc_version
+from litepub_norm.render.report import (
+    RenderReport,
+    file_hash,
+    file_digests,
+    directory_manifest_hash,
+    get_pandoc_version,
+)
+from litepub_norm.render.pandoc_runner import (
+    run as pandoc_run,
+    PandocError,
+    check_pandoc_version,
+    clear_tool_caches,
+)
 from litepub_norm.render.latex_runner import is_engine_available
 from litepub_norm.render.api import render
 from litepub_norm.filters.context import BuildContext
@@ -239,6 +250,22 @@ class TestRenderReport:
         assert report.template_path == str(template)
         assert report.template_hash.startswith("sha256:")
 
+    def test_deferred_hashes_resolved_by_to_dict(self, tmp_path):
+        """Deferred template/assets hashes are filled in by to_dict."""
+        template = tmp_path / "template.html"
+        template.write_text("<html></html>")
+        assets = tmp_path / "assets"
+        assets.mkdir()
+        (assets / "theme.css").write_text("body {}")
+
+        report = RenderReport()
+        report.set_template(template, defer=True)
+        report.set_assets(assets, defer=True)
+        data = report.to_dict()
+
+        assert data["templates"]["template_hash"] == file_hash(template)
+        assert data["templates"]["assets_hash"] == directory_manifest_hash(assets)
+
     def test_to_json(self):
         """to_json produces valid JSON."""
         report = RenderReport()
@@ -251,6 +278,35 @@ class TestRenderReport:
         parsed = json.loads(json_str)
         assert parsed["context"]["build_target"] == "internal"
 
+    def test_version_probe_cached(self):
+        """Tool version probes run once per executable."""
+        from litepub_norm.render.report import clear_version_caches
+
+        clear_version_caches()
+        completed = MagicMock(returncode=0, stdout="pandoc 3.1.9\nmore\n")
+        with patch("litepub_norm.render.report.subprocess.run", return_value=completed) as run:
+            report = RenderReport()
+            report.set_pandoc_version(Path("/opt/fake/pandoc"))
+            report.set_pandoc_version(Path("/opt/fake/pandoc"))
+        assert report.pandoc_version == "3.1.9"
+        assert run.call_count == 1
+        clear_version_caches()
+
+    def test_tool_versions_cached_without_pool(self):
+        """Cached tool versions are returned without starting a thread pool."""
+        from litepub_norm.render import report as report_module
+
+        report_module.clear_version_caches()
+        completed = MagicMock(returncode=0, stdout="pandoc 3.1.9\n")
+        with patch("litepub_norm.render.report.subprocess.run", return_value=completed) as run:
+            first = report_module.get_tool_versions("/opt/fake/pandoc", "xelatex")
+            with patch.object(report_module, "ThreadPoolExecutor") as pool:
+                second = report_module.get_tool_versions("/opt/fake/pandoc", "xelatex")
+        assert first == second == ("3.1.9", "pandoc 3.1.9")
+        assert run.call_count == 2
+        pool.assert_not_called()
+        report_module.clear_version_caches()
+
     def test_save(self, tmp_path):
         """save writes to file."""
         report = RenderReport()
@@ -262,6 +318,23 @@ class TestRenderReport:
         content = json.loads(path.read_text())
         assert content["context"]["build_target"] == "test"
 
+    def test_save_replaces_atomically(self, tmp_path, monkeypatch):
+        """save overwrites via a temp file and matches to_bytes with either encoder."""
+        from litepub_norm.render import report as report_module
+
+        report = RenderReport()
+        report.build_target = "test"
+        path = tmp_path / "report.json"
+        path.write_text("stale")
+
+        report.save(path)
+        assert path.read_bytes() == report.to_bytes()
+
+        monkeypatch.setattr(report_module, "orjson", None)
+        report.save(path)
+        assert path.read_bytes() == report.to_bytes()
+        assert [p.name for p in tmp_path.iterdir()] == ["report.json"]
+
 
 class TestFileHash:
     """Tests for file_hash utility."""
@@ -280,6 +353,35 @@ class TestFileHash:
         assert file_hash(f) == ""
 
 
+class TestDirectoryHash:
+    """Tests for directory hashing utilities."""
+
+    def test_file_digests_preserve_order(self, tmp_path):
+        """Parallel digests come back in input order."""
+        import hashlib
+
+        files = []
+        for i in range(20):
+            f = tmp_path / f"f{i:02d}.bin"
+            f.write_bytes(b"x" * i)
+            files.append(f)
+
+        assert file_digests(files) == [hashlib.sha256(b"x" * i).digest() for i in range(20)]
+
+    def test_manifest_hash_deterministic(self, tmp_path):
+        """Same directory contents give the same manifest hash."""
+        for i in range(20):
+            (tmp_path / f"f{i:02d}.txt").write_text(str(i))
+
+        h1 = directory_manifest_hash(tmp_path)
+        h2 = directory_manifest_hash(tmp_path)
+        assert h1 == h2
+        assert h1.startswith("sha256:")
+
+        (tmp_path / "f00.txt").write_text("changed")
+        assert directory_manifest_hash(tmp_path) != h1
+
+
 # ============================================================================
 # Pandoc Runner Tests
 # ============================================================================
@@ -298,6 +400,47 @@ class TestPandocRunner:
         # Version format like "3.1.9"
         assert "." in version
 
+    def test_check_pandoc_version_cached(self):
+        """check_pandoc_version only probes pandoc once per executable."""
+        clear_tool_caches()
+        completed = MagicMock(returncode=0, stdout="pandoc 3.1.9\n")
+        with patch("litepub_norm.render.report.subprocess.run", return_value=completed) as run:
+            assert check_pandoc_version("fake-pandoc") == "3.1.9"
+            assert check_pandoc_version("fake-pandoc") == "3.1.9"
+        assert run.call_count == 1
+        clear_tool_caches()
+
+    def test_failed_version_probe_retried(self):
+        """A failed probe is not cached; a later successful probe is."""
+        from litepub_norm.render.pandoc_runner import PandocVersionError
+
+        clear_tool_caches()
+        failed = MagicMock(returncode=1, stdout="")
+        with patch("litepub_norm.render.report.subprocess.run", return_value=failed):
+            with pytest.raises(PandocVersionError):
+                check_pandoc_version("fake-pandoc")
+        completed = MagicMock(returncode=0, stdout="pandoc 3.1.9\n")
+        with patch("litepub_norm.render.report.subprocess.run", return_value=completed) as run:
+            assert check_pandoc_version("fake-pandoc") == "3.1.9"
+            assert check_pandoc_version("fake-pandoc") == "3.1.9"
+        assert run.call_count == 1
+        clear_tool_caches()
+
+    def test_base_command_sees_new_template(self, tmp_path):
+        """A template created between calls is passed on the next call."""
+        from litepub_norm.render.pandoc_runner import _base_command
+
+        template = tmp_path / "template.tex"
+        lua_filter = tmp_path / "filter.lua"
+        args = ("pandoc", "latex", True, template, (lua_filter,), ())
+        assert not any(a.startswith(("--template", "--lua-filter")) for a in _base_command(*args))
+
+        template.write_text("$body$")
+        lua_filter.write_text("")
+        cmd = _base_command(*args)
+        assert f"--template={template}" in cmd
+        assert f"--lua-filter={lua_filter}" in cmd
+
     @pytest.mark.skipif(
         shutil.which("pandoc") is None,
         reason="Pandoc not installed"
@@ -347,6 +490,187 @@ class TestPandocRunner:
         assert "테스트" in content
 
 
+FAKE_PANDOC_SERVER = """\
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+if sys.argv[1] == "--version":
+    print("pandoc 3.1.9")
+    sys.exit(0)
+
+if sys.argv[1].startswith("--from="):
+    # Tiny RST writer: like pandoc, it numbers images per document and
+    # writes notes, image substitutions and reference links at the end.
+    args = sys.argv[1:]
+    reference_links = "--reference-links" in args
+    with open(args[-1], encoding="utf-8") as f:
+        ast = json.load(f)
+    notes, defs = [], []
+
+    def inlines(nodes):
+        parts = []
+        for node in nodes:
+            t = node["t"]
+            if t == "Str":
+                parts.append(node["c"])
+            elif t == "Space":
+                parts.append(" ")
+            elif t == "Image":
+                n = sum(d.startswith(".. |image") for d in defs) + 1
+                parts.append(f"|image{n}|")
+                defs.append(f".. |image{n}| image:: {node['c'][2][0]}")
+            elif t == "Note":
+                parts.append("[#]_")
+                notes.append(".. [#] " + inlines(node["c"][0]["c"]))
+            elif t == "Link":
+                text, url = inlines(node["c"][1]), node["c"][2][0]
+                if reference_links:
+                    parts.append(f"`{text}`_")
+                    defs.append(f".. _{text}: {url}")
+                else:
+                    parts.append(f"`{text} <{url}>`__")
+        return "".join(parts)
+
+    blocks = [b["c"][1] if b["t"] == "RawBlock" else inlines(b["c"]) for b in ast["blocks"]]
+    text = "\\n\\n".join(blocks + notes + defs) + "\\n"
+    if "-o" in args:
+        with open(args[args.index("-o") + 1], "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    sys.exit(0)
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        req = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        ast = json.loads(req["text"])
+        words = [b["c"][0]["c"] for b in ast["blocks"]]
+        if words == ["fail"]:
+            # pandoc server reports conversion errors as plain text
+            data = b"conversion timed out"
+        else:
+            out = json.dumps({"output": req["to"] + ":" + " ".join(words), "base64": False})
+            data = out.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+HTTPServer(("127.0.0.1", int(sys.argv[3])), Handler).serve_forever()
+"""
+
+
+@pytest.fixture
+def fake_pandoc(tmp_path):
+    """Executable answering ``--version`` and ``server --port N`` like pandoc."""
+    import os
+    import sys
+
+    script = tmp_path / "fake_pandoc"
+    script.write_text(f"#!{sys.executable}\n" + FAKE_PANDOC_SERVER)
+    os.chmod(script, 0o755)
+    clear_tool_caches()
+    yield script
+    clear_tool_caches()
+
+
+class TestPandocServer:
+    """Tests for the persistent pandoc server client."""
+
+    def test_convert_reuses_process(self, fake_pandoc):
+        """One server process handles several conversions."""
+        from litepub_norm.render.pandoc_runner import PandocServer
+
+        ast = {"pandoc-api-version": [1, 23], "meta": {},
+               "blocks": [{"t": "Para", "c": [{"t": "Str", "c": "hello"}]}]}
+        with PandocServer(fake_pandoc) as server:
+            assert "--timeout" in server._process.args
+            pid = server._process.pid
+            assert server.convert(ast, "rst") == "rst:hello"
+            assert server.convert(ast, "gfm") == "gfm:hello"
+            assert server._process.pid == pid
+        assert not server.running
+
+    def test_start_failure(self, tmp_path):
+        """A pandoc without server support raises PandocError."""
+        import os
+        import sys
+        from litepub_norm.render.pandoc_runner import PandocServer
+
+        script = tmp_path / "old_pandoc"
+        script.write_text(f"#!{sys.executable}\nimport sys\nsys.exit(2)\n")
+        os.chmod(script, 0o755)
+        with pytest.raises(PandocError):
+            PandocServer(script).start()
+
+    def test_render_rst_via_server(self, fake_pandoc, temp_output_dir):
+        """render_rst uses the shared server when enabled."""
+        from litepub_norm.render.pandoc_runner import shutdown_pandoc_servers
+        from litepub_norm.render.text import render_rst
+
+        ast = {"pandoc-api-version": [1, 23], "meta": {},
+               "blocks": [{"t": "Para", "c": [{"t": "Str", "c": "served"}]}]}
+        context = BuildContext(build_target="internal", render_target="rst")
+        config = RenderConfig(
+            output_dir=temp_output_dir, pandoc_path=fake_pandoc, use_pandoc_server=True
+        )
+        try:
+            result = render_rst(ast, context, config)
+        finally:
+            shutdown_pandoc_servers()
+
+        assert result.success
+        assert result.primary_output.read_text() == "rst:served\n"
+
+    def test_render_rst_server_failure_falls_back(self, fake_pandoc, temp_output_dir):
+        """A conversion the server rejects is retried with the pandoc CLI."""
+        from litepub_norm.render.pandoc_runner import shutdown_pandoc_servers
+        from litepub_norm.render.text import render_rst
+
+        ast = {"pandoc-api-version": [1, 23], "meta": {},
+               "blocks": [{"t": "Para", "c": [{"t": "Str", "c": "fail"}]}]}
+        context = BuildContext(build_target="internal", render_target="rst")
+        config = RenderConfig(
+            output_dir=temp_output_dir, pandoc_path=fake_pandoc, use_pandoc_server=True
+        )
+        try:
+            result = render_rst(ast, context, config)
+        finally:
+            shutdown_pandoc_servers()
+
+        assert result.success
+        assert result.primary_output.read_text() == "fail\n"
+        codes = [w["code"] for w in result.report["diagnostics"]["warnings"]]
+        assert "PANDOC_SERVER_FAILED" in codes
+
+    def test_render_rst_without_report(self, fake_pandoc, temp_output_dir):
+        """write_report=False keeps the report in memory only."""
+        from litepub_norm.render.pandoc_runner import shutdown_pandoc_servers
+        from litepub_norm.render.text import render_rst
+
+        ast = {"pandoc-api-version": [1, 23], "meta": {},
+               "blocks": [{"t": "Para", "c": [{"t": "Str", "c": "x"}]}]}
+        context = BuildContext(build_target="internal", render_target="rst")
+        config = RenderConfig(
+            output_dir=temp_output_dir, pandoc_path=fake_pandoc, use_pandoc_server=True
+        )
+        try:
+            result = render_rst(ast, context, config, write_report=False)
+        finally:
+            shutdown_pandoc_servers()
+
+        assert result.report["context"]["render_target"] == "rst"
+        assert not (temp_output_dir / "render_report.json").exists()
+        assert result.output_files == [temp_output_dir / "document.rst"]
+
+
 # ============================================================================
 # HTML Renderer Tests
 # ============================================================================
@@ -467,6 +791,73 @@ class TestRstRenderer:
 
         assert any(w.code == "RST_BEST_EFFORT" for w in result.warnings)
 
+    @pytest.mark.skipif(
+        shutil.which("pandoc") is None,
+        reason="Pandoc not installed"
+    )
+    def test_render_rst_batch(self, minimal_ast, ast_with_wrapper, temp_output_dir):
+        """Batch RST export matches per-document rendering."""
+        from litepub_norm.render.text import render_rst, render_rst_batch
+
+        context = BuildContext(build_target="internal", render_target="rst")
+        config = RenderConfig(output_dir=temp_output_dir)
+        result = render_rst_batch(
+            [minimal_ast, ast_with_wrapper], context, config,
+            output_names=["a.rst", "b.rst"],
+        )
+        assert result.success
+
+        for ast, name in ((minimal_ast, "a.rst"), (ast_with_wrapper, "b.rst")):
+            single = render_rst(ast, context, config, output_name=f"single_{name}")
+            expected = single.primary_output.read_text()
+            assert (temp_output_dir / name).read_text() == expected
+
+    @pytest.mark.parametrize("writer_options", [(), ("--reference-links",)])
+    def test_render_rst_batch_end_collected(self, fake_pandoc, temp_output_dir, writer_options):
+        """Images, notes and reference links don't leak definitions across a batch."""
+        from litepub_norm.render.text import render_rst, render_rst_batch
+
+        def doc(*inlines):
+            return {"pandoc-api-version": [1, 23], "meta": {},
+                    "blocks": [{"t": "Para", "c": [{"t": "Str", "c": "doc"}, *inlines]}]}
+
+        image = {"t": "Image", "c": [["", [], []], [], ["fig.png", ""]]}
+        note = {"t": "Note", "c": [{"t": "Para", "c": [{"t": "Str", "c": "fn"}]}]}
+        link = {"t": "Link", "c": [["", [], []], [{"t": "Str", "c": "site"}], ["https://x", ""]]}
+        asts = [doc(), doc(link), doc(image), doc(), doc(image), doc(note)]
+        names = [f"d{i}.rst" for i in range(len(asts))]
+
+        context = BuildContext(build_target="internal", render_target="rst")
+        config = RenderConfig(
+            output_dir=temp_output_dir, pandoc_path=fake_pandoc,
+            rst_writer_options=writer_options,
+        )
+        result = render_rst_batch(asts, context, config, output_names=names)
+        assert result.success
+
+        for ast, name in zip(asts, names):
+            single = render_rst(ast, context, config, output_name=f"single_{name}")
+            assert (temp_output_dir / name).read_text() == single.primary_output.read_text()
+        assert (temp_output_dir / "d4.rst").read_text() == (
+            "doc|image1|\n\n.. |image1| image:: fig.png\n"
+        )
+
+    def test_batch_split_roundtrip(self, minimal_ast):
+        """Batched document splits back into one chunk per input."""
+        from litepub_norm.render.text.rst_renderer import (
+            _batch_document,
+            _split_batch_output,
+        )
+
+        token = "__LP_BATCH_SEP__test"
+        doc = _batch_document([minimal_ast, minimal_ast, minimal_ast], token)
+        assert len(doc["blocks"]) == 3 * len(minimal_ast["blocks"]) + 2
+
+        text = f"One\n\n{token}\n\nTwo\n\n{token}\n\nThree\n"
+        assert _split_batch_output(text, token, 3) == ["One\n", "Two\n", "Three\n"]
+        with pytest.raises(ValueError):
+            _split_batch_output(text, token, 2)
+
 
 # ============================================================================
 # PDF Renderer Tests (require XeLaTeX)
@@ -514,6 +905,35 @@ class TestPdfRenderer:
         assert len(tex_files) >= 1
 
 
+class TestLatexLogExtraction:
+    """Tests for LaTeX log error-line extraction."""
+
+    def test_matches_split_based_scan(self, tmp_path):
+        """Returns the same lines as a naive split/filter, in order."""
+        from litepub_norm.render.pdf.renderer import _extract_log_error_lines
+
+        content = "\n".join(
+            ["This is XeTeX", "! Undefined control sequence.", "l.12 \\foo",
+             "LaTeX Error: File not found", "ok"] * 5
+        )
+        log = tmp_path / "doc.log"
+        log.write_text(content)
+
+        expected = [
+            line for line in content.split("\n")
+            if "!" in line or "Error" in line
+        ][:10]
+        assert _extract_log_error_lines(log) == expected
+
+    def test_empty_log(self, tmp_path):
+        """Empty log yields no lines."""
+        from litepub_norm.render.pdf.renderer import _extract_log_error_lines
+
+        log = tmp_path / "doc.log"
+        log.write_bytes(b"")
+        assert _extract_log_error_lines(log) == []
+
+
 # ============================================================================
 # API Tests
 # ============================================================================
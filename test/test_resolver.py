@@ -13,6 +13,8 @@ from litepub_norm.resolver import (
     resolve,
     build_resolution_plan,
     load_registry,
+    load_registry_cached,
+    clear_registry_cache,
     ResolutionConfig,
     RegistrySnapshot,
     RegistryError,
@@ -89,6 +91,201 @@ class TestRegistryLoader:
         assert path.exists()
         assert path.name == "yaw_mae.json"
 
+    def test_registry_entries_slotted(self, registry: RegistrySnapshot):
+        """Registry objects are slotted dataclasses without a per-instance dict."""
+        entry = registry.get("metric.face.yaw_mae.v1")
+        assert not hasattr(entry, "__dict__")
+        assert not hasattr(registry, "__dict__")
+        assert not hasattr(registry.run, "__dict__")
+
+    def test_registry_vocabulary_interned(self):
+        """Formats and specs from separate loads share one string object."""
+        from litepub_norm.resolver.loaders.figure_v1 import ALLOWED_FORMATS
+
+        first = load_registry(REGISTRY_PATH).get("fig.demo.dummy_plot.v1")
+        second = load_registry(REGISTRY_PATH).get("fig.demo.dummy_plot.v1")
+        assert first.spec is second.spec
+        assert first.format is second.format
+        assert any(fmt is first.format for fmt in ALLOWED_FORMATS)
+
+    def test_resolve_uri_memoized(self, registry: RegistrySnapshot):
+        """Repeated URI resolution returns the same Path."""
+        entry = registry.get("metric.face.yaw_mae.v1")
+        path = registry.resolve_entry_path(entry)
+        assert registry.resolve_entry_path(entry) is path
+        assert registry.resolve_uri("/abs/file.json") == Path("/abs/file.json")
+
+    def test_cached_registry_reused(self):
+        """Unchanged registry file returns the cached snapshot."""
+        clear_registry_cache()
+        first = load_registry_cached(REGISTRY_PATH)
+        assert load_registry_cached(str(REGISTRY_PATH)) is first
+        assert first.resolve_entry_path(first.get("metric.face.yaw_mae.v1")).exists()
+
+    def test_cached_registry_invalidated(self, tmp_path):
+        """Rewriting the registry file is picked up on the next load."""
+        clear_registry_cache()
+        data = json.loads(REGISTRY_PATH.read_text())
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(data))
+        first = load_registry_cached(path)
+
+        data["entries"] = data["entries"][:1]
+        path.write_text(json.dumps(data))
+        second = load_registry_cached(path)
+        assert second is not first
+        assert len(second.entries) == 1
+
+        from litepub_norm.resolver.registry import _REGISTRY_CACHE
+        assert len(_REGISTRY_CACHE) == 1
+
+    def test_cached_registry_keeps_caller_path(self, tmp_path):
+        """Cached loads resolve artifacts relative to the path as given."""
+        clear_registry_cache()
+        link = tmp_path / "registry.json"
+        link.symlink_to(REGISTRY_PATH)
+        entry_id = "metric.face.yaw_mae.v1"
+
+        expected = load_registry(link)
+        cached = load_registry_cached(link)
+        assert cached.resolve_entry_path(cached.get(entry_id)) == (
+            expected.resolve_entry_path(expected.get(entry_id))
+        )
+        assert cached.resolve_entry_path(cached.get(entry_id)).is_relative_to(tmp_path)
+        assert load_registry_cached(REGISTRY_PATH) is not cached
+
+    def test_registry_invalid_json(self, tmp_path):
+        """Malformed registry JSON raises RegistryError."""
+        path = tmp_path / "registry.json"
+        path.write_text("{not json")
+        with pytest.raises(RegistryError, match="Invalid JSON"):
+            load_registry(path)
+
+    def test_cached_registry_missing(self, tmp_path):
+        """Missing registry file raises RegistryError."""
+        with pytest.raises(RegistryError):
+            load_registry_cached(tmp_path / "missing.json")
+
+
+class TestPayloadHashing:
+    """Tests for payload hash computation and verification."""
+
+    def test_compute_sha256(self, tmp_path, monkeypatch):
+        """Digest matches hashlib over the whole file."""
+        import hashlib
+        from litepub_norm.resolver.loaders import base
+        from litepub_norm.resolver.loaders.base import compute_sha256
+
+        # Empty, read-once and memory-mapped size classes
+        for size in (0, 100, 3 * 1024 * 1024 + 7):
+            data = b"x" * size
+            path = tmp_path / f"payload_{size}.bin"
+            path.write_bytes(data)
+            assert compute_sha256(path) == "sha256:" + hashlib.sha256(data).hexdigest()
+
+        # Streaming path for files above the mmap limit
+        base.clear_hash_cache()
+        monkeypatch.setattr(base, "_MMAP_MAX_BYTES", 2 * 1024 * 1024)
+        assert compute_sha256(path) == "sha256:" + hashlib.sha256(data).hexdigest()
+
+    def test_hash_cache_invalidated_on_change(self, tmp_path):
+        """Cached digests are reused until the file changes."""
+        import hashlib
+        from litepub_norm.resolver.loaders.base import _sha256_file, compute_sha256
+
+        path = tmp_path / "payload.json"
+        path.write_text('{"a": 1}')
+        first = compute_sha256(path)
+        hits = _sha256_file.cache_info().hits
+        assert compute_sha256(path) == first
+        assert _sha256_file.cache_info().hits == hits + 1
+
+        path.write_text('{"a": 22}')
+        assert compute_sha256(path) == "sha256:" + hashlib.sha256(b'{"a": 22}').hexdigest()
+
+    def test_verify_hash_mismatch(self, tmp_path):
+        """Wrong expected hash raises HashMismatchError."""
+        from litepub_norm.resolver import HashMismatchError
+        from litepub_norm.resolver.loaders.base import verify_hash
+
+        path = tmp_path / "payload.json"
+        path.write_text("{}")
+        with pytest.raises(HashMismatchError):
+            verify_hash(path, "sha256:" + "0" * 64, "x.id")
+
+    def test_load_and_verify_json(self, tmp_path):
+        """Fused load verifies the hash before parsing."""
+        from litepub_norm.resolver import HashMismatchError
+        from litepub_norm.resolver.loaders.base import compute_sha256, load_and_verify_json
+
+        path = tmp_path / "payload.json"
+        path.write_text('{"label": "x", "value": 1}')
+        assert load_and_verify_json(path, compute_sha256(path), "x.id") == {"label": "x", "value": 1}
+
+        with pytest.raises(HashMismatchError):
+            load_and_verify_json(path, "sha256:" + "0" * 64, "x.id")
+
+        path.write_text("{not json")
+        with pytest.raises(PayloadError):
+            load_and_verify_json(path, compute_sha256(path), "x.id")
+        with pytest.raises(PayloadError):
+            load_and_verify_json(tmp_path / "missing.json", "sha256:", "x.id")
+
+    def test_load_json_parser_fallback(self, tmp_path, monkeypatch):
+        """JSON payloads parse the same with and without orjson."""
+        from litepub_norm.resolver import _json
+        from litepub_norm.resolver.loaders.base import load_json_file
+
+        path = tmp_path / "payload.json"
+        path.write_text('{"value": NaN, "big": 123456789012345678901234567890}')
+        parsed = load_json_file(path, "x.id")
+        assert parsed["big"] == 123456789012345678901234567890
+        assert parsed["value"] != parsed["value"]
+
+        monkeypatch.setattr(_json, "orjson", None)
+        assert load_json_file(path, "x.id")["big"] == 123456789012345678901234567890
+        path.write_text("{not json")
+        with pytest.raises(PayloadError):
+            load_json_file(path, "x.id")
+
+    def test_loaders_accept_str_paths(self, tmp_path):
+        """Base loaders take plain string paths as well as Path objects."""
+        from litepub_norm.resolver.loaders.base import (
+            compute_sha256,
+            load_and_verify_json,
+            load_json_file,
+        )
+
+        path = tmp_path / "payload.json"
+        path.write_text('{"value": 1}')
+        digest = compute_sha256(str(path))
+        assert digest == compute_sha256(path)
+        assert load_json_file(str(path), "x.id") == {"value": 1}
+        assert load_and_verify_json(str(path), digest, "x.id") == {"value": 1}
+
+    def test_strict_loaders_verify_demo_pack(self, registry: RegistrySnapshot):
+        """Demo pack payloads load with hash verification enabled."""
+        entry = registry.get("tbl.summary.category_hierarchy.v1")
+        assert load_table_pandoc_v1(registry, entry, verify=True)["t"] == "Table"
+        entry = registry.get("metric.face.yaw_mae.v1")
+        assert "value" in load_metric_v1(registry, entry, verify=True)
+
+
+class TestResolutionConfig:
+    """Tests for resolution configuration defaults."""
+
+    def test_default_limits_shared(self):
+        """Configs without explicit limits share one frozen limits instance."""
+        assert ResolutionConfig().limits is ResolutionConfig(strict=False).limits
+        assert ResolutionConfig().limits.max_table_rows == 10_000
+
+    def test_config_is_frozen(self):
+        """Configs are immutable and slotted."""
+        config = ResolutionConfig()
+        with pytest.raises(AttributeError):
+            config.strict = False
+        assert not hasattr(config, "__dict__")
+
 
 class TestMetricPipeline:
     """Tests for metric.json@v1 loader/validator/emitter."""
@@ -123,6 +320,19 @@ class TestMetricPipeline:
         # Check it has the right structure
         assert len(table["c"]) == 6  # Table has 6 parts
 
+    def test_emit_metric_header_not_shared(self):
+        """Each emitted metric table owns its header row."""
+        payload = {"label": "Count", "value": 3}
+        first = emit_metric_as_table(payload)
+        second = emit_metric_as_table(payload)
+
+        head = first["c"][3][1][0][1]
+        assert head[0][4] == [{"t": "Plain", "c": [{"t": "Str", "c": "Metric"}]}]
+        assert head[1][4] == [{"t": "Plain", "c": [{"t": "Str", "c": "Value"}]}]
+        assert first["c"][2][1][0] == {"t": "AlignRight"}
+        assert first["c"][3] == second["c"][3]
+        assert first["c"][3] is not second["c"][3]
+
 
 class TestSimpleTablePipeline:
     """Tests for table.simple.json@v1 loader/validator/emitter."""
@@ -149,6 +359,50 @@ class TestSimpleTablePipeline:
         table = emit_simple_table(payload)
         assert table["t"] == "Table"
 
+    def test_emit_simple_table_cells(self):
+        """Body cells hold word-split text, single-Str numbers and empty None."""
+        payload = {
+            "columns": [{"key": "name"}, {"key": "n"}, {"key": "x"}, {"key": "ok"}],
+            "rows": [{"name": "two words", "n": 3, "x": 0.5, "ok": True}, {}],
+        }
+        table = emit_simple_table(payload)
+        body_rows = table["c"][4][0][3]
+
+        def cell_inlines(row, col):
+            return body_rows[row][1][col][4][0]["c"]
+
+        assert cell_inlines(0, 0) == [
+            {"t": "Str", "c": "two"}, {"t": "Space"}, {"t": "Str", "c": "words"},
+        ]
+        assert cell_inlines(0, 1) == [{"t": "Str", "c": "3"}]
+        assert cell_inlines(0, 2) == [{"t": "Str", "c": "0.5"}]
+        assert cell_inlines(0, 3) == [{"t": "Str", "c": "true"}]
+        assert cell_inlines(1, 0) == []
+        assert body_rows[0][1][0][:4] == [["", [], []], {"t": "AlignDefault"}, 1, 1]
+
+
+class TestPandocBuilders:
+    """Tests for Pandoc AST node builders."""
+
+    def test_inlines_from_text(self):
+        """Text splits on any whitespace into Str/Space inlines."""
+        from litepub_norm.resolver.emitters.pandoc_builders import make_inlines_from_text
+
+        assert make_inlines_from_text("") == []
+        assert make_inlines_from_text("  ") == []
+        assert make_inlines_from_text("kg") == [{"t": "Str", "c": "kg"}]
+        assert make_inlines_from_text(" a\tb ") == [
+            {"t": "Str", "c": "a"}, {"t": "Space"}, {"t": "Str", "c": "b"},
+        ]
+
+    def test_format_float(self):
+        """Floats use 15 significant digits, hiding representation noise."""
+        from litepub_norm.resolver.emitters.pandoc_builders import format_float
+
+        assert format_float(0.1 + 0.2) == "0.3"
+        assert format_float(1.0) == "1"
+        assert format_float(2.5e-7) == "2.5e-07"
+
 
 class TestPandocTablePipeline:
     """Tests for table.pandoc.json@v1 loader/validator/emitter."""
@@ -159,6 +413,18 @@ class TestPandocTablePipeline:
         payload = load_table_pandoc_v1(registry, entry, verify=False)
         assert payload["t"] == "Table"
 
+    def test_load_non_table_payload(self, registry: RegistrySnapshot, tmp_path):
+        """Payloads that are not a Table block object raise PayloadError."""
+        import dataclasses
+
+        entry = registry.get("tbl.summary.category_hierarchy.v1")
+        for text, kind in (('{"t": "Para", "c": []}', "Para"), ("[1, 2]", "list")):
+            path = tmp_path / f"{kind}.json"
+            path.write_text(text)
+            bad = dataclasses.replace(entry, uri=str(path))
+            with pytest.raises(PayloadError, match=f"got type '{kind}'"):
+                load_table_pandoc_v1(registry, bad, verify=False)
+
     def test_validate_pandoc_table(self, registry: RegistrySnapshot):
         """Test Pandoc table validation."""
         entry = registry.get("tbl.summary.category_hierarchy.v1")
@@ -172,9 +438,10 @@ class TestPandocTablePipeline:
         entry = registry.get("tbl.summary.category_hierarchy.v1")
         payload = load_table_pandoc_v1(registry, entry, verify=False)
         result = emit_pandoc_table(payload)
-        # Should be same object/structure
+        # Same structure, but a new top-level node
         assert result["t"] == "Table"
         assert result == payload
+        assert result is not payload
 
 
 class TestFigurePipeline:
@@ -195,6 +462,20 @@ class TestFigurePipeline:
         assert meta["caption"] == "Dummy plot for resolution tests (샘플 캡션)."
         assert meta["alt"] == "A placeholder image with a box and toy bars."
 
+    def test_missing_figure_files(self, registry: RegistrySnapshot):
+        """Missing figure and sidecar files raise PayloadError in both modes."""
+        import dataclasses
+
+        entry = registry.get("fig.demo.dummy_plot.v1")
+        missing = dataclasses.replace(
+            entry, uri="figures/missing.png", meta_uri="figures/missing.meta.json"
+        )
+        for verify in (True, False):
+            with pytest.raises(PayloadError, match="not found"):
+                load_figure_v1(registry, missing, verify=verify)
+            with pytest.raises(PayloadError, match="not found"):
+                load_figure_meta_v1(registry, missing, verify=verify)
+
     def test_validate_figure_meta(self, registry: RegistrySnapshot):
         """Test figure metadata validation."""
         entry = registry.get("fig.demo.dummy_plot.v1")
@@ -210,6 +491,47 @@ class TestFigurePipeline:
         figure = emit_figure(path, meta, entry.id)
         assert figure["t"] == "Figure"
 
+    def test_emit_figure_without_meta(self):
+        """Figure without metadata has an empty caption and alt text."""
+        figure = emit_figure(Path("plots/a.png"), None, "fig.a")
+        attr, caption, content = figure["c"]
+        assert attr == ["fig.a", ["figure"], []]
+        assert caption == [None, []]
+        image = content[0]["c"][0]
+        assert image["c"][1] == []
+        assert image["c"][2] == [str(Path("plots/a.png")), ""]
+
+
+class TestPlaceholders:
+    """Tests for placeholder block detection."""
+
+    @staticmethod
+    def _para(*inlines: dict) -> dict:
+        return {"t": "Para", "c": list(inlines)}
+
+    def test_detect_tokens(self):
+        """Single-Str and space-split tokens are detected."""
+        from litepub_norm.resolver.placeholders import is_placeholder_block
+
+        para = self._para({"t": "Str", "c": "[[COMPUTED:TABLE]]"})
+        assert is_placeholder_block(para).kind == "TABLE"
+        para = self._para(
+            {"t": "Str", "c": "[["},
+            {"t": "Str", "c": "COMPUTED:"},
+            {"t": "Space"},
+            {"t": "Str", "c": "FIGURE]]"},
+        )
+        assert is_placeholder_block(para).kind == "FIGURE"
+
+    def test_reject_non_placeholders(self):
+        """Prose, unknown tokens and mixed inlines are not placeholders."""
+        from litepub_norm.resolver.placeholders import is_placeholder_block
+
+        assert is_placeholder_block(self._para({"t": "Str", "c": "Hello"}, {"t": "Space"})) is None
+        assert is_placeholder_block(self._para({"t": "Str", "c": "[[COMPUTED:OTHER]]"})) is None
+        assert is_placeholder_block(self._para({"t": "Emph", "c": []})) is None
+        assert is_placeholder_block({"t": "Plain", "c": [{"t": "Str", "c": "[[COMPUTED:TABLE]]"}]}) is None
+
 
 class TestResolutionPlan:
     """Tests for resolution plan building."""
@@ -366,6 +688,104 @@ class TestResolveAPI:
         # Result should be different
         assert result != ast
 
+    def test_resolve_shares_untouched_blocks(self, registry: RegistrySnapshot):
+        """Blocks outside resolved wrappers are shared, not copied."""
+        ast = self._make_ast_with_placeholder("metric.face.yaw_mae.v1", "METRIC")
+        para = {"t": "Para", "c": [{"t": "Str", "c": "Untouched"}]}
+        ast["blocks"].append(para)
+
+        result = resolve(ast, registry, ResolutionConfig(strict=False))
+
+        assert result["blocks"] is not ast["blocks"]
+        assert result["blocks"][1] is para
+        assert result["blocks"][0] is not ast["blocks"][0]
+        assert ast["blocks"][0]["c"][1][0]["t"] == "Para"
+
+    def test_resolve_many_items_in_order(self, registry: RegistrySnapshot):
+        """Plans large enough to load in parallel resolve in plan order."""
+        from litepub_norm.resolver.apply import _resolve_item
+
+        specs = [
+            ("metric.face.yaw_mae.v1", "METRIC", "Table"),
+            ("tbl.kpi.face.yaw_mae.v1", "TABLE", "Table"),
+            ("tbl.summary.category_hierarchy.v1", "TABLE", "Table"),
+            ("fig.demo.dummy_plot.v1", "FIGURE", "Figure"),
+        ]
+        ast = {"pandoc-api-version": [1, 23], "meta": {}, "blocks": []}
+        for semantic_id, kind, _ in specs:
+            ast["blocks"].extend(self._make_ast_with_placeholder(semantic_id, kind)["blocks"])
+
+        config = ResolutionConfig(strict=False)
+        result = resolve(ast, registry, config)
+
+        plan = build_plan(ast, registry, config)
+        for block, item, (_, _, block_type) in zip(result["blocks"], plan, specs):
+            resolved = block["c"][1][0]
+            assert resolved["t"] == block_type
+            assert resolved == _resolve_item(item, registry, config)
+
+    def test_resolve_bytes(self, registry: RegistrySnapshot, monkeypatch):
+        """resolve_bytes matches resolve() with and without orjson."""
+        from litepub_norm.resolver import _json, api, resolve_bytes
+
+        ast = self._make_ast_with_placeholder("tbl.kpi.face.yaw_mae.v1", "TABLE")
+        config = ResolutionConfig(strict=False)
+        expected = resolve(ast, registry, config)
+
+        out = resolve_bytes(json.dumps(ast).encode("utf-8"), registry, config)
+        assert json.loads(out) == expected
+
+        monkeypatch.setattr(api, "orjson", None)
+        monkeypatch.setattr(_json, "orjson", None)
+        stdlib_out = resolve_bytes(json.dumps(ast).encode("utf-8"), registry, config)
+        assert json.loads(stdlib_out) == expected
+
+    def test_resolve_bytes_parser_fallback(self, registry: RegistrySnapshot):
+        """resolve_bytes accepts JSON that only the stdlib parser reads."""
+        from litepub_norm.resolver import resolve_bytes
+
+        ast = self._make_ast_with_placeholder("tbl.kpi.face.yaw_mae.v1", "TABLE")
+        config = ResolutionConfig(strict=False)
+        expected = resolve(ast, registry, config)
+
+        # orjson rejects a UTF-8 BOM; the stdlib parser accepts it
+        out = resolve_bytes(b"\xef\xbb\xbf" + json.dumps(ast).encode("utf-8"), registry, config)
+        assert json.loads(out) == expected
+
+    def test_resolve_repeated_id_loads_once(self, registry: RegistrySnapshot, monkeypatch):
+        """Repeated placeholders for one artifact load once and do not alias."""
+        from litepub_norm.resolver import apply
+
+        block = self._make_ast_with_placeholder("tbl.summary.category_hierarchy.v1", "TABLE")["blocks"][0]
+        ast = {"pandoc-api-version": [1, 23], "meta": {}, "blocks": [block, block]}
+
+        calls = []
+        original = apply._load_item
+        monkeypatch.setattr(
+            apply, "_load_item", lambda *args: calls.append(args[0]) or original(*args)
+        )
+        result = resolve(ast, registry, ResolutionConfig(strict=False))
+
+        assert len(calls) == 1
+        first, second = (b["c"][1][0] for b in result["blocks"])
+        assert first == second
+        assert first["c"] is not second["c"]
+
+    def test_resolve_unknown_spec(self, registry: RegistrySnapshot):
+        """Unknown payload spec raises PayloadError."""
+        from dataclasses import replace
+        from litepub_norm.resolver.apply import _resolve_item
+
+        plan = build_plan(
+            self._make_ast_with_placeholder("metric.face.yaw_mae.v1", "METRIC"),
+            registry,
+            ResolutionConfig(strict=False),
+        )
+        item = plan.items[0]
+        item = replace(item, entry=replace(item.entry, spec="unknown@v9"))
+        with pytest.raises(PayloadError, match="Unknown payload spec"):
+            _resolve_item(item, registry, ResolutionConfig(strict=False))
+
     def test_resolve_with_registry_path(self):
         """Test resolve() with registry path string."""
         ast = {
@@ -399,3 +819,148 @@ class TestResolveAPI:
         div = result["blocks"][0]
         content = div["c"][1]
         assert content[0]["t"] == "Table"
+
+
+class TestResolutionReport:
+    """Tests for pre-flight resolution reports."""
+
+    @staticmethod
+    def _plan(registry: RegistrySnapshot, entries: list[RegistryEntry]):
+        from litepub_norm.resolver.placeholders import ARTIFACT_TYPE_TO_KIND, PLACEHOLDERS
+        from litepub_norm.resolver.plan import ResolutionItem, ResolutionPlan
+
+        items = []
+        for i, entry in enumerate(entries):
+            token = f"[[COMPUTED:{ARTIFACT_TYPE_TO_KIND[entry.artifact_type]}]]"
+            items.append(ResolutionItem(entry.id, entry, i, 0, PLACEHOLDERS[token]))
+        return ResolutionPlan(items=items)
+
+    def test_report_demo_pack(self, registry: RegistrySnapshot):
+        """Every demo payload is hashed, sized and summarized."""
+        from litepub_norm.resolver.report import build_resolution_report
+
+        entries = list(registry.entries.values())
+        report = build_resolution_report(self._plan(registry, entries), registry, ResolutionConfig())
+        assert report.all_hashes_verified
+        for item, entry in zip(report.items, entries):
+            path = registry.resolve_entry_path(entry)
+            assert item.hash_match
+            assert item.payload_size_bytes == path.stat().st_size
+            assert item.payload_summary and "error" not in item.payload_summary
+
+        data = report.to_dict()
+        assert data["summary"]["plan_items_total"] == len(entries)
+        assert data["items"][0] == report.items[0].to_dict()
+        assert data["items"][0]["hash"]["match"] is True
+        assert json.loads(json.dumps(data)) == data
+
+    def test_report_missing_payload(self, registry: RegistrySnapshot):
+        """A missing payload is reported as unverified, not raised."""
+        import dataclasses
+        from litepub_norm.resolver.report import build_item_report
+
+        entry = dataclasses.replace(
+            registry.get("metric.face.yaw_mae.v1"), uri="metrics/missing.json"
+        )
+        item = self._plan(registry, [entry]).items[0]
+        report = build_item_report(item, registry, ResolutionConfig())
+        assert report.hash_verified is False
+        assert report.hash_match is False
+        assert report.actual_hash is None
+        assert report.payload_size_bytes is None
+
+    def test_report_large_binary(self, registry: RegistrySnapshot, tmp_path):
+        """Large binary payloads are hashed without being read whole."""
+        import dataclasses
+        import hashlib
+        from litepub_norm.resolver.report import build_item_report
+
+        image = tmp_path / "big.png"
+        image.write_bytes(b"\x89PNG" + b"\x00" * (2 << 20))
+        expected = "sha256:" + hashlib.sha256(image.read_bytes()).hexdigest()
+        entry = dataclasses.replace(
+            registry.get("fig.demo.dummy_plot.v1"), uri=str(image), sha256=expected
+        )
+        item = self._plan(registry, [entry]).items[0]
+        report = build_item_report(item, registry, ResolutionConfig())
+        assert report.hash_match
+        assert report.payload_size_bytes == image.stat().st_size
+
+    def test_report_figure_summary(self, registry: RegistrySnapshot):
+        """Figure summaries reuse the hashed size and read the sidecar."""
+        from litepub_norm.resolver.report import build_item_report
+
+        entry = registry.get("fig.demo.dummy_plot.v1")
+        item = self._plan(registry, [entry]).items[0]
+        summary = build_item_report(item, registry, ResolutionConfig()).payload_summary
+        assert summary["image_exists"] is True
+        assert summary["image_format"] == ".png"
+        assert summary["image_size_bytes"] == registry.resolve_entry_path(entry).stat().st_size
+        assert summary["has_caption"] and summary["has_alt"]
+
+    def test_report_json_bytes(self, registry: RegistrySnapshot, monkeypatch):
+        """JSON bytes round-trip to to_dict() with and without orjson."""
+        from litepub_norm.resolver import report as report_module
+
+        entries = list(registry.entries.values())
+        report = report_module.build_resolution_report(
+            self._plan(registry, entries), registry, ResolutionConfig()
+        )
+        fast = report.to_json_bytes()
+        monkeypatch.setattr(report_module, "orjson", None)
+        slow = report.to_json_bytes()
+        assert fast.endswith(b"\n") and slow.endswith(b"\n")
+        assert json.loads(fast) == json.loads(slow) == report.to_dict()
+
+    def test_report_without_hashes(self, registry: RegistrySnapshot):
+        """Pre-flight without hashing still reports sizes and summaries."""
+        from litepub_norm.resolver.report import build_resolution_report
+
+        entries = list(registry.entries.values())
+        report = build_resolution_report(
+            self._plan(registry, entries), registry, ResolutionConfig(), verify_hashes=False
+        )
+        assert not report.all_hashes_verified
+        for item, entry in zip(report.items, entries):
+            assert item.actual_hash is None
+            assert item.hash_verified is False
+            assert item.payload_size_bytes == registry.resolve_entry_path(entry).stat().st_size
+            assert item.payload_summary and "error" not in item.payload_summary
+
+    def test_pandoc_table_summary(self, registry: RegistrySnapshot):
+        """Pandoc table summaries count columns, head rows and body rows."""
+        from litepub_norm.resolver.report import _summarize_pandoc_table_payload
+
+        entry = registry.get("tbl.summary.category_hierarchy.v1")
+        payload = load_table_pandoc_v1(registry, entry, verify=False)
+        _attr, _caption, col_specs, head, bodies, _foot = payload["c"]
+        summary = _summarize_pandoc_table_payload(payload)
+        assert summary == {
+            "num_columns": len(col_specs),
+            "num_head_rows": len(head["c"][1]),
+            "num_body_rows": sum(len(body["c"][3]) for body in bodies),
+        }
+        assert summary["num_body_rows"] > 0
+        assert _summarize_pandoc_table_payload({"t": "Para", "c": []}) == {"type": "Para"}
+
+    def test_report_repeated_artifact(self, registry: RegistrySnapshot, monkeypatch):
+        """An artifact referenced twice is reported once and copied."""
+        from litepub_norm.resolver import report as report_module
+
+        calls = []
+        original = report_module.build_item_report
+
+        def counting(item, *args, **kwargs):
+            calls.append(item.semantic_id)
+            return original(item, *args, **kwargs)
+
+        monkeypatch.setattr(report_module, "build_item_report", counting)
+        entry = registry.get("metric.face.yaw_mae.v1")
+        report = report_module.build_resolution_report(
+            self._plan(registry, [entry, entry]), registry, ResolutionConfig()
+        )
+        assert calls == [entry.id]
+        first, second = report.items
+        assert first.to_dict() == second.to_dict()
+        assert first is not second
+        assert first.payload_summary is not second.payload_summary
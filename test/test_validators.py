@@ -160,6 +160,24 @@ class TestSimpleTableValidator:
             validate_table_simple_v1(payload, "test.table")
         assert exc_info.value.code == "VAL_TABLE_ROW_EXTRA_KEYS"
 
+    def test_row_key_errors_name_the_keys(self):
+        """Extra keys are reported before missing keys, naming the offenders."""
+        payload = {
+            "columns": [{"key": "name"}, {"key": "value"}],
+            "rows": [{"name": "A", "value": 1}, {"name": "B", "other": 2}],
+        }
+        with pytest.raises(ValidationError) as exc_info:
+            validate_table_simple_v1(payload, "test.table")
+        assert exc_info.value.code == "VAL_TABLE_ROW_EXTRA_KEYS"
+        assert "rows[1]" in str(exc_info.value)
+        assert "'other'" in str(exc_info.value)
+
+        payload["rows"][1] = {"name": "B"}
+        with pytest.raises(ValidationError) as exc_info:
+            validate_table_simple_v1(payload, "test.table")
+        assert exc_info.value.code == "VAL_TABLE_ROW_MISSING_KEYS"
+        assert "'value'" in str(exc_info.value)
+
     def test_row_missing_key_fails_strict(self):
         """Row missing key fails in strict mode (Policy S)."""
         payload = {
@@ -307,6 +325,26 @@ class TestPandocTableValidator:
         config = ResolutionConfig()
         validate_table_pandoc_v1(table, "test.table", config)  # Should not raise
 
+    def test_head_and_foot_rows_count_toward_limits(self):
+        """Row and cell limits include TableHead and TableFoot rows."""
+        table = self._make_simple_table([[{"t": "Plain", "c": []}]] * 2)
+        row = table["c"][4][0]["c"][3][0]
+        table["c"][3]["c"][1] = [row]
+        table["c"][5]["c"][1] = [row]
+
+        config = ResolutionConfig(limits=ResolutionLimits(max_table_rows=4))
+        validate_table_pandoc_v1(table, "test.table", config)  # 4 rows: should not raise
+
+        config = ResolutionConfig(limits=ResolutionLimits(max_table_rows=3))
+        with pytest.raises(ValidationError) as exc_info:
+            validate_table_pandoc_v1(table, "test.table", config)
+        assert exc_info.value.code == "VAL_PANDOC_EXCEEDS_MAX_ROWS"
+
+        config = ResolutionConfig(limits=ResolutionLimits(max_table_cells=3))
+        with pytest.raises(ValidationError) as exc_info:
+            validate_table_pandoc_v1(table, "test.table", config)
+        assert exc_info.value.code == "VAL_PANDOC_EXCEEDS_MAX_CELLS"
+
     def test_raw_inline_rejected_safe_mode(self):
         """RawInline is rejected in safe mode."""
         table = self._make_simple_table([[
@@ -479,6 +517,76 @@ class TestPandocWalker:
         assert "Para" in types
         assert "Str" in types
 
+    def test_visits_in_document_order(self):
+        """Walker visits nodes depth-first in document order with their paths."""
+        node = {
+            "t": "Para",
+            "c": [
+                {"t": "Str", "c": "a"},
+                {"t": "Emph", "c": [{"t": "Str", "c": "b"}]},
+                {"t": "Str", "c": "c"},
+            ],
+        }
+        visited = []
+        walk_pandoc(node, lambda n, ctx: visited.append((n.get("c"), ctx.path)), "test")
+        assert [(c, p) for c, p in visited if isinstance(c, str)] == [
+            ("a", "c[0]"),
+            ("b", "c[1].c[0]"),
+            ("c", "c[2]"),
+        ]
+
+    def test_child_extractors_cover_containers(self):
+        """Every node type with nested AST content has a child extractor."""
+        from litepub_norm.validator.pandoc_walk import (
+            BLOCK_TYPES,
+            INLINE_TYPES,
+            TABLE_TYPES,
+            _CHILD_EXTRACTORS,
+        )
+
+        nested = ("Inline", "Block", "Row", "Cell", "Caption", "Table")
+        for types in (BLOCK_TYPES, INLINE_TYPES, TABLE_TYPES):
+            for node_type, structure in types.items():
+                has_children = any(part in field for field in structure for part in nested)
+                assert (node_type in _CHILD_EXTRACTORS) == has_children, node_type
+
+    def test_table_cell_error_path(self):
+        """Errors inside table cells report the full formatted AST path."""
+        cell = {"t": "Cell", "c": [[], {"t": "AlignDefault"}, 1, 1, [
+            {"t": "Plain", "c": [{"t": "RawInline", "c": ["html", "<b>"]}]},
+        ]]}
+        row = {"t": "Row", "c": [[], [cell]]}
+        body = {"t": "TableBody", "c": [[], 0, [], [row]]}
+        payload = {"t": "Table", "c": [
+            ["", [], []],
+            [None, []],
+            [],
+            {"t": "TableHead", "c": [[], []]},
+            [body],
+            {"t": "TableFoot", "c": [[], []]},
+        ]}
+        with pytest.raises(ValidationError) as exc_info:
+            validate_table_pandoc_v1(payload, "test.table")
+        assert exc_info.value.ast_path == "Table.c[4][0].c[3][0].c[1][0].c[4][0].c[0]"
+
+    def test_walk_context_immutable(self):
+        """Callbacks receive an immutable context carrying the semantic ID."""
+        contexts = []
+        walk_pandoc({"t": "Str", "c": "x"}, lambda n, ctx: contexts.append(ctx), "test.id")
+        (ctx,) = contexts
+        assert ctx == WalkContext("test.id", "Str", ctx.context, "", 0)
+        with pytest.raises(AttributeError):
+            ctx.path = "elsewhere"
+
+    def test_nesting_too_deep(self):
+        """Deeply nested content is rejected without exhausting the stack."""
+        node = {"t": "Str", "c": "deep"}
+        for _ in range(2000):
+            node = {"t": "Div", "c": [["", [], []], [node]]}
+        with pytest.raises(ValidationError) as exc_info:
+            walk_pandoc(node, lambda n, ctx: None, "test")
+        assert exc_info.value.code == "VAL_PANDOC_TOO_DEEP"
+
 
 class TestDocumentValidator:
     """Tests for post-resolution document validator."""